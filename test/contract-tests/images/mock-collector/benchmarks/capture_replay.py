@@ -0,0 +1,242 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""Replays the exports of a mock collector capture to an OTLP/gRPC endpoint, and reports the throughput it achieved.
+
+Captures are written by the mock collector when `MOCK_COLLECTOR_CAPTURE_FILE` is set, for instance by contract tests
+run with `MOCK_COLLECTOR_CAPTURE_DIR`, so that realistic payloads can be replayed to size collectors and to benchmark
+ingestion changes. Exports are sent exactly as they were received, unless trace ids or timestamps are rewritten, from
+a single `grpc.aio` event loop over several channels, either at a fixed rate or as fast as the endpoint answers.
+
+Rewriting trace ids gives each pass over the capture its own trace and span ids, consistently across the spans and
+log records of a trace. Rewriting timestamps shifts the times of every export by how long ago it was received.
+
+Run from the mock-collector directory: `python -m benchmarks.capture_replay <capture file> --target 127.0.0.1:4315`
+"""
+import argparse
+import asyncio
+import os
+import time
+from collections import Counter
+from typing import Counter as CounterType
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple, Type
+
+from google.protobuf.message import Message
+from grpc import RpcError, aio
+from mock_collector_capture import CapturedExport, CaptureReader, Signal, count_items
+
+from benchmarks.latency_stats import percentile
+from opentelemetry.proto.collector.logs.v1.logs_service_pb2 import ExportLogsServiceResponse
+from opentelemetry.proto.collector.metrics.v1.metrics_service_pb2 import ExportMetricsServiceResponse
+from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import ExportTraceServiceResponse
+
+_EXPORT_METHODS: Dict[Signal, Tuple[str, Type[Message]]] = {
+    Signal.TRACES: ("/opentelemetry.proto.collector.trace.v1.TraceService/Export", ExportTraceServiceResponse),
+    Signal.METRICS: ("/opentelemetry.proto.collector.metrics.v1.MetricsService/Export", ExportMetricsServiceResponse),
+    Signal.LOGS: ("/opentelemetry.proto.collector.logs.v1.LogsService/Export", ExportLogsServiceResponse),
+}
+_SIGNAL_NAMES: List[str] = [signal.name.lower() for signal in Signal]
+# Names of the items counted in the exports of each signal.
+_ITEM_NAMES: Dict[Signal, str] = {Signal.TRACES: "spans", Signal.METRICS: "data points", Signal.LOGS: "log records"}
+
+
+class _ReplayExport(NamedTuple):
+    signal: Signal
+    data: bytes
+    items: int
+
+
+class _ReplayStats:
+    def __init__(self):
+        self.exports: CounterType[Signal] = Counter()
+        self.items: CounterType[Signal] = Counter()
+        self.failures: int = 0
+        self.latencies: List[float] = []
+
+
+class _Rewriter:
+    """Rewrites the ids and timestamps of the exports of one pass over a capture.
+
+    Ids are XORed with keys drawn for the pass, which maps every id to a new one consistently, without remembering the
+    ids already seen, and keeps empty ids empty.
+    """
+
+    def __init__(self, rewrite_ids: bool, rewrite_timestamps: bool):
+        self._rewrite_ids: bool = rewrite_ids
+        self._rewrite_timestamps: bool = rewrite_timestamps
+        self._trace_id_key: bytes = os.urandom(16)
+        self._span_id_key: bytes = os.urandom(8)
+
+    @property
+    def enabled(self) -> bool:
+        return self._rewrite_ids or self._rewrite_timestamps
+
+    def rewrite(self, export: CapturedExport, request: Message) -> None:
+        shift: int = time.time_ns() - export.received_time_unix_nano if self._rewrite_timestamps else 0
+        if export.signal == Signal.TRACES:
+            for resource_spans in request.resource_spans:
+                for scope_spans in resource_spans.scope_spans:
+                    for span in scope_spans.spans:
+                        self._rewrite_span(span, shift)
+        elif export.signal == Signal.LOGS:
+            for resource_logs in request.resource_logs:
+                for scope_logs in resource_logs.scope_logs:
+                    for log_record in scope_logs.log_records:
+                        log_record.trace_id = self._trace_id(log_record.trace_id)
+                        log_record.span_id = self._span_id(log_record.span_id)
+                        log_record.time_unix_nano = _shift(log_record.time_unix_nano, shift)
+                        log_record.observed_time_unix_nano = _shift(log_record.observed_time_unix_nano, shift)
+        elif shift:
+            for resource_metrics in request.resource_metrics:
+                for scope_metrics in resource_metrics.scope_metrics:
+                    for metric in scope_metrics.metrics:
+                        for data_point in _get_data_points(metric):
+                            data_point.start_time_unix_nano = _shift(data_point.start_time_unix_nano, shift)
+                            data_point.time_unix_nano = _shift(data_point.time_unix_nano, shift)
+
+    def _rewrite_span(self, span: Message, shift: int) -> None:
+        span.trace_id = self._trace_id(span.trace_id)
+        span.span_id = self._span_id(span.span_id)
+        span.parent_span_id = self._span_id(span.parent_span_id)
+        span.start_time_unix_nano = _shift(span.start_time_unix_nano, shift)
+        span.end_time_unix_nano = _shift(span.end_time_unix_nano, shift)
+        for event in span.events:
+            event.time_unix_nano = _shift(event.time_unix_nano, shift)
+        for link in span.links:
+            link.trace_id = self._trace_id(link.trace_id)
+            link.span_id = self._span_id(link.span_id)
+
+    def _trace_id(self, trace_id: bytes) -> bytes:
+        return _xor(trace_id, self._trace_id_key) if self._rewrite_ids else trace_id
+
+    def _span_id(self, span_id: bytes) -> bytes:
+        return _xor(span_id, self._span_id_key) if self._rewrite_ids else span_id
+
+
+def _xor(value: bytes, key: bytes) -> bytes:
+    if len(value) != len(key):
+        return value
+    return (int.from_bytes(value, "big") ^ int.from_bytes(key, "big")).to_bytes(len(key), "big")
+
+
+def _shift(timestamp: int, shift: int) -> int:
+    return timestamp + shift if timestamp else 0
+
+
+def _get_data_points(metric: Message) -> Iterator[Message]:
+    data_field: Optional[str] = metric.WhichOneof("data")
+    if data_field is not None:
+        yield from getattr(metric, data_field).data_points
+
+
+def _read_passes(reader: CaptureReader, args: argparse.Namespace) -> Iterator[_ReplayExport]:
+    # Items are counted on the first pass, which has to parse every export, and reused by the following ones, which
+    # then only parse the exports they rewrite.
+    signals: List[Signal] = [Signal[signal.upper()] for signal in args.signals]
+    item_counts: List[int] = []
+    for _ in range(args.passes):
+        rewriter: _Rewriter = _Rewriter(args.rewrite_trace_ids, args.rewrite_timestamps)
+        index: int = 0
+        for export in reader:
+            if export.signal not in signals:
+                continue
+            data: bytes = export.data
+            if rewriter.enabled or index == len(item_counts):
+                request: Message = export.parse()
+                if index == len(item_counts):
+                    item_counts.append(count_items(export.signal, request))
+                if rewriter.enabled:
+                    rewriter.rewrite(export, request)
+                    data = request.SerializeToString()
+            yield _ReplayExport(export.signal, data, item_counts[index])
+            index += 1
+
+
+async def _send(
+    channel: aio.Channel, queue: "asyncio.Queue[Optional[_ReplayExport]]", timeout: float, stats: _ReplayStats
+) -> None:
+    methods: Dict[Signal, aio.UnaryUnaryMultiCallable] = {
+        signal: channel.unary_unary(method, request_serializer=None, response_deserializer=response_type.FromString)
+        for signal, (method, response_type) in _EXPORT_METHODS.items()
+    }
+    while True:
+        export: Optional[_ReplayExport] = await queue.get()
+        if export is None:
+            return
+        start: float = time.monotonic()
+        try:
+            await methods[export.signal](export.data, timeout=timeout)
+            stats.latencies.append(time.monotonic() - start)
+            stats.exports[export.signal] += 1
+            stats.items[export.signal] += export.items
+        except RpcError:
+            stats.failures += 1
+
+
+async def _replay(args: argparse.Namespace) -> Tuple[_ReplayStats, float]:
+    stats: _ReplayStats = _ReplayStats()
+    channels: List[aio.Channel] = [aio.insecure_channel(args.target) for _ in range(args.channels)]
+    queue: "asyncio.Queue[Optional[_ReplayExport]]" = asyncio.Queue(maxsize=args.concurrency)
+    # Senders are spread over the channels round robin.
+    senders: List[asyncio.Task] = [
+        asyncio.ensure_future(_send(channels[index % len(channels)], queue, args.timeout, stats))
+        for index in range(args.concurrency)
+    ]
+    start: float = time.monotonic()
+    sent: int = 0
+    try:
+        with CaptureReader(args.capture) as reader:
+            for export in _read_passes(reader, args):
+                if args.rate > 0:
+                    # Schedule exports at fixed times rather than fixed intervals, so that the rate does not drift.
+                    delay: float = start + sent / args.rate - time.monotonic()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                await queue.put(export)
+                sent += 1
+                if 0 < args.duration < time.monotonic() - start:
+                    break
+        for _ in senders:
+            await queue.put(None)
+        await asyncio.gather(*senders)
+        elapsed: float = time.monotonic() - start
+    finally:
+        for channel in channels:
+            await channel.close()
+    return stats, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("capture", help="Path of the capture file to replay")
+    parser.add_argument("--target", default="127.0.0.1:4315", help="OTLP/gRPC endpoint, as host:port")
+    parser.add_argument("--rate", type=float, default=0, help="Exports per second, or 0 to send as fast as possible")
+    parser.add_argument("--channels", type=int, default=4)
+    parser.add_argument("--concurrency", type=int, default=32, help="Exports in flight at once, across all channels")
+    parser.add_argument("--passes", type=int, default=1, help="Number of times the capture is replayed")
+    parser.add_argument("--duration", type=float, default=0, help="Stop sending after this many seconds, if not 0")
+    parser.add_argument("--signals", nargs="+", choices=_SIGNAL_NAMES, default=_SIGNAL_NAMES)
+    parser.add_argument("--rewrite-trace-ids", action="store_true", help="Give each pass its own trace and span ids")
+    parser.add_argument("--rewrite-timestamps", action="store_true", help="Shift timestamps to the time of replay")
+    parser.add_argument("--timeout", type=float, default=10.0, help="Seconds after which an export counts as failed")
+    args = parser.parse_args()
+
+    stats, elapsed = asyncio.run(_replay(args))
+
+    exports: int = sum(stats.exports.values())
+    print(f"Replayed {exports} exports in {elapsed:.2f} s, {stats.failures} failed")
+    print(f"{'signal':>8} {'exports':>10} {'exports/s':>10} {'items':>12} {'items/s':>12}")
+    for signal in Signal:
+        if stats.exports[signal]:
+            print(
+                f"{signal.name.lower():>8} {stats.exports[signal]:>10} {stats.exports[signal] / elapsed:>10.0f} "
+                f"{stats.items[signal]:>12} {stats.items[signal] / elapsed:>12.0f}  ({_ITEM_NAMES[signal]})"
+            )
+    print(
+        f"Export latency ms: p50 {percentile(stats.latencies, 50) * 1000:.2f}, "
+        f"p90 {percentile(stats.latencies, 90) * 1000:.2f}, p99 {percentile(stats.latencies, 99) * 1000:.2f}, "
+        f"max {max(stats.latencies, default=float('nan')) * 1000:.2f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
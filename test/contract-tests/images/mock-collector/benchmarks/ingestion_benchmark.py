@@ -0,0 +1,335 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""Measures the ingestion cost of the mock collector, in process and over loopback gRPC.
+
+Every run sends a fixed number of synthetic trace exports, along with one metrics export for every ten of them, split
+across concurrent exporters, and then measures a full `get_traces` and `get_metrics` poll of everything it stored. Runs
+sweep the spans per request, the attributes per span and the number of concurrent exporters, and each of them records:
+* the export throughput, in exports and spans per second, and the p50 and p99 Export latencies of each signal,
+* the growth of the resident set size of the mock collector per million spans stored,
+* the time and response size of the `get_traces` and `get_metrics` polls, against the number of exports stored.
+
+In process, `MockCollectorTraceService.Export` and `MockCollectorMetricsService.Export` are called from a thread per
+exporter, which measures the cost of the collectors alone. Over loopback, a fresh `mock_collector_server.py` is started
+for every run, and exports are sent from a single `grpc.aio` event loop. Memory is more accurately measured over
+loopback, since the process of an in-process run also holds the benchmark, and reuses the memory of previous runs.
+
+Results are written as JSON to `--output`. Passing the results of a previous run as `--baseline` prints how the
+throughput and latencies of every run compare to it.
+
+Run from the mock-collector directory: `python -m benchmarks.ingestion_benchmark --output results.json`
+"""
+import argparse
+import asyncio
+import gc
+import itertools
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import grpc
+from grpc import RpcError, aio
+from mock_collector_logs_service import MockCollectorLogsService
+from mock_collector_metrics_service import MockCollectorMetricsService
+from mock_collector_service import MockCollectorService
+from mock_collector_service_pb2 import GetMetricsRequest, GetTracesRequest
+from mock_collector_trace_service import MockCollectorTraceService
+
+from benchmarks.latency_stats import percentile
+from benchmarks.server_process import get_rss_bytes, start_server, stop_server
+from benchmarks.synthetic_exports import make_metrics_export, make_trace_export
+
+_MODES: Tuple[str, ...] = ("in-process", "loopback")
+# One metrics export is sent for every this many trace exports, as applications export traces much more often.
+_METRICS_EXPORT_INTERVAL: int = 10
+_EXPORT_TIMEOUT_SEC: float = 10.0
+# Comparisons with a baseline flag runs slower than this ratio.
+_REGRESSION_RATIO: float = 1.1
+
+
+class _RunConfig(NamedTuple):
+    mode: str
+    spans_per_request: int
+    attributes_per_span: int
+    exporters: int
+    exports: int
+
+
+class _Payloads(NamedTuple):
+    trace: bytes
+    metrics: bytes
+
+
+class _Ingestion(NamedTuple):
+    elapsed: float
+    trace_latencies: List[float]
+    metrics_latencies: List[float]
+    failures: int
+
+
+def _make_payloads(config: _RunConfig) -> _Payloads:
+    return _Payloads(
+        make_trace_export(config.spans_per_request, config.attributes_per_span).SerializeToString(),
+        make_metrics_export().SerializeToString(),
+    )
+
+
+def _split(total: int, parts: int, index: int) -> int:
+    return total // parts + (1 if index < total % parts else 0)
+
+
+def _export_in_process(
+    trace_collector: MockCollectorTraceService,
+    metrics_collector: MockCollectorMetricsService,
+    payloads: _Payloads,
+    exports: int,
+    ingestion: _Ingestion,
+) -> None:
+    for index in range(exports):
+        # Each export gets its own buffer, as it does when received from gRPC, so that storing it takes memory.
+        trace: bytes = bytes(bytearray(payloads.trace))
+        start: float = time.perf_counter()
+        trace_collector.Export(trace, None)
+        ingestion.trace_latencies.append(time.perf_counter() - start)
+        if index % _METRICS_EXPORT_INTERVAL == 0:
+            metrics: bytes = bytes(bytearray(payloads.metrics))
+            start = time.perf_counter()
+            metrics_collector.Export(metrics, None)
+            ingestion.metrics_latencies.append(time.perf_counter() - start)
+
+
+def _time_call(call: Callable[[], bytes], repeat: int) -> Tuple[float, int]:
+    # The fastest of several calls, along with the size of the serialized response.
+    best: float = float("inf")
+    size: int = 0
+    for _ in range(repeat):
+        start: float = time.perf_counter()
+        size = len(call())
+        best = min(best, time.perf_counter() - start)
+    return best, size
+
+
+def _run_in_process(config: _RunConfig, payloads: _Payloads, poll_repeat: int) -> Dict[str, Any]:
+    trace_collector: MockCollectorTraceService = MockCollectorTraceService()
+    metrics_collector: MockCollectorMetricsService = MockCollectorMetricsService()
+    mock_collector: MockCollectorService = MockCollectorService(
+        trace_collector, metrics_collector, MockCollectorLogsService()
+    )
+    gc.collect()
+    rss_before: float = get_rss_bytes(os.getpid())
+    ingestion: _Ingestion = _Ingestion(0.0, [], [], 0)
+    start: float = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=config.exporters) as executor:
+        for index in range(config.exporters):
+            executor.submit(
+                _export_in_process,
+                trace_collector,
+                metrics_collector,
+                payloads,
+                _split(config.exports, config.exporters, index),
+                ingestion,
+            )
+    ingestion = ingestion._replace(elapsed=time.perf_counter() - start)
+    gc.collect()
+    rss_after: float = get_rss_bytes(os.getpid())
+
+    get_traces: Tuple[float, int] = _time_call(
+        lambda: mock_collector.get_traces(GetTracesRequest(), None), poll_repeat
+    )
+    get_metrics: Tuple[float, int] = _time_call(
+        lambda: mock_collector.get_metrics(GetMetricsRequest(), None), poll_repeat
+    )
+    return _to_result(config, ingestion, rss_after - rss_before, get_traces, get_metrics)
+
+
+async def _export_loopback(
+    trace_export: aio.UnaryUnaryMultiCallable,
+    metrics_export: aio.UnaryUnaryMultiCallable,
+    payloads: _Payloads,
+    exports: int,
+    ingestion: _Ingestion,
+) -> int:
+    failures: int = 0
+    for index in range(exports):
+        calls: List[Tuple[aio.UnaryUnaryMultiCallable, bytes, List[float]]] = [
+            (trace_export, payloads.trace, ingestion.trace_latencies)
+        ]
+        if index % _METRICS_EXPORT_INTERVAL == 0:
+            calls.append((metrics_export, payloads.metrics, ingestion.metrics_latencies))
+        for export, payload, latencies in calls:
+            start: float = time.perf_counter()
+            try:
+                await export(payload, timeout=_EXPORT_TIMEOUT_SEC)
+                latencies.append(time.perf_counter() - start)
+            except RpcError:
+                failures += 1
+    return failures
+
+
+async def _run_loopback(
+    config: _RunConfig, payloads: _Payloads, server: str, port: int, poll_repeat: int
+) -> Dict[str, Any]:
+    process: subprocess.Popen = start_server(server, port)
+    try:
+        rss_before: float = get_rss_bytes(process.pid)
+        ingestion: _Ingestion = _Ingestion(0.0, [], [], 0)
+        async with aio.insecure_channel(f"127.0.0.1:{port}") as channel:
+            # Payloads are sent as they are, without being parsed and serialized again on every export.
+            trace_export: aio.UnaryUnaryMultiCallable = channel.unary_unary(
+                "/opentelemetry.proto.collector.trace.v1.TraceService/Export", request_serializer=None
+            )
+            metrics_export: aio.UnaryUnaryMultiCallable = channel.unary_unary(
+                "/opentelemetry.proto.collector.metrics.v1.MetricsService/Export", request_serializer=None
+            )
+            start: float = time.perf_counter()
+            failures: List[int] = await asyncio.gather(
+                *(
+                    _export_loopback(
+                        trace_export,
+                        metrics_export,
+                        payloads,
+                        _split(config.exports, config.exporters, index),
+                        ingestion,
+                    )
+                    for index in range(config.exporters)
+                )
+            )
+            ingestion = ingestion._replace(elapsed=time.perf_counter() - start, failures=sum(failures))
+        rss_after: float = get_rss_bytes(process.pid)
+
+        # Polls are timed from the caller's side, up to the raw response bytes, without parsing them.
+        with grpc.insecure_channel(f"127.0.0.1:{port}") as blocking_channel:
+            get_traces_raw = blocking_channel.unary_unary(
+                "/MockCollectorService/get_traces",
+                request_serializer=GetTracesRequest.SerializeToString,
+                response_deserializer=None,
+            )
+            get_metrics_raw = blocking_channel.unary_unary(
+                "/MockCollectorService/get_metrics",
+                request_serializer=GetMetricsRequest.SerializeToString,
+                response_deserializer=None,
+            )
+            get_traces: Tuple[float, int] = _time_call(lambda: get_traces_raw(GetTracesRequest()), poll_repeat)
+            get_metrics: Tuple[float, int] = _time_call(lambda: get_metrics_raw(GetMetricsRequest()), poll_repeat)
+    finally:
+        stop_server(process)
+    return _to_result(config, ingestion, rss_after - rss_before, get_traces, get_metrics)
+
+
+def _to_result(
+    config: _RunConfig,
+    ingestion: _Ingestion,
+    rss_growth: float,
+    get_traces: Tuple[float, int],
+    get_metrics: Tuple[float, int],
+) -> Dict[str, Any]:
+    trace_exports: int = len(ingestion.trace_latencies)
+    spans: int = trace_exports * config.spans_per_request
+    return {
+        **config._asdict(),
+        "elapsed_seconds": ingestion.elapsed,
+        "failed_exports": ingestion.failures,
+        "trace_exports_per_second": trace_exports / ingestion.elapsed,
+        "spans_per_second": spans / ingestion.elapsed,
+        "trace_export_p50_ms": percentile(ingestion.trace_latencies, 50) * 1000,
+        "trace_export_p99_ms": percentile(ingestion.trace_latencies, 99) * 1000,
+        "metrics_export_p50_ms": percentile(ingestion.metrics_latencies, 50) * 1000,
+        "metrics_export_p99_ms": percentile(ingestion.metrics_latencies, 99) * 1000,
+        "rss_growth_bytes_per_million_spans": rss_growth / spans * 1_000_000 if spans else float("nan"),
+        "stored_trace_exports": trace_exports,
+        "stored_metrics_exports": len(ingestion.metrics_latencies),
+        "get_traces_ms": get_traces[0] * 1000,
+        "get_traces_response_bytes": get_traces[1],
+        "get_metrics_ms": get_metrics[0] * 1000,
+        "get_metrics_response_bytes": get_metrics[1],
+    }
+
+
+def _run_key(result: Dict[str, Any]) -> Tuple:
+    return tuple(result[field] for field in _RunConfig._fields)
+
+
+def _print_result(result: Dict[str, Any], baseline: Optional[Dict[str, Any]]) -> None:
+    line: str = (
+        f"{result['mode']:>10} {result['spans_per_request']:>6} {result['attributes_per_span']:>6} "
+        f"{result['exporters']:>9} {result['spans_per_second']:>10.0f} {result['trace_export_p50_ms']:>8.3f} "
+        f"{result['trace_export_p99_ms']:>8.3f} {result['rss_growth_bytes_per_million_spans'] / 2**20:>10.1f} "
+        f"{result['get_traces_ms']:>9.2f} {result['get_metrics_ms']:>9.2f}"
+    )
+    if baseline is not None:
+        throughput_ratio: float = baseline["spans_per_second"] / result["spans_per_second"]
+        p99_ratio: float = result["trace_export_p99_ms"] / baseline["trace_export_p99_ms"]
+        regressed: bool = throughput_ratio > _REGRESSION_RATIO or p99_ratio > _REGRESSION_RATIO
+        line += f"  vs baseline: spans/s x{1 / throughput_ratio:.2f}, p99 x{p99_ratio:.2f}"
+        if regressed:
+            line += " REGRESSED"
+    print(line)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--modes", nargs="+", choices=_MODES, default=list(_MODES))
+    parser.add_argument("--spans-per-request", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--attributes-per-span", type=int, nargs="+", default=[8, 32])
+    parser.add_argument("--exporters", type=int, nargs="+", default=[1, 10])
+    parser.add_argument("--exports", type=int, default=2000, help="Trace exports per run, across all exporters")
+    parser.add_argument("--server", choices=("threaded", "aio"), default="threaded", help="Server of loopback runs")
+    parser.add_argument("--port", type=int, default=4399)
+    parser.add_argument("--poll-repeat", type=int, default=5, help="Polls per run, of which the fastest is kept")
+    parser.add_argument("--output", help="File to write the results to, as JSON")
+    parser.add_argument("--baseline", help="Results of a previous run, to compare with")
+    args = parser.parse_args()
+
+    baselines: Dict[Tuple, Dict[str, Any]] = {}
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as baseline_file:
+            baselines = {_run_key(result): result for result in json.load(baseline_file)["results"]}
+
+    print(
+        f"{'mode':>10} {'spans':>6} {'attrs':>6} {'exporters':>9} {'spans/s':>10} {'p50 ms':>8} {'p99 ms':>8} "
+        f"{'MiB/Mspan':>10} {'get_t ms':>9} {'get_m ms':>9}"
+    )
+    results: List[Dict[str, Any]] = []
+    # grpc.aio binds to the first event loop it runs on, so every loopback run shares this one.
+    loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+    try:
+        for mode, spans_per_request, attributes_per_span, exporters in itertools.product(
+            args.modes, args.spans_per_request, args.attributes_per_span, args.exporters
+        ):
+            config: _RunConfig = _RunConfig(mode, spans_per_request, attributes_per_span, exporters, args.exports)
+            payloads: _Payloads = _make_payloads(config)
+            if mode == "in-process":
+                result: Dict[str, Any] = _run_in_process(config, payloads, args.poll_repeat)
+            else:
+                result = loop.run_until_complete(
+                    _run_loopback(config, payloads, args.server, args.port, args.poll_repeat)
+                )
+            results.append(result)
+            _print_result(result, baselines.get(_run_key(result)))
+    finally:
+        loop.close()
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            json.dump(
+                {
+                    "timestamp": time.time(),
+                    "python": sys.version,
+                    "grpc": grpc.__version__,
+                    "platform": platform.platform(),
+                    "cpu_count": os.cpu_count(),
+                    "server": args.server,
+                    "results": results,
+                },
+                output,
+                indent=2,
+            )
+
+
+if __name__ == "__main__":
+    main()
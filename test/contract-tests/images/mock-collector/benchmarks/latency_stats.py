@@ -0,0 +1,12 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""Latency statistics shared by the mock collector benchmarks."""
+import statistics
+from typing import List
+
+
+def percentile(latencies: List[float], percent: int) -> float:
+    """Return the `percent`th percentile of `latencies`, or NaN if there are none."""
+    if len(latencies) < 2:
+        return latencies[0] if latencies else float("nan")
+    return statistics.quantiles(latencies, n=100)[percent - 1]
@@ -0,0 +1,62 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""Compares the cost of a `get_traces` poll against capture size, before and after storing raw export bytes.
+
+"Before" reproduces the previous behaviour: every export is parsed on ingest and re-serialized on every poll.
+"After" drives the current `MockCollectorTraceService` and `MockCollectorService`, which keep the bytes received on
+the wire and write them directly into the serialized `GetTracesResponse`. Both measure the bytes handed to gRPC.
+
+Run from the mock-collector directory: `python -m benchmarks.poll_cost_benchmark`
+"""
+import argparse
+import timeit
+from typing import List
+
+from mock_collector_logs_service import MockCollectorLogsService
+from mock_collector_metrics_service import MockCollectorMetricsService
+from mock_collector_service import MockCollectorService
+from mock_collector_service_pb2 import GetTracesRequest, GetTracesResponse
+from mock_collector_trace_service import MockCollectorTraceService
+
+from benchmarks.synthetic_exports import make_trace_export
+from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import ExportTraceServiceRequest
+
+
+def _before_poll(stored_requests: List[ExportTraceServiceRequest]) -> bytes:
+    traces: List[bytes] = list(map(ExportTraceServiceRequest.SerializeToString, stored_requests))
+    return GetTracesResponse(traces=traces).SerializeToString()
+
+
+def _after_poll(mock_collector: MockCollectorService) -> bytes:
+    return mock_collector.get_traces(GetTracesRequest(), None)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 500, 1000, 2000, 5000])
+    parser.add_argument("--spans-per-request", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    trace_collector: MockCollectorTraceService = MockCollectorTraceService()
+    mock_collector: MockCollectorService = MockCollectorService(
+        trace_collector, MockCollectorMetricsService(), MockCollectorLogsService()
+    )
+    payload: bytes = make_trace_export(args.spans_per_request).SerializeToString()
+
+    print(f"{'exports':>8} {'before ms/poll':>15} {'after ms/poll':>14} {'speedup':>8}")
+    for size in args.sizes:
+        trace_collector.clear_requests()
+        for _ in range(size):
+            trace_collector.Export(payload, None)
+        stored_requests: List[ExportTraceServiceRequest] = [
+            ExportTraceServiceRequest.FromString(payload) for _ in range(size)
+        ]
+
+        before: float = min(timeit.repeat(lambda: _before_poll(stored_requests), number=1, repeat=args.repeat))
+        after: float = min(timeit.repeat(lambda: _after_poll(mock_collector), number=1, repeat=args.repeat))
+        print(f"{size:>8} {before * 1000:>15.3f} {after * 1000:>14.3f} {before / after:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
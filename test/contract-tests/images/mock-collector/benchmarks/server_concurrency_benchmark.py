@@ -0,0 +1,131 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""Compares the threaded and the asyncio mock collector servers under many concurrent exporters and subscribers.
+
+Each server variant is started as its own process with `mock_collector_server.py`. Subscribers first open watch
+streams and wait_for calls that stay pending for the whole run, as contract test clients do while they wait for
+telemetry. Exporters then send trace exports back to back for a fixed duration, and the export throughput and latency
+are measured, including the exports still in flight at the end of the duration. All the calls are made from a single
+`grpc.aio` event loop, so the client side is not limited by threads either.
+
+Run from the mock-collector directory: `python -m benchmarks.server_concurrency_benchmark`
+"""
+import argparse
+import asyncio
+import subprocess
+import time
+from typing import List, Tuple
+
+from grpc import RpcError, aio
+from mock_collector_service_pb2 import ClearRequest, GetTracesRequest, WaitForSpansRequest
+from mock_collector_service_pb2_grpc import MockCollectorServiceStub
+
+from benchmarks.latency_stats import percentile
+from benchmarks.server_process import start_server, stop_server
+from benchmarks.synthetic_exports import make_trace_export
+from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import ExportTraceServiceRequest
+from opentelemetry.proto.collector.trace.v1.trace_service_pb2_grpc import TraceServiceStub
+
+_SERVERS: Tuple[str, ...] = ("threaded", "aio")
+# Name no exported span has, for wait_for calls to stay pending.
+_UNMATCHED_SPAN_NAME: str = "benchmark-unmatched-span"
+# Exports not answered within this time are counted as failed.
+_EXPORT_TIMEOUT_SEC: float = 5.0
+
+
+async def _export_loop(
+    stub: TraceServiceStub, payload: ExportTraceServiceRequest, end_time: float, latencies: List[float]
+) -> int:
+    failures: int = 0
+    while time.monotonic() < end_time:
+        start: float = time.monotonic()
+        try:
+            await stub.Export(payload, timeout=_EXPORT_TIMEOUT_SEC)
+            latencies.append(time.monotonic() - start)
+        except RpcError:
+            failures += 1
+    return failures
+
+
+async def _consume(call: aio.UnaryStreamCall) -> None:
+    async for _ in call:
+        pass
+
+
+async def _run(
+    port: int, exporters: int, subscribers: int, duration: float, spans_per_request: int
+) -> Tuple[int, int, float, List[float]]:
+    payload: ExportTraceServiceRequest = make_trace_export(spans_per_request)
+    async with aio.insecure_channel(f"127.0.0.1:{port}") as channel:
+        mock_collector: MockCollectorServiceStub = MockCollectorServiceStub(channel)
+        await mock_collector.clear(ClearRequest())
+        subscriptions: List[aio.Call] = []
+        watchers: List[asyncio.Task] = []
+        for index in range(subscribers):
+            if index % 2 == 0:
+                watch: aio.UnaryStreamCall = mock_collector.watch_traces(GetTracesRequest())
+                subscriptions.append(watch)
+                watchers.append(asyncio.ensure_future(_consume(watch)))
+            else:
+                request: WaitForSpansRequest = WaitForSpansRequest(
+                    name=_UNMATCHED_SPAN_NAME, timeout_millis=int((duration + _EXPORT_TIMEOUT_SEC + 5) * 1000)
+                )
+                subscriptions.append(mock_collector.wait_for_spans(request))
+        # Let the subscriptions reach the server before exporting.
+        await asyncio.sleep(1)
+
+        trace_service: TraceServiceStub = TraceServiceStub(channel)
+        latencies: List[float] = []
+        start: float = time.monotonic()
+        failures: List[int] = await asyncio.gather(
+            *(_export_loop(trace_service, payload, start + duration, latencies) for _ in range(exporters))
+        )
+        elapsed: float = time.monotonic() - start
+
+        for subscription in subscriptions:
+            subscription.cancel()
+        await asyncio.gather(
+            *watchers, *(subscription.code() for subscription in subscriptions), return_exceptions=True
+        )
+    return len(latencies), sum(failures), elapsed, latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--servers", nargs="+", choices=_SERVERS, default=list(_SERVERS))
+    parser.add_argument("--exporters", type=int, nargs="+", default=[10, 100, 300])
+    parser.add_argument("--subscribers", type=int, nargs="+", default=[0, 20, 200])
+    parser.add_argument("--duration", type=float, default=5.0, help="Seconds of exports per run")
+    parser.add_argument("--spans-per-request", type=int, default=10)
+    parser.add_argument("--port", type=int, default=4399)
+    args = parser.parse_args()
+
+    asyncio.run(_benchmark(args))
+
+
+async def _benchmark(args: argparse.Namespace) -> None:
+    # grpc.aio binds to the first event loop it runs on, so every run shares this one.
+    print(
+        f"{'server':>9} {'exporters':>10} {'subscribers':>12} {'exports/s':>10} {'failed':>7} "
+        f"{'p50 ms':>8} {'p99 ms':>8}"
+    )
+    for server in args.servers:
+        for exporters in args.exporters:
+            for subscribers in args.subscribers:
+                # A fresh server per run, as the threaded one keeps serving cancelled wait_for calls until they
+                # time out.
+                process: subprocess.Popen = start_server(server, args.port)
+                try:
+                    exports, failures, elapsed, latencies = await _run(
+                        args.port, exporters, subscribers, args.duration, args.spans_per_request
+                    )
+                finally:
+                    stop_server(process)
+                print(
+                    f"{server:>9} {exporters:>10} {subscribers:>12} {exports / elapsed:>10.0f} {failures:>7} "
+                    f"{percentile(latencies, 50) * 1000:>8.2f} {percentile(latencies, 99) * 1000:>8.2f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
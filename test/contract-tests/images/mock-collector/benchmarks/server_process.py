@@ -0,0 +1,48 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""Runs `mock_collector_server.py` in a child process for the mock collector benchmarks."""
+import os
+import subprocess
+import sys
+from typing import Dict, Optional
+
+MOCK_COLLECTOR_DIR: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def start_server(server: str, port: int, env: Optional[Dict[str, str]] = None) -> subprocess.Popen:
+    """Start a `server` ("threaded" or "aio") mock collector serving gRPC on `port`, and wait until it is ready."""
+    process: subprocess.Popen = subprocess.Popen(
+        [sys.executable, "-u", "mock_collector_server.py"],
+        cwd=MOCK_COLLECTOR_DIR,
+        env=dict(
+            os.environ,
+            MOCK_COLLECTOR_SERVER=server,
+            MOCK_COLLECTOR_PORT=str(port),
+            MOCK_COLLECTOR_HTTP_PORT=str(port + 1),
+            MOCK_COLLECTOR_TELEMETRY_PORT=str(port + 2),
+            **(env or {}),
+        ),
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    if process.stdout.readline().strip() != "Ready":
+        process.kill()
+        raise RuntimeError(f"The {server} mock collector server failed to start")
+    return process
+
+
+def stop_server(process: subprocess.Popen) -> None:
+    process.terminate()
+    process.wait()
+
+
+def get_rss_bytes(pid: int) -> float:
+    """Return the resident set size of process `pid`, or NaN where /proc is not available."""
+    try:
+        with open(f"/proc/{pid}/status", encoding="utf-8") as status:
+            for line in status:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return float("nan")
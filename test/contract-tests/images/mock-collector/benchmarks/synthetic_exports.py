@@ -0,0 +1,94 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""Builders for synthetic OTLP export requests used by the mock collector benchmarks."""
+import os
+import time
+from typing import List
+
+from opentelemetry.proto.collector.metrics.v1.metrics_service_pb2 import ExportMetricsServiceRequest
+from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import ExportTraceServiceRequest
+from opentelemetry.proto.common.v1.common_pb2 import AnyValue, InstrumentationScope, KeyValue
+from opentelemetry.proto.metrics.v1.metrics_pb2 import (
+    ExponentialHistogram,
+    ExponentialHistogramDataPoint,
+    Metric,
+    ResourceMetrics,
+    ScopeMetrics,
+)
+from opentelemetry.proto.resource.v1.resource_pb2 import Resource
+from opentelemetry.proto.trace.v1.trace_pb2 import ResourceSpans, ScopeSpans, Span
+
+SERVICE_NAME: str = "benchmark-service"
+_OPERATIONS: List[str] = ["GET /success", "GET /error", "GET /fault", "POST /success/postmethod"]
+_REMOTE_SERVICES: List[str] = ["AWS::S3", "AWS::DynamoDB", "AWS::SQS", "AWS::Kinesis"]
+
+
+def _str_attribute(key: str, value: str) -> KeyValue:
+    return KeyValue(key=key, value=AnyValue(string_value=value))
+
+
+def _resource() -> Resource:
+    return Resource(
+        attributes=[
+            _str_attribute("service.name", SERVICE_NAME),
+            _str_attribute("telemetry.sdk.language", "dotnet"),
+            _str_attribute("telemetry.sdk.name", "opentelemetry"),
+        ]
+    )
+
+
+def _scope() -> InstrumentationScope:
+    return InstrumentationScope(name="OpenTelemetry.Instrumentation.AspNetCore", version="1.0.0")
+
+
+def make_span(index: int, attributes_per_span: int = 8) -> Span:
+    start_time: int = time.time_ns()
+    operation: str = _OPERATIONS[index % len(_OPERATIONS)]
+    attributes: List[KeyValue] = [
+        _str_attribute("aws.local.service", SERVICE_NAME),
+        _str_attribute("aws.local.operation", operation),
+        _str_attribute("aws.remote.service", _REMOTE_SERVICES[index % len(_REMOTE_SERVICES)]),
+        _str_attribute("aws.span.kind", "LOCAL_ROOT"),
+    ]
+    for attribute_index in range(len(attributes), attributes_per_span):
+        attributes.append(_str_attribute(f"benchmark.attribute.{attribute_index}", f"value-{index}-{attribute_index}"))
+    return Span(
+        trace_id=os.urandom(16),
+        span_id=os.urandom(8),
+        name=operation,
+        kind=Span.SPAN_KIND_SERVER if index % 2 == 0 else Span.SPAN_KIND_CLIENT,
+        start_time_unix_nano=start_time,
+        end_time_unix_nano=start_time + 1_000_000 + index,
+        attributes=attributes[:attributes_per_span],
+    )
+
+
+def make_trace_export(spans_per_request: int = 10, attributes_per_span: int = 8) -> ExportTraceServiceRequest:
+    spans: List[Span] = [make_span(index, attributes_per_span) for index in range(spans_per_request)]
+    return ExportTraceServiceRequest(
+        resource_spans=[ResourceSpans(resource=_resource(), scope_spans=[ScopeSpans(scope=_scope(), spans=spans)])]
+    )
+
+
+def make_metrics_export(metrics_per_request: int = 3, attributes_per_point: int = 4) -> ExportMetricsServiceRequest:
+    now: int = time.time_ns()
+    metrics: List[Metric] = []
+    for index in range(metrics_per_request):
+        attributes: List[KeyValue] = [
+            _str_attribute(f"benchmark.attribute.{attribute_index}", f"value-{attribute_index}")
+            for attribute_index in range(attributes_per_point)
+        ]
+        data_point: ExponentialHistogramDataPoint = ExponentialHistogramDataPoint(
+            attributes=attributes, start_time_unix_nano=now, time_unix_nano=now, count=1, sum=float(index)
+        )
+        metrics.append(
+            Metric(
+                name=f"benchmark.metric.{index}",
+                exponential_histogram=ExponentialHistogram(data_points=[data_point]),
+            )
+        )
+    return ExportMetricsServiceRequest(
+        resource_metrics=[
+            ResourceMetrics(resource=_resource(), scope_metrics=[ScopeMetrics(scope=_scope(), metrics=metrics)])
+        ]
+    )
@@ -0,0 +1,164 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""Append-only capture file of the exports received by the mock collector, and a memory-mapped reader for it.
+
+A capture file starts with `CAPTURE_MAGIC`, followed by one record per export, in the order they were received:
+
+    signal           1 byte, a `Signal` value
+    received_time    8 bytes, little-endian unsigned, in nanoseconds since the Unix epoch
+    length           4 bytes, little-endian unsigned
+    data             `length` bytes, the export request exactly as it was received
+
+Run `python mock_collector_capture.py <capture file>` to summarize a capture.
+"""
+import argparse
+import mmap
+import os
+import struct
+from collections import Counter
+from enum import IntEnum
+from threading import Lock
+from time import time_ns
+from typing import BinaryIO
+from typing import Counter as CounterType
+from typing import Dict, Iterator, NamedTuple, Optional, Type
+
+from google.protobuf.message import Message
+
+from opentelemetry.proto.collector.logs.v1.logs_service_pb2 import ExportLogsServiceRequest
+from opentelemetry.proto.collector.metrics.v1.metrics_service_pb2 import ExportMetricsServiceRequest
+from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import ExportTraceServiceRequest
+
+CAPTURE_MAGIC: bytes = b"MCCAPT01"
+_RECORD_HEADER: struct.Struct = struct.Struct("<BQI")
+
+
+class Signal(IntEnum):
+    TRACES = 1
+    METRICS = 2
+    LOGS = 3
+
+
+# Export request message of each signal.
+REQUEST_TYPES: Dict[Signal, Type[Message]] = {
+    Signal.TRACES: ExportTraceServiceRequest,
+    Signal.METRICS: ExportMetricsServiceRequest,
+    Signal.LOGS: ExportLogsServiceRequest,
+}
+
+
+def count_items(signal: Signal, request: Message) -> int:
+    """Return the number of spans, metric data points or log records of export request `request` of `signal`."""
+    if signal == Signal.TRACES:
+        return sum(len(scope.spans) for resource in request.resource_spans for scope in resource.scope_spans)
+    if signal == Signal.LOGS:
+        return sum(len(scope.log_records) for resource in request.resource_logs for scope in resource.scope_logs)
+    count: int = 0
+    for resource in request.resource_metrics:
+        for scope in resource.scope_metrics:
+            for metric in scope.metrics:
+                data_field: Optional[str] = metric.WhichOneof("data")
+                if data_field is not None:
+                    count += len(getattr(metric, data_field).data_points)
+    return count
+
+
+class CapturedExport(NamedTuple):
+    signal: Signal
+    received_time_unix_nano: int
+    data: bytes
+
+    def parse(self) -> Message:
+        request_type: Type[Message] = REQUEST_TYPES[self.signal]
+        return request_type.FromString(self.data)
+
+
+class CaptureWriter:
+    """Appends every export it is given to a capture file, shared by the collectors of all signals.
+
+    Each record is written with a single unbuffered system call, so the capture holds every export received up to the
+    moment the mock collector is stopped, even if it is killed, and other processes can read it while it grows.
+    Appending to an existing capture continues it.
+    """
+
+    def __init__(self, path: str):
+        self._lock: Lock = Lock()
+        self._file: BinaryIO = open(path, "ab", buffering=0)  # pylint: disable=consider-using-with
+        if self._file.tell() == 0:
+            self._file.write(CAPTURE_MAGIC)
+
+    def write(self, signal: Signal, data: bytes) -> None:
+        header: bytes = _RECORD_HEADER.pack(signal, time_ns(), len(data))
+        with self._lock:
+            os.writev(self._file.fileno(), (header, data))
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+class CaptureReader:
+    """Iterates the exports of a capture file through a memory map, so that captures larger than the available memory
+    can be read. Only the exports being iterated over are copied out of the map.
+
+    A record cut short at the end of the file, by a mock collector stopped while writing it, ends the iteration.
+    """
+
+    def __init__(self, path: str):
+        self._file: BinaryIO = open(path, "rb")  # pylint: disable=consider-using-with
+        self._map: Optional[mmap.mmap] = None
+        if os.fstat(self._file.fileno()).st_size > 0:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._map is None or self._map[: len(CAPTURE_MAGIC)] != CAPTURE_MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a mock collector capture file")
+
+    def __enter__(self) -> "CaptureReader":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __iter__(self) -> Iterator[CapturedExport]:
+        capture: mmap.mmap = self._map
+        offset: int = len(CAPTURE_MAGIC)
+        size: int = len(capture)
+        while offset + _RECORD_HEADER.size <= size:
+            signal, received_time, length = _RECORD_HEADER.unpack_from(capture, offset)
+            offset += _RECORD_HEADER.size
+            if offset + length > size:
+                return
+            yield CapturedExport(Signal(signal), received_time, capture[offset : offset + length])
+            offset += length
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+        self._file.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("capture", help="Path of the capture file")
+    args = parser.parse_args()
+
+    exports: CounterType[Signal] = Counter()
+    sizes: CounterType[Signal] = Counter()
+    first_time: Optional[int] = None
+    last_time: Optional[int] = None
+    with CaptureReader(args.capture) as reader:
+        for export in reader:
+            exports[export.signal] += 1
+            sizes[export.signal] += len(export.data)
+            first_time = export.received_time_unix_nano if first_time is None else first_time
+            last_time = export.received_time_unix_nano
+
+    print(f"{'signal':>8} {'exports':>10} {'bytes':>14}")
+    for signal in Signal:
+        print(f"{signal.name.lower():>8} {exports[signal]:>10} {sizes[signal]:>14}")
+    if first_time is not None:
+        print(f"Received over {(last_time - first_time) / 1e9:.3f} s")
+
+
+if __name__ == "__main__":
+    main()
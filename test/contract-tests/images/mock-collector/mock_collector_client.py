@@ -1,145 +1,1030 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 # SPDX-License-Identifier: Apache-2.0
-from datetime import datetime, timedelta
+import asyncio
+from contextlib import contextmanager
+from datetime import timedelta
 from logging import Logger, getLogger
-from time import sleep
-from typing import Callable, List, Set, TypeVar
+from itertools import chain
+from threading import Condition, Lock, Thread
+from time import monotonic, sleep
+from typing import (
+    AsyncIterator,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+)
 
 from google.protobuf.internal.containers import RepeatedScalarFieldContainer
-from grpc import Channel, insecure_channel
+from google.protobuf.message import Message
+from grpc import Channel, RpcError, aio, insecure_channel
+from mock_collector_columns import MetricPointColumns, SpanColumns, metrics_to_columns, spans_to_columns
+from mock_collector_interning import (
+    ResourceScopeInterner,
+    create_log_record_interner,
+    create_metric_interner,
+    create_span_interner,
+    should_compact,
+)
+from mock_collector_query import MetricQuery, SpanQuery, query_metrics, query_spans
 from mock_collector_service_pb2 import (
     ClearRequest,
+    ClearResponse,
+    ConfigureFaultsRequest,
+    FaultConfig,
+    GetDuplicateSpanStatsRequest,
+    GetDuplicateSpanStatsResponse,
+    GetFaultStatsRequest,
+    GetFaultStatsResponse,
+    GetLogsRequest,
     GetMetricsRequest,
-    GetMetricsResponse,
+    GetSoakStatsRequest,
+    GetSoakStatsResponse,
+    GetStorageStatsRequest,
+    GetStorageStatsResponse,
     GetTracesRequest,
-    GetTracesResponse,
+    GetTraceTreeRequest,
+    GetTraceTreeResponse,
+    GetWireStatsRequest,
+    GetWireStatsResponse,
+    QueryLogsRequest,
+    QueryLogsResponse,
+    QuerySpansRequest,
+    QuerySpansResponse,
+    WaitForMetricsRequest,
+    WaitForMetricsResponse,
+    WaitForSpansRequest,
+    WaitForSpansResponse,
 )
 from mock_collector_service_pb2_grpc import MockCollectorServiceStub
 
+from opentelemetry.proto.collector.logs.v1.logs_service_pb2 import ExportLogsServiceRequest
 from opentelemetry.proto.collector.metrics.v1.metrics_service_pb2 import ExportMetricsServiceRequest
 from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import ExportTraceServiceRequest
+from opentelemetry.proto.logs.v1.logs_pb2 import LogRecord, ResourceLogs, ScopeLogs
 from opentelemetry.proto.metrics.v1.metrics_pb2 import Metric, ResourceMetrics, ScopeMetrics
 from opentelemetry.proto.trace.v1.trace_pb2 import ResourceSpans, ScopeSpans, Span
 
 _logger: Logger = getLogger(__name__)
 _TIMEOUT_DELAY: timedelta = timedelta(seconds=20)
 _WAIT_INTERVAL_SEC: float = 0.1
+# Extra time given to wait_for rpcs beyond their timeout, for the collector to send back what it has received.
+_RPC_TIMEOUT_MARGIN: timedelta = timedelta(seconds=5)
 T: TypeVar = TypeVar("T")
+Q: TypeVar = TypeVar("Q")
+
+
+class _ResourceScopeRecord:
+    """Telemetry item along with its resource and scope, with `__slots__` rather than a `__dict__` per instance, since a
+    large capture holds hundreds of thousands of them. Unpacks into its resource, scope and item, in that order.
+    """
+
+    __slots__ = ()
 
+    def __iter__(self) -> Iterator[Message]:
+        return (getattr(self, name) for name in self.__slots__)
 
-class ResourceScopeSpan:
+
+class ResourceScopeSpan(_ResourceScopeRecord):
     """Data class used to correlate resources, scope and telemetry signals.
 
     Correlate resource, scope and span
     """
 
+    __slots__ = ("resource_spans", "scope_spans", "span")
+
     def __init__(self, resource_spans: ResourceSpans, scope_spans: ScopeSpans, span: Span):
         self.resource_spans: ResourceSpans = resource_spans
         self.scope_spans: ScopeSpans = scope_spans
         self.span: Span = span
 
 
-class ResourceScopeMetric:
+class ResourceScopeMetric(_ResourceScopeRecord):
     """Data class used to correlate resources, scope and telemetry signals.
 
     Correlate resource, scope and metric
     """
 
+    __slots__ = ("resource_metrics", "scope_metrics", "metric")
+
     def __init__(self, resource_metrics: ResourceMetrics, scope_metrics: ScopeMetrics, metric: Metric):
         self.resource_metrics: ResourceMetrics = resource_metrics
         self.scope_metrics: ScopeMetrics = scope_metrics
         self.metric: Metric = metric
 
 
+class ResourceScopeLog(_ResourceScopeRecord):
+    """Data class used to correlate resources, scope and telemetry signals.
+
+    Correlate resource, scope and log record
+    """
+
+    __slots__ = ("resource_logs", "scope_logs", "log_record")
+
+    def __init__(self, resource_logs: ResourceLogs, scope_logs: ScopeLogs, log_record: LogRecord):
+        self.resource_logs: ResourceLogs = resource_logs
+        self.scope_logs: ScopeLogs = scope_logs
+        self.log_record: LogRecord = log_record
+
+
+class WaitStrategy(NamedTuple):
+    """How `MockCollectorClient` waits for telemetry to settle before returning it.
+
+    Telemetry has settled once the mock collector has received nothing new for `quiescence`, as measured by the receive
+    times of the mock collector rather than by when the client got the exports, so that delays between the two do not
+    cut a burst of exports short. Exports are pushed to the client as they are received, and the wait is re-checked
+    every time they arrive, and otherwise at intervals backing off from `initial_poll_interval` by `backoff_factor` up
+    to `max_poll_interval`, or as soon as the quiescence window would elapse. Calls fail once `timeout` elapses, unless
+    they are given their own timeout.
+    """
+
+    timeout: timedelta = _TIMEOUT_DELAY
+    quiescence: timedelta = timedelta(milliseconds=100)
+    initial_poll_interval: timedelta = timedelta(milliseconds=10)
+    max_poll_interval: timedelta = timedelta(milliseconds=500)
+    backoff_factor: float = 2.0
+
+
+class _CachedExport(NamedTuple):
+    records: List[_ResourceScopeRecord]
+    received_time_unix_nano: int
+
+
+class _ExportCache(Generic[T]):
+    """Exports of one signal decoded so far, kept in sync with the mock collector through its cursors.
+
+    The cache holds the exports with sequence numbers in (start_cursor, cursor]. Each update only carries the exports
+    received after `cursor`, so every export is fetched and decoded once. Every change increments `version` and wakes
+    up the threads waiting for it.
+
+    Exports are kept as the records of their items, like `ResourceScopeSpan`, built once when the export is received.
+    Items are interned along with a single shared copy of each distinct resource and scope, so that the items of a
+    large capture do not each keep their whole export alive.
+    """
+
+    def __init__(
+        self,
+        request_type: Type[T],
+        create_interner: Callable[[], ResourceScopeInterner],
+        record_type: Type[_ResourceScopeRecord],
+    ):
+        self._request_type: Type[T] = request_type
+        self._record_type: Type[_ResourceScopeRecord] = record_type
+        self._create_interner: Callable[[], ResourceScopeInterner] = create_interner
+        self._interner: ResourceScopeInterner = create_interner()
+        self._condition: Condition = Condition()
+        self._exports: List[_CachedExport] = []
+        self._item_count: int = 0
+        self._start_cursor: int = 0
+        # Time of the mock collector in the last update, and when it was received, to tell its current time.
+        self._server_time_unix_nano: int = 0
+        self._server_time_monotonic: float = 0.0
+        self._listeners: List[Callable[[], None]] = []
+        # Error that stopped the cache from being kept in sync, raised by the waits instead of letting them time out.
+        self.error: Optional[Exception] = None
+        self.cursor: int = 0
+        self.version: int = 0
+
+    def snapshot(self) -> Tuple[int, List[_CachedExport]]:
+        with self._condition:
+            return self.version, list(self._exports)
+
+    def get_server_time_unix_nano(self) -> int:
+        """Return the current time of the mock collector, as of the last update, or 0 before the first update.
+
+        Network delays make it fall behind, which only makes telemetry look more recent than it is.
+        """
+        with self._condition:
+            if not self._server_time_unix_nano:
+                return 0
+            return self._server_time_unix_nano + int((monotonic() - self._server_time_monotonic) * 1e9)
+
+    def update(
+        self,
+        exports: Sequence[bytes],
+        received_times_unix_nano: Sequence[int],
+        start_cursor: int,
+        next_cursor: int,
+        server_time_unix_nano: int,
+    ) -> None:
+        with self._condition:
+            self._discard_through(start_cursor)
+            # Responses carry consecutive exports ending at next_cursor. Skip the ones that are already cached, or that
+            # were cleared while the response was in flight.
+            first_sequence_number: int = next_cursor - len(exports) + 1
+            skipped: int = max(0, self.cursor + 1 - first_sequence_number)
+            for export, received_time in zip(exports[skipped:], received_times_unix_nano[skipped:]):
+                records: List[_ResourceScopeRecord] = [
+                    self._record_type(*interned)
+                    for interned in self._interner.intern(self._request_type.FromString(export))
+                ]
+                self._exports.append(_CachedExport(records, received_time))
+                self._item_count += len(records)
+            self.cursor = max(self.cursor, next_cursor)
+            self._server_time_unix_nano = server_time_unix_nano
+            self._server_time_monotonic = monotonic()
+            self._changed()
+
+    def discard_through(self, cursor: int) -> None:
+        with self._condition:
+            self._discard_through(cursor)
+            self._changed()
+
+    def fail(self, error: Exception) -> None:
+        """Record that the cache can no longer be kept in sync, and wake up the waits so that they raise `error`."""
+        with self._condition:
+            self.error = error
+            self._changed()
+
+    def wait_for_change(self, version: int, timeout: float) -> bool:
+        """Wait until the cache changes from `version`, and return whether it did before `timeout` elapsed."""
+        with self._condition:
+            return self._condition.wait_for(lambda: self.version != version, timeout=timeout)
+
+    @contextmanager
+    def change_listener(self, listener: Callable[[], None]) -> Iterator[None]:
+        """Call `listener` whenever the cache changes, until the end of the `with` block."""
+        with self._condition:
+            self._listeners.append(listener)
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._listeners.remove(listener)
+
+    def _discard_through(self, cursor: int) -> None:
+        if cursor <= self._start_cursor:
+            return
+        # Exports are cached in cursor order, so the ones at or before `cursor` are at the front.
+        discarded: int = min(cursor, self.cursor) - self._start_cursor
+        self._item_count -= sum(len(export.records) for export in self._exports[:discarded])
+        del self._exports[:discarded]
+        self._start_cursor = cursor
+        self.cursor = max(self.cursor, cursor)
+        # Shared containers keep the discarded items, which are only freed along with the interner.
+        if not self._exports:
+            self._interner = self._create_interner()
+        elif should_compact(self._interner, self._item_count):
+            interner: ResourceScopeInterner = self._create_interner()
+            self._exports = [
+                _CachedExport(
+                    [self._record_type(*interned) for interned in interner.reintern(export.records)],
+                    export.received_time_unix_nano,
+                )
+                for export in self._exports
+            ]
+            self._interner = interner
+
+    def _changed(self) -> None:
+        self.version += 1
+        self._condition.notify_all()
+        for listener in self._listeners:
+            try:
+                listener()
+            except Exception:  # pylint: disable=broad-exception-caught
+                _logger.exception("Export cache change listener failed")
+
+
+class _ExportWatcher(Generic[T]):
+    """Feeds an `_ExportCache` from a watch stream of the mock collector, consumed in a background thread.
+
+    The stream is opened on the first call to `start`, and re-opened from the cache cursor if it is interrupted.
+    """
+
+    def __init__(
+        self,
+        watch: Callable[[Message], Iterator[Message]],
+        request_type: Type[Message],
+        exports_field: str,
+        cache: _ExportCache[T],
+    ):
+        self._watch: Callable[[Message], Iterator[Message]] = watch
+        self._request_type: Type[Message] = request_type
+        self._exports_field: str = exports_field
+        self._cache: _ExportCache[T] = cache
+        self._lock: Lock = Lock()
+        self._thread: Optional[Thread] = None
+        self._call: Optional[Iterator[Message]] = None
+        self._closed: bool = False
+
+    def start(self) -> None:
+        with self._lock:
+            if self._thread is None and not self._closed:
+                self._thread = Thread(target=self._run, name=f"watch-{self._exports_field}", daemon=True)
+                self._thread.start()
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            if self._call is not None:
+                self._call.cancel()
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                if self._closed:
+                    return
+                self._call = self._watch(self._request_type(since=self._cache.cursor))
+            try:
+                for response in self._call:
+                    exports: RepeatedScalarFieldContainer[bytes] = getattr(response, self._exports_field)
+                    self._cache.update(
+                        exports,
+                        response.received_times_unix_nano,
+                        response.start_cursor,
+                        response.next_cursor,
+                        response.server_time_unix_nano,
+                    )
+            except RpcError as error:
+                if self._closed:
+                    return
+                _logger.warning("Watch stream for %s interrupted: %s", self._exports_field, error)
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                # Re-opening the stream would fetch the same exports again, so the waits raise the error instead.
+                _logger.exception("Watch stream for %s failed", self._exports_field)
+                self._call.cancel()
+                self._cache.fail(error)
+                return
+            sleep(_WAIT_INTERVAL_SEC)
+
+
+class _AsyncExportWatcher(Generic[T]):
+    """Variant of `_ExportWatcher` consuming the watch stream of a `grpc.aio` channel in a task of the event loop."""
+
+    def __init__(
+        self,
+        watch: Callable[[Message], AsyncIterator[Message]],
+        request_type: Type[Message],
+        exports_field: str,
+        cache: _ExportCache[T],
+    ):
+        self._watch: Callable[[Message], AsyncIterator[Message]] = watch
+        self._request_type: Type[Message] = request_type
+        self._exports_field: str = exports_field
+        self._cache: _ExportCache[T] = cache
+        self._task: Optional[asyncio.Task] = None
+        self._closed: bool = False
+
+    def start(self) -> None:
+        if self._task is None and not self._closed:
+            self._task = asyncio.get_running_loop().create_task(self._run(), name=f"watch-{self._exports_field}")
+
+    async def close(self) -> None:
+        self._closed = True
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def _run(self) -> None:
+        while not self._closed:
+            call: AsyncIterator[Message] = self._watch(self._request_type(since=self._cache.cursor))
+            try:
+                async for response in call:
+                    exports: RepeatedScalarFieldContainer[bytes] = getattr(response, self._exports_field)
+                    self._cache.update(
+                        exports,
+                        response.received_times_unix_nano,
+                        response.start_cursor,
+                        response.next_cursor,
+                        response.server_time_unix_nano,
+                    )
+            except aio.AioRpcError as error:
+                _logger.warning("Watch stream for %s interrupted: %s", self._exports_field, error)
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                _logger.exception("Watch stream for %s failed", self._exports_field)
+                self._cache.fail(error)
+                return
+            finally:
+                call.cancel()
+            await asyncio.sleep(_WAIT_INTERVAL_SEC)
+
+
+class _IndexedSnapshot(Generic[Q]):
+    """Query over the records of the last snapshot of cached exports it was given, only rebuilt when they change."""
+
+    def __init__(self, build_query: Callable[[Iterator[_ResourceScopeRecord]], Q]):
+        self._build_query: Callable[[Iterator[_ResourceScopeRecord]], Q] = build_query
+        self._exports: List[_CachedExport] = []
+        self._query: Optional[Q] = None
+
+    def get_query(self, exports: List[_CachedExport]) -> Q:
+        if self._query is None or not _is_same_snapshot(self._exports, exports):
+            self._query = self._build_query(_get_records(exports))
+            self._exports = exports
+        return self._query
+
+
 class MockCollectorClient:
-    """The mock collector client is used to interact with the Mock collector image, used in the tests."""
+    """The mock collector client is used to interact with the Mock collector image, used in the tests.
+
+    Exports are pushed to the client by the watch streams of the mock collector as soon as they are received, instead
+    of being polled for.
+    """
 
-    def __init__(self, mock_collector_address: str, mock_collector_port: str):
-        channel: Channel = insecure_channel(f"{mock_collector_address}:{mock_collector_port}")
-        self.client: MockCollectorServiceStub = MockCollectorServiceStub(channel)
+    def __init__(
+        self, mock_collector_address: str, mock_collector_port: str, wait_strategy: Optional[WaitStrategy] = None
+    ):
+        self._channel: Channel = insecure_channel(f"{mock_collector_address}:{mock_collector_port}")
+        self._wait_strategy: WaitStrategy = wait_strategy or WaitStrategy()
+        self.client: MockCollectorServiceStub = MockCollectorServiceStub(self._channel)
+        self._trace_cache: _ExportCache[ExportTraceServiceRequest] = _ExportCache(
+            ExportTraceServiceRequest, create_span_interner, ResourceScopeSpan
+        )
+        self._metrics_cache: _ExportCache[ExportMetricsServiceRequest] = _ExportCache(
+            ExportMetricsServiceRequest, create_metric_interner, ResourceScopeMetric
+        )
+        self._logs_cache: _ExportCache[ExportLogsServiceRequest] = _ExportCache(
+            ExportLogsServiceRequest, create_log_record_interner, ResourceScopeLog
+        )
+        self._trace_watcher: _ExportWatcher[ExportTraceServiceRequest] = _ExportWatcher(
+            self.client.watch_traces, GetTracesRequest, "traces", self._trace_cache
+        )
+        self._metrics_watcher: _ExportWatcher[ExportMetricsServiceRequest] = _ExportWatcher(
+            self.client.watch_metrics, GetMetricsRequest, "metrics", self._metrics_cache
+        )
+        self._logs_watcher: _ExportWatcher[ExportLogsServiceRequest] = _ExportWatcher(
+            self.client.watch_logs, GetLogsRequest, "logs", self._logs_cache
+        )
+        self._span_snapshot: _IndexedSnapshot[SpanQuery[ResourceScopeSpan]] = _IndexedSnapshot(query_spans)
+        self._metric_snapshot: _IndexedSnapshot[MetricQuery[ResourceScopeMetric]] = _IndexedSnapshot(query_metrics)
 
     def clear_signals(self) -> None:
         """Clear all the signals in the backend collector"""
-        self.client.clear(ClearRequest())
+        response: ClearResponse = self.client.clear(ClearRequest())
+        self._trace_cache.discard_through(response.traces_cursor)
+        self._metrics_cache.discard_through(response.metrics_cursor)
+        self._logs_cache.discard_through(response.logs_cursor)
+
+    def close(self) -> None:
+        """Stop watching the backend collector and close the connection to it"""
+        self._trace_watcher.close()
+        self._metrics_watcher.close()
+        self._logs_watcher.close()
+        self._channel.close()
 
-    def get_traces(self) -> List[ResourceScopeSpan]:
-        """Get all traces that are currently stored in the collector
+    def get_traces(self, timeout: Optional[timedelta] = None) -> List[ResourceScopeSpan]:
+        """Get all traces that are currently stored in the collector, once they have settled according to the wait
+        strategy of the client, or within `timeout` if it is given.
 
         Returns:
             List of `ResourceScopeSpan` which is essentially a flat list containing all the spans and their related
             scope and resources.
         """
+        return list(self.iter_traces(timeout))
+
+    def iter_traces(self, timeout: Optional[timedelta] = None) -> Iterator[ResourceScopeSpan]:
+        """Like `get_traces`, but iterate over the spans rather than copying them into a new list."""
+        return _get_records(self._wait_for_traces(timeout))
+
+    def get_span_columns(self, attribute_keys: Iterable[str] = (), timeout: Optional[timedelta] = None) -> SpanColumns:
+        """Get all spans that are currently stored in the collector, as columns rather than a list of objects, once
+        they have settled like for `get_traces`.
+
+        Returns:
+            `SpanColumns` holding the timing, kind, status, name and service of every span, along with a column for
+            each of the given span attributes.
+        """
+        return spans_to_columns(self.iter_traces(timeout), attribute_keys)
+
+    def spans(self, timeout: Optional[timedelta] = None) -> SpanQuery[ResourceScopeSpan]:
+        """Get all spans that are currently stored in the collector, once they have settled like for `get_traces`, as
+        a query to select spans from, like `spans().kind(Span.SPAN_KIND_SERVER).attr("aws.local.operation", "GET /")`.
+
+        The spans are indexed once per snapshot: as long as no export is received, every call returns the same query.
+        """
+        return self._span_snapshot.get_query(self._wait_for_traces(timeout))
 
-        def get_export() -> List[ExportTraceServiceRequest]:
-            response: GetTracesResponse = self.client.get_traces(GetTracesRequest())
-            serialized_traces: RepeatedScalarFieldContainer[bytes] = response.traces
-            return list(map(ExportTraceServiceRequest.FromString, serialized_traces))
+    def wait_for_spans(
+        self,
+        name: str = "",
+        kind: int = Span.SPAN_KIND_UNSPECIFIED,
+        attributes: Optional[Dict[str, str]] = None,
+        min_count: int = 1,
+        timeout: timedelta = _TIMEOUT_DELAY,
+    ) -> List[ResourceScopeSpan]:
+        """Wait until the collector has received `min_count` spans matching the given criteria.
 
-        def wait_condition(exported: List[ExportTraceServiceRequest], current: List[ExportTraceServiceRequest]) -> bool:
-            return 0 < len(exported) == len(current)
+        The criteria are evaluated by the collector as spans are received, and only the matching spans are returned.
+        Criteria left empty match any span.
 
-        exported_traces: List[ExportTraceServiceRequest] = _wait_for_content(get_export, wait_condition)
-        spans: List[ResourceScopeSpan] = []
-        for exported_trace in exported_traces:
-            for resource_span in exported_trace.resource_spans:
-                for scope_span in resource_span.scope_spans:
-                    for span in scope_span.spans:
-                        spans.append(ResourceScopeSpan(resource_span, scope_span, span))
-        return spans
+        Returns:
+            List of `ResourceScopeSpan` holding the matching spans and their related scope and resources.
+        """
+        request: WaitForSpansRequest = WaitForSpansRequest(
+            name=name,
+            kind=kind,
+            attributes=attributes,
+            min_count=min_count,
+            timeout_millis=int(timeout.total_seconds() * 1000),
+        )
+        response: WaitForSpansResponse = self.client.wait_for_spans(
+            request, timeout=(timeout + _RPC_TIMEOUT_MARGIN).total_seconds()
+        )
+        if not response.satisfied:
+            raise RuntimeError(f"Timeout waiting for {min_count} spans matching {request}")
+        return _flatten_spans(map(ExportTraceServiceRequest.FromString, response.traces))
+
+    def query_spans(
+        self,
+        trace_id: bytes = b"",
+        span_id: bytes = b"",
+        name: str = "",
+        kind: int = Span.SPAN_KIND_UNSPECIFIED,
+        attributes: Optional[Dict[str, str]] = None,
+        limit: int = 0,
+    ) -> List[ResourceScopeSpan]:
+        """Get the spans currently stored in the collector that match the given criteria, without waiting.
+
+        The collector looks the spans up through its indexes, and only the matching spans are returned. Criteria left
+        empty match any span.
+
+        Returns:
+            List of `ResourceScopeSpan` holding the matching spans and their related scope and resources.
+        """
+        request: QuerySpansRequest = QuerySpansRequest(
+            trace_id=trace_id, span_id=span_id, name=name, kind=kind, attributes=attributes, limit=limit
+        )
+        response: QuerySpansResponse = self.client.query_spans(request)
+        return _flatten_spans(map(ExportTraceServiceRequest.FromString, response.traces))
 
-    def get_metrics(self, present_metrics: Set[str], exact_match=True) -> List[ResourceScopeMetric]:
-        """Get all metrics that are currently stored in the mock collector.
+    def get_trace_tree(self, trace_id: bytes) -> GetTraceTreeResponse:
+        """Get the spans of trace `trace_id` currently stored in the collector, assembled into a tree by the collector.
+
+        Returns:
+            The nodes of the tree, in tree order, with the self time and critical path time of each span but without
+            the spans themselves, and the critical path of the trace. The nodes are empty if no span of the trace is
+            stored.
+        """
+        return self.client.get_trace_tree(GetTraceTreeRequest(trace_id=trace_id))
+
+    def get_logs(self, timeout: Optional[timedelta] = None) -> List[ResourceScopeLog]:
+        """Get all logs that are currently stored in the collector, once they have settled according to the wait
+        strategy of the client, or within `timeout` if it is given.
+
+        Returns:
+            List of `ResourceScopeLog` which is a flat list containing all the log records and their related scope and
+            resources.
+        """
+        self._logs_watcher.start()
+        exported_logs: List[_CachedExport] = _wait_for_content(
+            self._logs_cache, _get_last_export, True, self._wait_strategy, timeout
+        )
+        return list(_get_records(exported_logs))
+
+    def query_logs(
+        self,
+        trace_id: bytes = b"",
+        span_id: bytes = b"",
+        severity_text: str = "",
+        body: str = "",
+        attributes: Optional[Dict[str, str]] = None,
+        limit: int = 0,
+    ) -> List[ResourceScopeLog]:
+        """Get the log records currently stored in the collector that match the given criteria, without waiting.
+
+        The collector looks the log records up through its indexes, and only the matching log records are returned.
+        `body` matches a substring of the log body. Criteria left empty match any log record.
+
+        Returns:
+            List of `ResourceScopeLog` holding the matching log records and their related scope and resources.
+        """
+        request: QueryLogsRequest = QueryLogsRequest(
+            trace_id=trace_id,
+            span_id=span_id,
+            severity_text=severity_text,
+            body=body,
+            attributes=attributes,
+            limit=limit,
+        )
+        response: QueryLogsResponse = self.client.query_logs(request)
+        return _flatten_logs(map(ExportLogsServiceRequest.FromString, response.logs))
+
+    def get_storage_stats(self) -> GetStorageStatsResponse:
+        """Get how many exports and bytes the collector stores for each signal, and how many it evicted to stay within
+        its storage budget. Evicted exports are also dropped from what this client returns.
+        """
+        return self.client.get_storage_stats(GetStorageStatsRequest())
+
+    def get_soak_stats(self) -> GetSoakStatsResponse:
+        """Get the counters of a collector started in soak mode, which counts the telemetry it receives instead of
+        storing it. The counters are reset by `clear_signals`.
+        """
+        return self.client.get_soak_stats(GetSoakStatsRequest())
+
+    def configure_faults(
+        self,
+        traces: Optional[FaultConfig] = None,
+        metrics: Optional[FaultConfig] = None,
+        logs: Optional[FaultConfig] = None,
+        seed: int = 0,
+    ) -> None:
+        """Make the collector inject faults into the exports of each signal: latency, UNAVAILABLE or RESOURCE_EXHAUSTED
+        failures, partial successes and hangs. Signals left as None are served without faults, so calling this without
+        arguments stops injecting faults. A non-zero `seed` makes the faults drawn reproducible.
+        """
+        self.client.configure_faults(ConfigureFaultsRequest(traces=traces, metrics=metrics, logs=logs, seed=seed))
+
+    def get_fault_stats(self) -> GetFaultStatsResponse:
+        """Get the faults the collector injected into the exports of each signal since they were last configured."""
+        return self.client.get_fault_stats(GetFaultStatsRequest())
+
+    def get_wire_stats(self) -> GetWireStatsResponse:
+        """Get the uncompressed sizes of the exports received since the collector was last cleared, along with their
+        compressed sizes, per export, per service and per attribute key. Compressed sizes are only measured for exports
+        received compressed over OTLP/HTTP, and are otherwise estimated, in the `estimated_compressed_bytes` fields.
+        Requires a collector started with `MOCK_COLLECTOR_WIRE_STATS=true`.
+        """
+        return self.client.get_wire_stats(GetWireStatsRequest())
+
+    def get_duplicate_span_stats(self) -> GetDuplicateSpanStatsResponse:
+        """Get the spans the collector received more than once since it was last cleared, per service, which it only
+        stored once. Requires a collector started with `MOCK_COLLECTOR_DEDUPLICATE_SPANS=true`.
+        """
+        return self.client.get_duplicate_span_stats(GetDuplicateSpanStatsRequest())
+
+    def get_metrics(
+        self, present_metrics: Set[str], exact_match=True, timeout: Optional[timedelta] = None
+    ) -> List[ResourceScopeMetric]:
+        """Get all metrics that are currently stored in the mock collector, once metrics with all the `present_metrics`
+        names are received, compared case-insensitively. With `exact_match`, also wait until no metric with a new name
+        was received for the quiescence window of the wait strategy of the client. Fails if that takes longer than
+        `timeout`, or than the timeout of the wait strategy if it is not given.
 
         Returns:
              List of `ResourceScopeMetric` which is a flat list containing all metrics and their related scope and
              resources.
         """
+        exported_metrics: List[_CachedExport] = self._wait_for_metrics(present_metrics, exact_match, timeout)
+        return list(_get_records(exported_metrics))
 
-        present_metrics_lower: Set[str] = {s.lower() for s in present_metrics}
-
-        def get_export() -> List[ExportMetricsServiceRequest]:
-            response: GetMetricsResponse = self.client.get_metrics(GetMetricsRequest())
-            serialized_metrics: RepeatedScalarFieldContainer[bytes] = response.metrics
-            return list(map(ExportMetricsServiceRequest.FromString, serialized_metrics))
-
-        def wait_condition(
-            exported: List[ExportMetricsServiceRequest], current: List[ExportMetricsServiceRequest]
-        ) -> bool:
-            received_metrics: Set[str] = set()
-            for exported_metric in current:
-                for resource_metric in exported_metric.resource_metrics:
-                    for scope_metric in resource_metric.scope_metrics:
-                        for metric in scope_metric.metrics:
-                            received_metrics.add(metric.name.lower())
-            if exact_match:
-                return 0 < len(exported) == (len(current) - 2) and present_metrics_lower.issubset(received_metrics)
-            return present_metrics_lower.issubset(received_metrics)
-
-        exported_metrics: List[ExportMetricsServiceRequest] = _wait_for_content(get_export, wait_condition)
-        metrics: List[ResourceScopeMetric] = []
-        for exported_metric in exported_metrics:
-            for resource_metric in exported_metric.resource_metrics:
-                for scope_metric in resource_metric.scope_metrics:
-                    for metric in scope_metric.metrics:
-                        metrics.append(ResourceScopeMetric(resource_metric, scope_metric, metric))
-        return metrics
-
-
-def _wait_for_content(get_export: Callable[[], List[T]], wait_condition: Callable[[List[T], List[T]], bool]) -> List[T]:
-    # Verify that there is no more data to be received
-    deadline: datetime = datetime.now() + _TIMEOUT_DELAY
-    exported: List[T] = []
-
-    while deadline > datetime.now():
-        try:
-            current_exported: List[T] = get_export()
-            if wait_condition(exported, current_exported):
-                return current_exported
-            exported = current_exported
+    def get_metric_columns(
+        self,
+        present_metrics: Set[str],
+        attribute_keys: Iterable[str] = (),
+        exact_match=True,
+        timeout: Optional[timedelta] = None,
+    ) -> MetricPointColumns:
+        """Get the data points of all metrics that are currently stored in the mock collector, as columns rather than a
+        list of objects, once they are received like for `get_metrics`.
+
+        Returns:
+             `MetricPointColumns` holding the times, values, metric name and service of every data point, along with a
+             column for each of the given data point attributes.
+        """
+        exported_metrics: List[_CachedExport] = self._wait_for_metrics(present_metrics, exact_match, timeout)
+        return metrics_to_columns(_get_records(exported_metrics), attribute_keys)
+
+    def metrics(
+        self, present_metrics: Set[str], exact_match=True, timeout: Optional[timedelta] = None
+    ) -> MetricQuery[ResourceScopeMetric]:
+        """Get all metrics that are currently stored in the mock collector, once they are received like for
+        `get_metrics`, as a query to select metrics from, like `metrics({"Latency"}).name("latency")`.
+
+        The metrics are indexed once per snapshot: as long as no export is received, every call returns the same query.
+        """
+        exported_metrics: List[_CachedExport] = self._wait_for_metrics(present_metrics, exact_match, timeout)
+        return self._metric_snapshot.get_query(exported_metrics)
+
+    def wait_for_metrics(self, names: Set[str], timeout: timedelta = _TIMEOUT_DELAY) -> List[ResourceScopeMetric]:
+        """Wait until the collector has received metrics with all the given names, compared case-insensitively.
+
+        The names are checked by the collector as metrics are received, and only the metrics with those names are
+        returned.
+
+        Returns:
+             List of `ResourceScopeMetric` holding the metrics with the given names and their related scope and
+             resources.
+        """
+        request: WaitForMetricsRequest = WaitForMetricsRequest(
+            names=names, timeout_millis=int(timeout.total_seconds() * 1000)
+        )
+        response: WaitForMetricsResponse = self.client.wait_for_metrics(
+            request, timeout=(timeout + _RPC_TIMEOUT_MARGIN).total_seconds()
+        )
+        if not response.satisfied:
+            raise RuntimeError(f"Timeout waiting for metrics {names}")
+        return _flatten_metrics(map(ExportMetricsServiceRequest.FromString, response.metrics))
+
+    def _wait_for_traces(self, timeout: Optional[timedelta]) -> List[_CachedExport]:
+        self._trace_watcher.start()
+        return _wait_for_content(self._trace_cache, _get_last_export, True, self._wait_strategy, timeout)
+
+    def _wait_for_metrics(
+        self, present_metrics: Set[str], exact_match: bool, timeout: Optional[timedelta]
+    ) -> List[_CachedExport]:
+        self._metrics_watcher.start()
+        return _wait_for_content(
+            self._metrics_cache, _get_last_new_metric(present_metrics), exact_match, self._wait_strategy, timeout
+        )
+
+
+class AsyncMockCollectorClient:
+    """Variant of `MockCollectorClient` for asyncio, on a `grpc.aio` channel, to be created in a running event loop.
+
+    Calls are coroutines waiting for the exports pushed by the watch streams of the mock collector without holding a
+    thread, so that the waits of a test, like that for traces and that for metrics, or a `wait_for_spans` per
+    operation, can run concurrently, for instance with `asyncio.gather`. The watch streams are consumed by tasks of the
+    event loop, so the client must be closed in the same loop.
+    """
+
+    def __init__(
+        self, mock_collector_address: str, mock_collector_port: str, wait_strategy: Optional[WaitStrategy] = None
+    ):
+        self._channel: aio.Channel = aio.insecure_channel(f"{mock_collector_address}:{mock_collector_port}")
+        self._wait_strategy: WaitStrategy = wait_strategy or WaitStrategy()
+        self.client: MockCollectorServiceStub = MockCollectorServiceStub(self._channel)
+        self._trace_cache: _ExportCache[ExportTraceServiceRequest] = _ExportCache(
+            ExportTraceServiceRequest, create_span_interner, ResourceScopeSpan
+        )
+        self._metrics_cache: _ExportCache[ExportMetricsServiceRequest] = _ExportCache(
+            ExportMetricsServiceRequest, create_metric_interner, ResourceScopeMetric
+        )
+        self._logs_cache: _ExportCache[ExportLogsServiceRequest] = _ExportCache(
+            ExportLogsServiceRequest, create_log_record_interner, ResourceScopeLog
+        )
+        self._trace_watcher: _AsyncExportWatcher[ExportTraceServiceRequest] = _AsyncExportWatcher(
+            self.client.watch_traces, GetTracesRequest, "traces", self._trace_cache
+        )
+        self._metrics_watcher: _AsyncExportWatcher[ExportMetricsServiceRequest] = _AsyncExportWatcher(
+            self.client.watch_metrics, GetMetricsRequest, "metrics", self._metrics_cache
+        )
+        self._logs_watcher: _AsyncExportWatcher[ExportLogsServiceRequest] = _AsyncExportWatcher(
+            self.client.watch_logs, GetLogsRequest, "logs", self._logs_cache
+        )
+        self._span_snapshot: _IndexedSnapshot[SpanQuery[ResourceScopeSpan]] = _IndexedSnapshot(query_spans)
+        self._metric_snapshot: _IndexedSnapshot[MetricQuery[ResourceScopeMetric]] = _IndexedSnapshot(query_metrics)
+
+    async def clear_signals(self) -> None:
+        """Clear all the signals in the backend collector"""
+        response: ClearResponse = await self.client.clear(ClearRequest())
+        self._trace_cache.discard_through(response.traces_cursor)
+        self._metrics_cache.discard_through(response.metrics_cursor)
+        self._logs_cache.discard_through(response.logs_cursor)
+
+    async def close(self) -> None:
+        """Stop watching the backend collector and close the connection to it"""
+        await self._trace_watcher.close()
+        await self._metrics_watcher.close()
+        await self._logs_watcher.close()
+        await self._channel.close()
+
+    async def get_traces(self, timeout: Optional[timedelta] = None) -> List[ResourceScopeSpan]:
+        """Like `MockCollectorClient.get_traces`."""
+        self._trace_watcher.start()
+        exported_traces: List[_CachedExport] = await _wait_for_content_async(
+            self._trace_cache, _get_last_export, True, self._wait_strategy, timeout
+        )
+        return list(_get_records(exported_traces))
+
+    async def spans(self, timeout: Optional[timedelta] = None) -> SpanQuery[ResourceScopeSpan]:
+        """Like `MockCollectorClient.spans`."""
+        self._trace_watcher.start()
+        exported_traces: List[_CachedExport] = await _wait_for_content_async(
+            self._trace_cache, _get_last_export, True, self._wait_strategy, timeout
+        )
+        return self._span_snapshot.get_query(exported_traces)
+
+    async def wait_for_spans(
+        self,
+        name: str = "",
+        kind: int = Span.SPAN_KIND_UNSPECIFIED,
+        attributes: Optional[Dict[str, str]] = None,
+        min_count: int = 1,
+        timeout: timedelta = _TIMEOUT_DELAY,
+    ) -> List[ResourceScopeSpan]:
+        """Like `MockCollectorClient.wait_for_spans`."""
+        request: WaitForSpansRequest = WaitForSpansRequest(
+            name=name,
+            kind=kind,
+            attributes=attributes,
+            min_count=min_count,
+            timeout_millis=int(timeout.total_seconds() * 1000),
+        )
+        response: WaitForSpansResponse = await self.client.wait_for_spans(
+            request, timeout=(timeout + _RPC_TIMEOUT_MARGIN).total_seconds()
+        )
+        if not response.satisfied:
+            raise RuntimeError(f"Timeout waiting for {min_count} spans matching {request}")
+        return _flatten_spans(map(ExportTraceServiceRequest.FromString, response.traces))
+
+    async def get_logs(self, timeout: Optional[timedelta] = None) -> List[ResourceScopeLog]:
+        """Like `MockCollectorClient.get_logs`."""
+        self._logs_watcher.start()
+        exported_logs: List[_CachedExport] = await _wait_for_content_async(
+            self._logs_cache, _get_last_export, True, self._wait_strategy, timeout
+        )
+        return list(_get_records(exported_logs))
+
+    async def get_metrics(
+        self, present_metrics: Set[str], exact_match=True, timeout: Optional[timedelta] = None
+    ) -> List[ResourceScopeMetric]:
+        """Like `MockCollectorClient.get_metrics`."""
+        exported_metrics: List[_CachedExport] = await self._wait_for_metrics(present_metrics, exact_match, timeout)
+        return list(_get_records(exported_metrics))
+
+    async def metrics(
+        self, present_metrics: Set[str], exact_match=True, timeout: Optional[timedelta] = None
+    ) -> MetricQuery[ResourceScopeMetric]:
+        """Like `MockCollectorClient.metrics`."""
+        exported_metrics: List[_CachedExport] = await self._wait_for_metrics(present_metrics, exact_match, timeout)
+        return self._metric_snapshot.get_query(exported_metrics)
+
+    async def wait_for_metrics(self, names: Set[str], timeout: timedelta = _TIMEOUT_DELAY) -> List[ResourceScopeMetric]:
+        """Like `MockCollectorClient.wait_for_metrics`."""
+        request: WaitForMetricsRequest = WaitForMetricsRequest(
+            names=names, timeout_millis=int(timeout.total_seconds() * 1000)
+        )
+        response: WaitForMetricsResponse = await self.client.wait_for_metrics(
+            request, timeout=(timeout + _RPC_TIMEOUT_MARGIN).total_seconds()
+        )
+        if not response.satisfied:
+            raise RuntimeError(f"Timeout waiting for metrics {names}")
+        return _flatten_metrics(map(ExportMetricsServiceRequest.FromString, response.metrics))
+
+    async def _wait_for_metrics(
+        self, present_metrics: Set[str], exact_match: bool, timeout: Optional[timedelta]
+    ) -> List[_CachedExport]:
+        self._metrics_watcher.start()
+        return await _wait_for_content_async(
+            self._metrics_cache, _get_last_new_metric(present_metrics), exact_match, self._wait_strategy, timeout
+        )
+
+
+def _flatten_spans(exported_traces: Iterable[ExportTraceServiceRequest]) -> List[ResourceScopeSpan]:
+    spans: List[ResourceScopeSpan] = []
+    for exported_trace in exported_traces:
+        for resource_span in exported_trace.resource_spans:
+            for scope_span in resource_span.scope_spans:
+                for span in scope_span.spans:
+                    spans.append(ResourceScopeSpan(resource_span, scope_span, span))
+    return spans
+
+
+def _flatten_metrics(exported_metrics: Iterable[ExportMetricsServiceRequest]) -> List[ResourceScopeMetric]:
+    metrics: List[ResourceScopeMetric] = []
+    for exported_metric in exported_metrics:
+        for resource_metric in exported_metric.resource_metrics:
+            for scope_metric in resource_metric.scope_metrics:
+                for metric in scope_metric.metrics:
+                    metrics.append(ResourceScopeMetric(resource_metric, scope_metric, metric))
+    return metrics
+
+
+def _flatten_logs(exported_logs: Iterable[ExportLogsServiceRequest]) -> List[ResourceScopeLog]:
+    logs: List[ResourceScopeLog] = []
+    for exported_log in exported_logs:
+        for resource_log in exported_log.resource_logs:
+            for scope_log in resource_log.scope_logs:
+                for log_record in scope_log.log_records:
+                    logs.append(ResourceScopeLog(resource_log, scope_log, log_record))
+    return logs
+
+
+def _get_records(exports: List[_CachedExport]) -> Iterator:
+    return chain.from_iterable(export.records for export in exports)
+
+
+def _is_same_snapshot(exports: List[_CachedExport], other_exports: List[_CachedExport]) -> bool:
+    # Cached exports are only ever appended, discarded from the front, or re-created when compacted, so two snapshots
+    # of the same length holding the same first and last exports hold the same ones.
+    if len(exports) != len(other_exports):
+        return False
+    return not exports or (exports[0] is other_exports[0] and exports[-1] is other_exports[-1])
+
+
+def _get_last_export(exports: List[_CachedExport]) -> Optional[int]:
+    return len(exports) - 1 if exports else None
+
+
+def _get_last_new_metric(present_metrics: Set[str]) -> Callable[[List[_CachedExport]], Optional[int]]:
+    present_metrics_lower: Set[str] = {s.lower() for s in present_metrics}
+
+    def get_last_change(exports: List[_CachedExport]) -> Optional[int]:
+        # Metrics are exported periodically, whether they changed or not, so metrics have settled once no new metric
+        # name is received, rather than once no export is.
+        received_metrics: Set[str] = set()
+        last_change: int = -1
+        for index, export in enumerate(exports):
+            for record in export.records:
+                name: str = record.metric.name.lower()
+                if name not in received_metrics:
+                    received_metrics.add(name)
+                    last_change = index
+        return last_change if present_metrics_lower.issubset(received_metrics) else None
+
+    return get_last_change
+
+
+class _ContentWait:
+    """Wait for the cached exports to hold what a call waits for, and to have settled if `settle` is set, shared by
+    the blocking and asyncio clients, which each wait for the cache to change in their own way.
+
+    `get_last_change` returns None until the exports hold what the call waits for, and then the index of the export
+    whose receive time the quiescence window is measured from, or -1 if there is none to wait on.
+    """
+
+    def __init__(
+        self,
+        cache: _ExportCache,
+        get_last_change: Callable[[List[_CachedExport]], Optional[int]],
+        settle: bool,
+        wait_strategy: WaitStrategy,
+        timeout: Optional[timedelta],
+    ):
+        self._cache: _ExportCache = cache
+        self._get_last_change: Callable[[List[_CachedExport]], Optional[int]] = get_last_change
+        self._settle: bool = settle
+        self._wait_strategy: WaitStrategy = wait_strategy
+        self._deadline: float = monotonic() + (timeout or wait_strategy.timeout).total_seconds()
+        self._poll_interval: float = wait_strategy.initial_poll_interval.total_seconds()
+        # Snapshot of the cache taken by the last check.
+        self.version: int = 0
+        self.exports: List[_CachedExport] = []
+
+    def check(self) -> Optional[float]:
+        """Take a snapshot of the cache, and return None if it holds what the call waits for, or else how long to wait
+        for the cache to change before checking again. Fails once the timeout of the call elapses, or if the cache
+        could not be kept in sync.
+        """
+        self.version, self.exports = self._cache.snapshot()
+        if self._cache.error is not None:
+            raise RuntimeError("Failed to receive exports from the mock collector") from self._cache.error
+        last_change: Optional[int] = self._get_last_change(self.exports)
+        settling: float = 0.0
+        if last_change is not None:
+            if not self._settle or last_change < 0:
+                return None
+            last_received_time: int = self.exports[last_change].received_time_unix_nano
+            quiet_nanos: int = self._cache.get_server_time_unix_nano() - last_received_time
+            settling = self._wait_strategy.quiescence.total_seconds() - quiet_nanos / 1e9
+            if settling <= 0:
+                return None
+
+        remaining: float = self._deadline - monotonic()
+        if remaining <= 0:
+            raise RuntimeError("Timeout waiting for content")
+        wait: float = min(self._poll_interval, remaining)
+        if settling > 0:
+            wait = min(wait, settling)
+        return wait
+
+    def waited(self, changed: bool) -> None:
+        """Back off the poll interval unless the cache changed during the last wait."""
+        if changed:
+            self._poll_interval = self._wait_strategy.initial_poll_interval.total_seconds()
+        else:
+            self._poll_interval = min(
+                self._poll_interval * self._wait_strategy.backoff_factor,
+                self._wait_strategy.max_poll_interval.total_seconds(),
+            )
+
+
+def _wait_for_content(
+    cache: _ExportCache[T],
+    get_last_change: Callable[[List[_CachedExport]], Optional[int]],
+    settle: bool,
+    wait_strategy: WaitStrategy,
+    timeout: Optional[timedelta],
+) -> List[_CachedExport]:
+    content_wait: _ContentWait = _ContentWait(cache, get_last_change, settle, wait_strategy, timeout)
+    while True:
+        wait: Optional[float] = content_wait.check()
+        if wait is None:
+            return content_wait.exports
+        content_wait.waited(cache.wait_for_change(content_wait.version, wait))
 
-            sleep(_WAIT_INTERVAL_SEC)
-        # pylint: disable=broad-exception-caught
-        except Exception:
-            _logger.exception("Error while reading content")
 
-    raise RuntimeError("Timeout waiting for content")
+async def _wait_for_content_async(
+    cache: _ExportCache[T],
+    get_last_change: Callable[[List[_CachedExport]], Optional[int]],
+    settle: bool,
+    wait_strategy: WaitStrategy,
+    timeout: Optional[timedelta],
+) -> List[_CachedExport]:
+    # Like `_wait_for_content`, but woken up by the cache through an event rather than blocking a thread.
+    loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+    changed: asyncio.Event = asyncio.Event()
+    content_wait: _ContentWait = _ContentWait(cache, get_last_change, settle, wait_strategy, timeout)
+    with cache.change_listener(lambda: loop.call_soon_threadsafe(changed.set)):
+        while True:
+            changed.clear()
+            wait: Optional[float] = content_wait.check()
+            if wait is None:
+                return content_wait.exports
+            try:
+                await asyncio.wait_for(changed.wait(), wait)
+                content_wait.waited(True)
+            except asyncio.TimeoutError:
+                content_wait.waited(False)
@@ -0,0 +1,229 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""Columnar views of spans and metric data points, for analyses over hundreds of thousands of them, like latency
+percentiles per operation or error rates per remote service.
+
+Every field is held in an `array.array`, one value per span or data point, so a column is a single buffer rather than
+a Python object per row. Columns support the buffer protocol, so NumPy can wrap them without copying, for instance
+with `numpy.frombuffer(columns.duration_nanos, dtype=numpy.int64)`, where it is installed.
+
+Strings, like span names, services or attribute values, are dictionary-encoded: a column of ids into the list of the
+distinct strings of the column.
+"""
+import math
+from array import array
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from google.protobuf.message import Message
+from mock_collector_interning import InternedItem
+from mock_collector_resource import get_service_name
+
+from opentelemetry.proto.common.v1.common_pb2 import AnyValue, KeyValue
+from opentelemetry.proto.metrics.v1.metrics_pb2 import Metric
+from opentelemetry.proto.trace.v1.trace_pb2 import Span
+
+# Id of the rows of a dictionary-encoded column without a value, like spans without a selected attribute.
+MISSING_ID: int = -1
+
+
+class DictionaryColumn(NamedTuple):
+    """Column of strings, as ids into `values`, or `MISSING_ID` for rows without a value."""
+
+    ids: array
+    values: List[str]
+
+    def get(self, row: int) -> Optional[str]:
+        value_id: int = self.ids[row]
+        return None if value_id == MISSING_ID else self.values[value_id]
+
+    def group_rows(self) -> Dict[str, array]:
+        """Return the rows holding each value, in ascending order, for per-value aggregations."""
+        rows: List[array] = [array("q") for _ in self.values]
+        for row, value_id in enumerate(self.ids):
+            if value_id != MISSING_ID:
+                rows[value_id].append(row)
+        return dict(zip(self.values, rows))
+
+
+class SpanColumns(NamedTuple):
+    start_time_unix_nano: array
+    end_time_unix_nano: array
+    duration_nanos: array
+    kind: array
+    status_code: array
+    name: DictionaryColumn
+    service: DictionaryColumn
+    # Selected span attributes, by key, with their values converted to strings.
+    attributes: Dict[str, DictionaryColumn]
+
+    def __len__(self) -> int:
+        return len(self.start_time_unix_nano)
+
+
+class MetricPointColumns(NamedTuple):
+    """Columns of the data points of metrics, of every type.
+
+    `value` is the value of gauge and sum data points, and NaN for the others. `count` and `sum` are those of histogram,
+    exponential histogram and summary data points, and 0 and NaN for the others, or `sum` is NaN when a histogram has
+    none.
+    """
+
+    time_unix_nano: array
+    start_time_unix_nano: array
+    value: array
+    count: array
+    sum: array
+    name: DictionaryColumn
+    # Type of the metric, as the name of its data field, like "gauge" or "histogram".
+    type: DictionaryColumn
+    service: DictionaryColumn
+    # Selected data point attributes, by key, with their values converted to strings.
+    attributes: Dict[str, DictionaryColumn]
+
+    def __len__(self) -> int:
+        return len(self.time_unix_nano)
+
+
+class _DictionaryBuilder:
+    def __init__(self):
+        self._value_ids: Dict[str, int] = {}
+        self.ids: array = array("q")
+
+    def append(self, value: Optional[str]) -> None:
+        if value is None:
+            self.ids.append(MISSING_ID)
+            return
+        value_id: Optional[int] = self._value_ids.get(value)
+        if value_id is None:
+            value_id = self._value_ids[value] = len(self._value_ids)
+        self.ids.append(value_id)
+
+    def build(self) -> DictionaryColumn:
+        return DictionaryColumn(self.ids, list(self._value_ids))
+
+
+class _AttributeColumnsBuilder:
+    def __init__(self, keys: Iterable[str]):
+        self._builders: Dict[str, _DictionaryBuilder] = {key: _DictionaryBuilder() for key in keys}
+
+    def append(self, attributes: Iterable[KeyValue]) -> None:
+        if not self._builders:
+            return
+        values: Dict[str, str] = {}
+        for attribute in attributes:
+            if attribute.key in self._builders:
+                values[attribute.key] = _to_string(attribute.value)
+        for key, builder in self._builders.items():
+            builder.append(values.get(key))
+
+    def build(self) -> Dict[str, DictionaryColumn]:
+        return {key: builder.build() for key, builder in self._builders.items()}
+
+
+class _ServiceNames:
+    # Interned items share their resource-level message, so the service name is only looked up once per resource.
+    def __init__(self):
+        self._names: Dict[int, Tuple[Message, str]] = {}
+
+    def get(self, resource_message: Message) -> str:
+        entry: Optional[Tuple[Message, str]] = self._names.get(id(resource_message))
+        if entry is None:
+            # The message is kept along with its name, so that its id is not reused by another one meanwhile.
+            entry = self._names[id(resource_message)] = (
+                resource_message,
+                get_service_name(resource_message.resource.attributes),
+            )
+        return entry[1]
+
+
+def spans_to_columns(items: Iterable[InternedItem], attribute_keys: Iterable[str] = ()) -> SpanColumns:
+    """Build the columns of the given interned spans, with a column for each of `attribute_keys`."""
+    start_times: array = array("Q")
+    end_times: array = array("Q")
+    durations: array = array("q")
+    kinds: array = array("b")
+    status_codes: array = array("b")
+    names: _DictionaryBuilder = _DictionaryBuilder()
+    services: _DictionaryBuilder = _DictionaryBuilder()
+    attributes: _AttributeColumnsBuilder = _AttributeColumnsBuilder(attribute_keys)
+    service_names: _ServiceNames = _ServiceNames()
+    span: Span
+    for resource_spans, _, span in items:
+        start_times.append(span.start_time_unix_nano)
+        end_times.append(span.end_time_unix_nano)
+        durations.append(span.end_time_unix_nano - span.start_time_unix_nano)
+        kinds.append(span.kind)
+        status_codes.append(span.status.code)
+        names.append(span.name)
+        services.append(service_names.get(resource_spans))
+        attributes.append(span.attributes)
+    return SpanColumns(
+        start_times,
+        end_times,
+        durations,
+        kinds,
+        status_codes,
+        names.build(),
+        services.build(),
+        attributes.build(),
+    )
+
+
+def metrics_to_columns(items: Iterable[InternedItem], attribute_keys: Iterable[str] = ()) -> MetricPointColumns:
+    """Build the columns of the data points of the given interned metrics, with a column for each of
+    `attribute_keys`.
+    """
+    times: array = array("Q")
+    start_times: array = array("Q")
+    values: array = array("d")
+    counts: array = array("Q")
+    sums: array = array("d")
+    names: _DictionaryBuilder = _DictionaryBuilder()
+    types: _DictionaryBuilder = _DictionaryBuilder()
+    services: _DictionaryBuilder = _DictionaryBuilder()
+    attributes: _AttributeColumnsBuilder = _AttributeColumnsBuilder(attribute_keys)
+    service_names: _ServiceNames = _ServiceNames()
+    metric: Metric
+    for resource_metrics, _, metric in items:
+        data_type: Optional[str] = metric.WhichOneof("data")
+        if data_type is None:
+            continue
+        service_name: str = service_names.get(resource_metrics)
+        for data_point in getattr(metric, data_type).data_points:
+            times.append(data_point.time_unix_nano)
+            start_times.append(data_point.start_time_unix_nano)
+            value, count, point_sum = _get_point_values(data_type, data_point)
+            values.append(value)
+            counts.append(count)
+            sums.append(point_sum)
+            names.append(metric.name)
+            types.append(data_type)
+            services.append(service_name)
+            attributes.append(data_point.attributes)
+    return MetricPointColumns(
+        times,
+        start_times,
+        values,
+        counts,
+        sums,
+        names.build(),
+        types.build(),
+        services.build(),
+        attributes.build(),
+    )
+
+
+def _get_point_values(data_type: str, data_point: Message) -> Tuple[float, int, float]:
+    if data_type in ("gauge", "sum"):
+        value: float = data_point.as_int if data_point.WhichOneof("value") == "as_int" else data_point.as_double
+        return value, 0, math.nan
+    if data_type == "summary" or data_point.HasField("sum"):
+        return math.nan, data_point.count, data_point.sum
+    return math.nan, data_point.count, math.nan
+
+
+def _to_string(value: AnyValue) -> str:
+    value_type: Optional[str] = value.WhichOneof("value")
+    if value_type == "string_value" or value_type is None:
+        return value.string_value
+    return str(getattr(value, value_type))
@@ -0,0 +1,92 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""Detection of the spans the mock collector receives more than once, such as when an exporter retries an export that
+timed out after it was received, so that each span is only stored once.
+
+Spans are identified by their trace id and span id, packed into a single integer, which Python stores more compactly
+than a tuple of the two. Only the most recent spans are remembered, so that memory stays bounded in long-running load
+tests: a span repeated after that many other spans is stored again.
+"""
+from collections import Counter
+from threading import Lock
+from typing import Counter as CounterType
+from typing import Dict, List, Optional
+
+from mock_collector_resource import get_service_name
+
+from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import ExportTraceServiceRequest
+
+# Most recent spans whose ids are remembered.
+_MAX_TRACKED_SPANS: int = 1_000_000
+
+
+class DuplicateSpanFilter:
+    """Thread-safe filter of the spans already received, until it is reset, counting the duplicates per service name.
+
+    Every export is parsed to be filtered, so duplicate spans are only filtered when enabled.
+    """
+
+    def __init__(self, max_tracked_spans: int = _MAX_TRACKED_SPANS):
+        self._lock: Lock = Lock()
+        self._max_tracked_spans: int = max_tracked_spans
+        self._reset()
+
+    def filter(self, data: bytes) -> Optional[bytes]:
+        """Return export `data` without the spans received before, or None if it only holds such spans.
+
+        `data` is returned as is if none of its spans were received before, and re-encoded otherwise.
+        """
+        request: ExportTraceServiceRequest = ExportTraceServiceRequest.FromString(data)
+        duplicates: CounterType[str] = Counter()
+        # Indexes of the duplicate spans of each scope spans, by resource spans and scope spans index.
+        duplicate_indexes: Dict[int, Dict[int, List[int]]] = {}
+        span_count: int = 0
+        with self._lock:
+            for resource_index, resource_spans in enumerate(request.resource_spans):
+                service_name: str = get_service_name(resource_spans.resource.attributes)
+                for scope_index, scope_spans in enumerate(resource_spans.scope_spans):
+                    for span_index, span in enumerate(scope_spans.spans):
+                        span_count += 1
+                        key: int = int.from_bytes(span.trace_id + span.span_id, "big")
+                        if key in self._span_keys:
+                            duplicates[service_name] += 1
+                            duplicate_indexes.setdefault(resource_index, {}).setdefault(scope_index, []).append(
+                                span_index
+                            )
+                            continue
+                        # Keys are kept in insertion order, so the first one is the oldest.
+                        self._span_keys[key] = None
+                        if len(self._span_keys) > self._max_tracked_spans:
+                            del self._span_keys[next(iter(self._span_keys))]
+            self._duplicate_counts.update(duplicates)
+        if not duplicates:
+            return data
+        if sum(duplicates.values()) == span_count:
+            return None
+        # Spans are deleted from the last, so that the indexes of the others do not change, and so are the scope spans
+        # and resource spans left empty.
+        for resource_index in sorted(duplicate_indexes, reverse=True):
+            resource_spans = request.resource_spans[resource_index]
+            for scope_index in sorted(duplicate_indexes[resource_index], reverse=True):
+                spans = resource_spans.scope_spans[scope_index].spans
+                for span_index in reversed(duplicate_indexes[resource_index][scope_index]):
+                    del spans[span_index]
+                if not spans:
+                    del resource_spans.scope_spans[scope_index]
+            if not resource_spans.scope_spans:
+                del request.resource_spans[resource_index]
+        return request.SerializeToString()
+
+    def get_duplicate_counts(self) -> Dict[str, int]:
+        """Return the number of duplicate spans filtered out per service name."""
+        with self._lock:
+            return dict(self._duplicate_counts)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._reset()
+
+    def _reset(self) -> None:
+        # Dicts preserve insertion order, unlike sets, which evicting the oldest keys relies on.
+        self._span_keys: Dict[int, None] = {}
+        self._duplicate_counts: CounterType[str] = Counter()
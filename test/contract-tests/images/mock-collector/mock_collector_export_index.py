@@ -0,0 +1,111 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+from abc import ABC, abstractmethod
+from collections import defaultdict, deque
+from threading import Lock
+from typing import DefaultDict, Deque, Generic, Hashable, Iterable, List, Tuple, TypeVar
+
+from mock_collector_export_store import ExportSlice, ExportStore
+from mock_collector_interning import ResourceScopeInterner, should_compact
+from mock_collector_raw_export import RawExport
+
+# Indexed item, like a span along with its resource and scope, and the predicate items are queried with.
+M = TypeVar("M")
+P = TypeVar("P")
+
+
+class ExportIndex(ABC, Generic[M, P]):
+    """Index of the items, like spans or log records, in the exports held by an `ExportStore`.
+
+    Exports are indexed incrementally, the first time items are queried after the exports are stored, so that `Export`
+    never pays for parsing. Every item is indexed under a set of keys, and a query narrows its candidates down to the
+    smallest index entry among the keys it requires, and only evaluates its predicate on those.
+
+    Every index entry lists its items in the order they were received, so items evicted or cleared from the store,
+    always the oldest ones, are removed from the front of their entries.
+
+    Items are copied out of their export with `_interner`, so that the index keeps a single copy of every resource and
+    scope rather than every parsed export. Once most of the copies belong to removed items, the remaining exports are
+    indexed again from the store, with a new interner.
+    """
+
+    def __init__(self, export_store: ExportStore):
+        self._export_store: ExportStore = export_store
+        self._lock: Lock = Lock()
+        self._indexed_cursor: int = 0
+        # Every indexed item, along with the sequence number of its export.
+        self._items: Deque[Tuple[int, M]] = deque()
+        self._entries: DefaultDict[Hashable, Deque[M]] = defaultdict(deque)
+        self._interner: ResourceScopeInterner = self._create_interner()
+
+    def query(self, predicate: P, limit: int = 0) -> Tuple[List[M], int]:
+        """Return the stored items matching `predicate`, up to `limit` of them if it is not 0, in the order they were
+        received. Also returns the cursor of the last export the query covered.
+        """
+        with self._lock:
+            self._catch_up()
+            matches: List[M] = []
+            for item in self._get_candidates(predicate):
+                if self._matches(predicate, item):
+                    matches.append(item)
+                    if len(matches) == limit:
+                        break
+            return matches, self._indexed_cursor
+
+    @abstractmethod
+    def _create_interner(self) -> ResourceScopeInterner:
+        pass
+
+    @abstractmethod
+    def _get_items(self, export: RawExport) -> Iterable[M]:
+        """Return the items of `export` to index, interned with `_interner`."""
+
+    @abstractmethod
+    def _get_index_keys(self, item: M) -> Iterable[Hashable]:
+        """Return the keys to index `item` under. They must be the same every time they are computed for an item."""
+
+    @abstractmethod
+    def _get_query_keys(self, predicate: P) -> Iterable[Hashable]:
+        """Return index keys that every item matching `predicate` is indexed under."""
+
+    @abstractmethod
+    def _matches(self, predicate: P, item: M) -> bool:
+        pass
+
+    def _catch_up(self) -> None:
+        exports: ExportSlice = self._export_store.get_exports(self._indexed_cursor)
+        self._remove_through(exports.start_cursor)
+        if should_compact(self._interner, len(self._items)):
+            self._reset()
+            exports = self._export_store.get_exports(0)
+        for export in exports.exports:
+            for item in self._get_items(export):
+                self._items.append((export.sequence_number, item))
+                for key in self._get_index_keys(item):
+                    self._entries[key].append(item)
+        self._indexed_cursor = exports.next_cursor
+
+    def _remove_through(self, cursor: int) -> None:
+        if cursor >= self._indexed_cursor:
+            # Everything indexed is gone, as after `clear`: start over rather than removing the items one by one.
+            self._reset()
+            return
+        while self._items and self._items[0][0] <= cursor:
+            _, item = self._items.popleft()
+            for key in self._get_index_keys(item):
+                entry: Deque[M] = self._entries[key]
+                entry.popleft()
+                if not entry:
+                    del self._entries[key]
+
+    def _reset(self) -> None:
+        self._items.clear()
+        self._entries.clear()
+        self._interner = self._create_interner()
+
+    def _get_candidates(self, predicate: P) -> Iterable[M]:
+        # Look up without `defaultdict` inserting an empty entry for every key that was queried.
+        candidates: List[Deque[M]] = [self._entries.get(key, deque()) for key in self._get_query_keys(predicate)]
+        if not candidates:
+            return (item for _, item in self._items)
+        return min(candidates, key=len)
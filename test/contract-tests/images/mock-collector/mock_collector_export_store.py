@@ -0,0 +1,234 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+from collections import deque
+from ctypes import c_ulonglong
+from logging import Logger, getLogger
+from multiprocessing.context import BaseContext
+from multiprocessing.synchronize import Lock as ProcessLock
+from threading import Condition
+from typing import Callable, Deque, Generic, List, NamedTuple, Optional, Type
+
+from mock_collector_raw_export import RawExport, T
+
+_logger: Logger = getLogger(__name__)
+
+ExportListener = Callable[[RawExport], None]
+ChangeListener = Callable[[], None]
+
+
+class ExportSlice(NamedTuple):
+    """Exports returned by `ExportStore.get_exports`, along with the cursors bounding what is currently stored.
+
+    The store holds exactly the exports with sequence numbers in (start_cursor, next_cursor], and `exports` is the
+    tail of that range received after the requested cursor.
+    """
+
+    exports: List[RawExport]
+    start_cursor: int
+    next_cursor: int
+
+
+class StorageStats(NamedTuple):
+    """What an `ExportStore` currently holds, what it has evicted to stay within its budget, and that budget.
+
+    Sizes are the encoded sizes of the exports. A budget of 0 is unbounded.
+    """
+
+    stored_exports: int
+    stored_bytes: int
+    evicted_exports: int
+    evicted_bytes: int
+    max_exports: int
+    max_bytes: int
+
+
+class SharedSequence:
+    """Sequence numbers of the exports of one signal, shared by the worker processes of a multi-process mock collector.
+
+    Each export is numbered and stored by its worker under a lock shared by all of them, so every sequence number at
+    or before `current` belongs to an export already stored in one of the workers. The exports of all workers up to
+    `current` are then numbered consecutively, like the exports of a single store. `cleared` is the cursor the workers
+    were last cleared at.
+
+    Must be created before the worker processes are started, for them to inherit it.
+    """
+
+    def __init__(self, context: BaseContext):
+        self.lock: ProcessLock = context.Lock()
+        self._value: c_ulonglong = context.RawValue(c_ulonglong, 0)
+        self._cleared: c_ulonglong = context.RawValue(c_ulonglong, 0)
+
+    def next(self) -> int:
+        """Return the next sequence number. Must be called with `lock` held."""
+        self._value.value += 1
+        return self._value.value
+
+    def current(self) -> int:
+        with self.lock:
+            return self._value.value
+
+    @property
+    def cleared(self) -> int:
+        return self._cleared.value
+
+    def set_cleared(self, cursor: int) -> None:
+        with self.lock:
+            self._cleared.value = max(self._cleared.value, cursor)
+
+
+class ExportStore(Generic[T]):
+    """Thread-safe store of the exports received for one signal.
+
+    Every export is assigned a sequence number, increasing by one per stored export and never reused, even across
+    `clear`. Clients pass the last sequence number they have seen as a cursor to fetch only newer exports, or to wait
+    for them.
+
+    The store can be bounded by a number of exports and by a number of bytes, in which case it acts as a ring buffer:
+    the oldest exports are evicted to make room for new ones, moving the start cursor forward just like `clear` does.
+    The newest export is always kept, even if it is larger than the byte budget on its own.
+
+    With a `SharedSequence`, sequence numbers are drawn from it instead, so that the stores of the workers of a
+    multi-process mock collector number their exports as one. Each store then only holds some of the sequence numbers.
+    """
+
+    def __init__(
+        self,
+        request_type: Type[T],
+        max_exports: int = 0,
+        max_bytes: int = 0,
+        sequence: Optional[SharedSequence] = None,
+    ):
+        self._request_type: Type[T] = request_type
+        self._sequence: Optional[SharedSequence] = sequence
+        self._max_exports: int = max_exports
+        self._max_bytes: int = max_bytes
+        self._condition: Condition = Condition()
+        self._exports: Deque[RawExport[T]] = deque()
+        self._stored_bytes: int = 0
+        self._evicted_exports: int = 0
+        self._evicted_bytes: int = 0
+        self._start_cursor: int = 0
+        self._next_cursor: int = 0
+        self._listeners: List[ExportListener] = []
+        self._change_listeners: List[ChangeListener] = []
+
+    def add(self, data: bytes) -> RawExport[T]:
+        with self._condition:
+            if self._sequence is None:
+                self._next_cursor += 1
+                export: RawExport[T] = RawExport(data, self._request_type, self._next_cursor)
+                self._exports.append(export)
+            else:
+                with self._sequence.lock:
+                    self._next_cursor = self._sequence.next()
+                    export = RawExport(data, self._request_type, self._next_cursor)
+                    self._exports.append(export)
+            self._stored_bytes += len(data)
+            self._evict()
+            for listener in self._listeners:
+                _notify(listener, export)
+            self._notify_change()
+            return export
+
+    def add_listener(self, listener: ExportListener, since: int) -> None:
+        """Call `listener` with every export after `since`: the stored ones right away, then every new one as it is
+        added. Listeners are called while the store is locked, so they see every export exactly once and in order.
+        """
+        with self._condition:
+            for export in self._get_exports(since).exports:
+                _notify(listener, export)
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: ExportListener) -> None:
+        with self._condition:
+            self._listeners.remove(listener)
+
+    def add_change_listener(self, listener: ChangeListener) -> None:
+        """Call `listener` whenever exports are added or cleared, after the export listeners were called.
+
+        This is the counterpart of `wait_for_exports` for callers that cannot block a thread, like coroutines. Listeners
+        are called while the store is locked, so they must not call back into it.
+        """
+        with self._condition:
+            self._change_listeners.append(listener)
+
+    def remove_change_listener(self, listener: ChangeListener) -> None:
+        with self._condition:
+            self._change_listeners.remove(listener)
+
+    def get_exports(self, since: int = 0) -> ExportSlice:
+        with self._condition:
+            return self._get_exports(since)
+
+    def wait_for_exports(self, since: int, start_cursor: int, timeout: float) -> ExportSlice:
+        """Wait until an export is received after `since` or the store is cleared past `start_cursor`.
+
+        Returns the exports after `since` once either happens, or when `timeout` elapses.
+        """
+        with self._condition:
+            self._condition.wait_for(
+                lambda: self._next_cursor > since or self._start_cursor > start_cursor, timeout=timeout
+            )
+            return self._get_exports(since)
+
+    def clear(self, through: int = 0) -> int:
+        """Remove all stored exports, or only those up to `through` if it is not 0, and return the cursor they were
+        cleared at.
+        """
+        with self._condition:
+            if through:
+                while self._exports and self._exports[0].sequence_number <= through:
+                    self._stored_bytes -= len(self._exports.popleft().data)
+                self._start_cursor = max(self._start_cursor, through)
+                self._next_cursor = max(self._next_cursor, through)
+            else:
+                self._exports.clear()
+                self._stored_bytes = 0
+                self._start_cursor = self._next_cursor
+            self._notify_change()
+            return self._start_cursor
+
+    def get_stats(self) -> StorageStats:
+        with self._condition:
+            return StorageStats(
+                stored_exports=len(self._exports),
+                stored_bytes=self._stored_bytes,
+                evicted_exports=self._evicted_exports,
+                evicted_bytes=self._evicted_bytes,
+                max_exports=self._max_exports,
+                max_bytes=self._max_bytes,
+            )
+
+    def _notify_change(self) -> None:
+        self._condition.notify_all()
+        for listener in self._change_listeners:
+            _notify(listener)
+
+    def _evict(self) -> None:
+        while len(self._exports) > 1 and (
+            0 < self._max_exports < len(self._exports) or 0 < self._max_bytes < self._stored_bytes
+        ):
+            evicted: RawExport[T] = self._exports.popleft()
+            self._stored_bytes -= len(evicted.data)
+            self._evicted_exports += 1
+            self._evicted_bytes += len(evicted.data)
+            self._start_cursor = evicted.sequence_number
+
+    def _get_exports(self, since: int) -> ExportSlice:
+        # Deltas are usually small, so walk back from the newest export instead of scanning the whole store.
+        exports: List[RawExport[T]] = []
+        for export in reversed(self._exports):
+            if export.sequence_number <= since:
+                break
+            exports.append(export)
+        exports.reverse()
+        return ExportSlice(exports, self._start_cursor, self._next_cursor)
+
+
+def _notify(listener: Callable[..., None], *args: RawExport) -> None:
+    # A listener failing, for instance on an export that cannot be parsed, must not fail the export itself.
+    try:
+        listener(*args)
+    # pylint: disable=broad-exception-caught
+    except Exception:
+        _logger.exception("Export listener failed")
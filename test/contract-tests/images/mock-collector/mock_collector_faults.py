@@ -0,0 +1,189 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""Faults injected into the Export rpcs of the mock collector, to measure how exporters cope with a slow or failing
+collector: how much their retries cost, and how many spans they drop.
+
+Faults are configured per signal with the `configure_faults` rpc, and drawn independently for every export. An export
+is delayed first, then either hung, failed, or answered, possibly with an OTLP `partial_success`. Every fault drawn is
+counted, and returned by the `get_fault_stats` rpc.
+"""
+import asyncio
+import math
+import random
+from threading import Event, Lock
+from time import sleep
+from typing import Dict, NamedTuple, Optional
+
+from grpc import ServicerContext, StatusCode, aio
+from mock_collector_capture import REQUEST_TYPES, Signal, count_items
+from mock_collector_service_pb2 import FaultConfig, FaultStats, LatencyFault
+
+# Longest an export hangs without an aio server. A hang holds a thread of the server, and lasts forever for a client
+# without a deadline, or over OTLP/HTTP, whose receiver is not told when its client gives up.
+_MAX_SYNC_HANG_SEC: float = 300.0
+
+
+class PartialSuccess(NamedTuple):
+    rejected_items: int
+    error_message: str
+
+
+class InjectedFault(Exception):
+    """Raised in place of aborting an export received without a gRPC context, over OTLP/HTTP."""
+
+    def __init__(self, code: StatusCode, details: str):
+        super().__init__(details)
+        self.code: StatusCode = code
+        self.details: str = details
+
+
+class _Fault(NamedTuple):
+    delay: float
+    hang: bool
+    code: Optional[StatusCode]
+    partial_success: Optional[PartialSuccess]
+
+
+class FaultInjector:
+    """Thread-safe configuration of the faults of each signal, and counts of the faults drawn from it."""
+
+    def __init__(self):
+        self._lock: Lock = Lock()
+        self._random: random.Random = random.Random()
+        self._configs: Dict[Signal, FaultConfig] = {}
+        self._stats: Dict[Signal, FaultStats] = {signal: FaultStats() for signal in Signal}
+
+    def configure(self, configs: Dict[Signal, FaultConfig], seed: int = 0) -> None:
+        """Replace the faults of every signal with `configs`, and reset the fault stats.
+
+        Signals missing from `configs` are served without faults. Raises `ValueError` for an invalid configuration.
+        """
+        for signal, config in configs.items():
+            _validate(signal, config)
+        with self._lock:
+            self._random.seed(seed or None)
+            self._configs = dict(configs)
+            self._stats = {signal: FaultStats() for signal in Signal}
+
+    def get_stats(self, signal: Signal) -> FaultStats:
+        with self._lock:
+            stats: FaultStats = FaultStats()
+            stats.CopyFrom(self._stats[signal])
+            return stats
+
+    def inject(self, signal: Signal, request: bytes, context: Optional[ServicerContext]) -> Optional[PartialSuccess]:
+        """Delay, hang or fail an export received by a synchronous server, or over OTLP/HTTP if `context` is None.
+
+        Returns the partial success to answer the export with, if one was drawn.
+        """
+        fault: Optional[_Fault] = self._draw(signal, request)
+        if fault is None:
+            return None
+        if fault.delay > 0:
+            sleep(fault.delay)
+        if fault.hang:
+            # Hang until the client cancels the call or its deadline expires, which ends it with that status, or until
+            # the longest hang is over.
+            ended: Event = Event()
+            if context is None or context.add_callback(ended.set):
+                ended.wait(_MAX_SYNC_HANG_SEC)
+            _abort(context, StatusCode.UNAVAILABLE, "Injected hang")
+        if fault.code is not None:
+            _abort(context, fault.code, f"Injected {fault.code.name}")
+        return fault.partial_success
+
+    async def inject_async(
+        self, signal: Signal, request: bytes, context: aio.ServicerContext
+    ) -> Optional[PartialSuccess]:
+        """Delay, hang or fail an export received by an `aio` server, without blocking its event loop.
+
+        Returns the partial success to answer the export with, if one was drawn.
+        """
+        fault: Optional[_Fault] = self._draw(signal, request)
+        if fault is None:
+            return None
+        if fault.delay > 0:
+            await asyncio.sleep(fault.delay)
+        if fault.hang:
+            # The server cancels the handler when the client cancels the call or its deadline expires.
+            await asyncio.get_running_loop().create_future()
+        if fault.code is not None:
+            await context.abort(fault.code, f"Injected {fault.code.name}")
+        return fault.partial_success
+
+    def _draw(self, signal: Signal, request: bytes) -> Optional[_Fault]:
+        with self._lock:
+            # Read along with the stats, so that an export is not counted in the stats of another configuration.
+            config: Optional[FaultConfig] = self._configs.get(signal)
+            if config is None:
+                return None
+            stats: FaultStats = self._stats[signal]
+            delay: float = _draw_latency(self._random, config.latency) if config.HasField("latency") else 0.0
+            outcome: float = self._random.random()
+            hang: bool = outcome < config.hang_fraction
+            outcome -= config.hang_fraction
+            code: Optional[StatusCode] = None
+            if not hang and outcome < config.unavailable_fraction:
+                code = StatusCode.UNAVAILABLE
+            elif not hang and outcome < config.unavailable_fraction + config.resource_exhausted_fraction:
+                code = StatusCode.RESOURCE_EXHAUSTED
+            partial: bool = not hang and code is None and self._random.random() < config.partial_success_fraction
+
+            stats.exports += 1
+            if delay > 0:
+                stats.delayed_exports += 1
+                stats.total_delay_millis += delay * 1000
+            stats.hangs += hang
+            stats.unavailable += code == StatusCode.UNAVAILABLE
+            stats.resource_exhausted += code == StatusCode.RESOURCE_EXHAUSTED
+            stats.partial_successes += partial
+
+        partial_success: Optional[PartialSuccess] = None
+        if partial:
+            # Only exports answered with a partial success are parsed, to count their items.
+            item_count: int = count_items(signal, REQUEST_TYPES[signal].FromString(request))
+            rejected: int = math.ceil(item_count * config.rejected_item_fraction)
+            partial_success = PartialSuccess(rejected, config.partial_success_message)
+            with self._lock:
+                stats.rejected_items += rejected
+        return _Fault(delay, hang, code, partial_success)
+
+
+def _abort(context: Optional[ServicerContext], code: StatusCode, details: str) -> None:
+    if context is None:
+        raise InjectedFault(code, details)
+    context.abort(code, details)
+
+
+def _validate(signal: Signal, config: FaultConfig) -> None:
+    fractions: Dict[str, float] = {
+        field: getattr(config, field)
+        for field in (
+            "unavailable_fraction",
+            "resource_exhausted_fraction",
+            "hang_fraction",
+            "partial_success_fraction",
+            "rejected_item_fraction",
+        )
+    }
+    for field, fraction in fractions.items():
+        if not 0 <= fraction <= 1:
+            raise ValueError(f"{signal.name.lower()} {field} must be between 0 and 1, got {fraction}")
+    if fractions["unavailable_fraction"] + fractions["resource_exhausted_fraction"] + fractions["hang_fraction"] > 1:
+        raise ValueError(f"{signal.name.lower()} unavailable, resource exhausted and hang fractions add up to over 1")
+    latency: LatencyFault = config.latency
+    if min(latency.min_millis, latency.max_millis, latency.mean_millis) < 0:
+        raise ValueError(f"{signal.name.lower()} latency must not be negative")
+    if latency.distribution == LatencyFault.UNIFORM and latency.max_millis < latency.min_millis:
+        raise ValueError(f"{signal.name.lower()} uniform latency max_millis must be at least min_millis")
+
+
+def _draw_latency(rng: random.Random, latency: LatencyFault) -> float:
+    millis: float = latency.min_millis
+    if latency.distribution == LatencyFault.UNIFORM:
+        millis = rng.uniform(latency.min_millis, latency.max_millis)
+    elif latency.distribution == LatencyFault.EXPONENTIAL and latency.mean_millis > 0:
+        millis += rng.expovariate(1 / latency.mean_millis)
+        if latency.max_millis > 0:
+            millis = min(millis, latency.max_millis)
+    return millis / 1000
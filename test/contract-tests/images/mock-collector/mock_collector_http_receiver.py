@@ -0,0 +1,262 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+import base64
+import gzip
+import json
+import socket
+import zlib
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from logging import Logger, getLogger
+from threading import Thread
+from typing import Any, BinaryIO, Callable, Dict, FrozenSet, List, NamedTuple, Optional, Tuple, Type
+
+from google.protobuf import json_format
+from google.protobuf.message import Message
+from grpc import StatusCode
+from mock_collector_faults import InjectedFault
+from mock_collector_logs_service import MockCollectorLogsService
+from mock_collector_metrics_service import MockCollectorMetricsService
+from mock_collector_trace_service import MockCollectorTraceService
+from mock_collector_wire_stats import WireFormat
+from typing_extensions import override
+
+from opentelemetry.proto.collector.logs.v1.logs_service_pb2 import ExportLogsServiceRequest
+from opentelemetry.proto.collector.metrics.v1.metrics_service_pb2 import ExportMetricsServiceRequest
+from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import ExportTraceServiceRequest
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+_logger: Logger = getLogger(__name__)
+
+_PROTOBUF_CONTENT_TYPE: str = "application/x-protobuf"
+_JSON_CONTENT_TYPE: str = "application/json"
+_GZIP_ENCODING: str = "gzip"
+_CHUNKED_TRANSFER_ENCODING: str = "chunked"
+# Longest chunk size or trailer line of a chunked request body.
+_MAX_CHUNK_LINE_BYTES: int = 4096
+# Only accepted when the optional zstandard package is installed.
+_ZSTD_ENCODING: str = "zstd"
+# OTLP protocol of each content type, as recorded in the wire stats.
+_PROTOCOLS: Dict[str, str] = {_PROTOBUF_CONTENT_TYPE: "http/protobuf", _JSON_CONTENT_TYPE: "http/json"}
+_BODY_ERRORS: Tuple[Type[Exception], ...] = (OSError, EOFError, zlib.error, ValueError, json_format.ParseError) + (
+    (zstandard.ZstdError,) if zstandard is not None else ()
+)
+# OTLP/JSON encodes trace and span ids as hex strings, where the protobuf JSON mapping expects base64.
+_HEX_ID_FIELDS: FrozenSet[str] = frozenset(
+    ("traceId", "spanId", "parentSpanId", "trace_id", "span_id", "parent_span_id")
+)
+# Statuses OTLP/HTTP answers in place of the gRPC status codes of the faults injected into exports.
+_FAULT_HTTP_STATUSES: Dict[StatusCode, HTTPStatus] = {
+    StatusCode.UNAVAILABLE: HTTPStatus.SERVICE_UNAVAILABLE,
+    StatusCode.RESOURCE_EXHAUSTED: HTTPStatus.TOO_MANY_REQUESTS,
+}
+
+
+class _Route(NamedTuple):
+    request_type: Type[Message]
+    export: Callable[[bytes, WireFormat], Message]
+
+
+class OtlpHttpReceiver:
+    """Receives OTLP/HTTP exports on `/v1/traces`, `/v1/metrics` and `/v1/logs`, and hands them to the same collector
+    services as the OTLP/gRPC exports.
+
+    Bodies can be binary protobuf or OTLP/JSON, and gzip-compressed, or zstd-compressed if the zstandard package is
+    installed. JSON exports are converted to protobuf on arrival, so that the collectors store every export in the same
+    wire format, whichever protocol it was received with.
+    """
+
+    def __init__(
+        self,
+        port: int,
+        trace_collector: MockCollectorTraceService,
+        metrics_collector: MockCollectorMetricsService,
+        logs_collector: MockCollectorLogsService,
+        reuse_port: bool = False,
+    ):
+        self._server: _OtlpHttpServer = _OtlpHttpServer(
+            ("0.0.0.0", port),
+            {
+                "/v1/traces": _Route(ExportTraceServiceRequest, trace_collector.export_http),
+                "/v1/metrics": _Route(ExportMetricsServiceRequest, metrics_collector.export_http),
+                "/v1/logs": _Route(ExportLogsServiceRequest, logs_collector.export_http),
+            },
+            reuse_port,
+        )
+        self._thread: Thread = Thread(target=self._server.serve_forever, name="otlp-http-receiver", daemon=True)
+
+    @property
+    def port(self) -> int:
+        return self._server.server_address[1]
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class _OtlpHttpServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, server_address: Tuple[str, int], routes: Dict[str, _Route], reuse_port: bool):
+        # Workers of a multi-process mock collector all bind the same port, and the kernel spreads connections between
+        # them.
+        self._reuse_port: bool = reuse_port
+        super().__init__(server_address, _OtlpHttpRequestHandler)
+        self.routes: Dict[str, _Route] = routes
+
+    @override
+    def server_bind(self) -> None:
+        # `allow_reuse_port` is only honored from Python 3.11, so the option is set on the socket directly.
+        if self._reuse_port:
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        super().server_bind()
+
+
+class _OtlpHttpRequestHandler(BaseHTTPRequestHandler):
+    # Keep connections open between exports, as OTLP/HTTP exporters do.
+    protocol_version = "HTTP/1.1"
+    server: _OtlpHttpServer
+
+    # pylint: disable=invalid-name
+    def do_POST(self) -> None:
+        route: Optional[_Route] = self.server.routes.get(self.path.split("?", 1)[0])
+        body: Optional[bytes] = self._read_body()
+        if body is None:
+            return
+        if route is None:
+            self._send_error(HTTPStatus.NOT_FOUND, f"No OTLP signal is received on {self.path}")
+            return
+
+        content_type: str = _PROTOBUF_CONTENT_TYPE
+        if "Content-Type" in self.headers:
+            content_type = self.headers.get_content_type()
+        if content_type not in (_PROTOBUF_CONTENT_TYPE, _JSON_CONTENT_TYPE):
+            self._send_error(HTTPStatus.UNSUPPORTED_MEDIA_TYPE, f"Unsupported content type {content_type}")
+            return
+        content_encoding: str = (self.headers.get("Content-Encoding") or "").lower()
+        if content_encoding in ("", "identity"):
+            content_encoding = ""
+        elif content_encoding != _GZIP_ENCODING and (content_encoding != _ZSTD_ENCODING or zstandard is None):
+            self._send_error(HTTPStatus.UNSUPPORTED_MEDIA_TYPE, f"Unsupported content encoding {content_encoding}")
+            return
+        wire_format: WireFormat = WireFormat(_PROTOCOLS[content_type], content_encoding, len(body))
+        try:
+            if content_encoding == _GZIP_ENCODING:
+                body = gzip.decompress(body)
+            elif content_encoding == _ZSTD_ENCODING:
+                body = zstandard.ZstdDecompressor().decompressobj().decompress(body)
+            if content_type == _JSON_CONTENT_TYPE:
+                body = _json_to_protobuf(body, route.request_type)
+        except _BODY_ERRORS as error:
+            self._send_error(HTTPStatus.BAD_REQUEST, f"Invalid OTLP request body: {error}")
+            return
+
+        try:
+            response: Message = route.export(body, wire_format)
+        except InjectedFault as fault:
+            self._send_error(_FAULT_HTTP_STATUSES.get(fault.code, HTTPStatus.INTERNAL_SERVER_ERROR), fault.details)
+            return
+        if content_type == _JSON_CONTENT_TYPE:
+            self._send(HTTPStatus.OK, _JSON_CONTENT_TYPE, json_format.MessageToJson(response).encode())
+        else:
+            self._send(HTTPStatus.OK, _PROTOBUF_CONTENT_TYPE, response.SerializeToString())
+
+    def log_message(self, format: str, *args: Any) -> None:  # pylint: disable=redefined-builtin
+        # Every export would otherwise be logged to stderr.
+        _logger.debug(format, *args)
+
+    def _read_body(self) -> Optional[bytes]:
+        """Read the body of the request, or answer it with an error and return None.
+
+        Exporters that do not know the size of a body up front, like the OTLP/HTTP exporter of OpenTelemetry .NET, send
+        it in chunks. A request whose body cannot be read fully is answered by closing the connection, since the rest
+        of the body would otherwise be read as the next request.
+        """
+        transfer_encoding: str = (self.headers.get("Transfer-Encoding") or "").lower()
+        if transfer_encoding:
+            if transfer_encoding != _CHUNKED_TRANSFER_ENCODING:
+                self._send_error(
+                    HTTPStatus.NOT_IMPLEMENTED, f"Unsupported transfer encoding {transfer_encoding}", close=True
+                )
+                return None
+            try:
+                return _read_chunks(self.rfile)
+            except (OSError, EOFError, ValueError) as error:
+                self._send_error(HTTPStatus.BAD_REQUEST, f"Invalid chunked request body: {error}", close=True)
+                return None
+        content_length: Optional[str] = self.headers.get("Content-Length")
+        if content_length is None:
+            self._send_error(HTTPStatus.LENGTH_REQUIRED, "Requests need a Content-Length or a chunked body", close=True)
+            return None
+        if not content_length.isdigit():
+            self._send_error(HTTPStatus.BAD_REQUEST, f"Invalid Content-Length {content_length}", close=True)
+            return None
+        return self.rfile.read(int(content_length))
+
+    def _send_error(self, status: HTTPStatus, message: str, close: bool = False) -> None:
+        self._send(status, "text/plain", message.encode(), close)
+
+    def _send(self, status: HTTPStatus, content_type: str, body: bytes, close: bool = False) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        if close:
+            # Also makes the handler close the connection once the response is sent.
+            self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def _read_chunks(rfile: BinaryIO) -> bytes:
+    chunks: List[bytes] = []
+    while True:
+        # Chunk extensions, after the size, carry nothing the mock collector uses.
+        size: int = int(_read_chunk_line(rfile).split(b";", 1)[0].strip(), 16)
+        if size < 0:
+            raise ValueError(f"Negative chunk size {size}")
+        if size == 0:
+            break
+        chunk: bytes = rfile.read(size)
+        if len(chunk) < size or _read_chunk_line(rfile).strip():
+            raise EOFError("Chunk shorter than its size")
+        chunks.append(chunk)
+    # The last chunk is followed by optional trailer fields, and an empty line.
+    while _read_chunk_line(rfile).strip():
+        pass
+    return b"".join(chunks)
+
+
+def _read_chunk_line(rfile: BinaryIO) -> bytes:
+    line: bytes = rfile.readline(_MAX_CHUNK_LINE_BYTES + 1)
+    if not line.endswith(b"\n"):
+        raise EOFError("Chunked body ended early, or has a line too long")
+    return line
+
+
+def _json_to_protobuf(body: bytes, request_type: Type[Message]) -> bytes:
+    request: Message = json_format.ParseDict(
+        _hex_ids_to_base64(json.loads(body)), request_type(), ignore_unknown_fields=True
+    )
+    return request.SerializeToString()
+
+
+def _hex_ids_to_base64(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {
+            key: (
+                base64.b64encode(bytes.fromhex(item)).decode()
+                if key in _HEX_ID_FIELDS and isinstance(item, str)
+                else _hex_ids_to_base64(item)
+            )
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [_hex_ids_to_base64(item) for item in value]
+    return value
@@ -0,0 +1,124 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""Interning of the resources and instrumentation scopes repeated by every export, for the telemetry kept in memory.
+
+Every export carries a full copy of the resource and scope of its spans, metrics or log records, and a message parsed
+from it stays alive, whole, as long as any of its items is referenced. Interning copies the items of each export into
+shared containers instead: one per distinct resource, identified by its encoded content, holding one per distinct scope
+of that resource. However many exports repeat a resource and scope, they are only kept once, and the exports are freed
+as soon as their items are copied.
+
+Shared containers only grow, so their owner tracks how many of the items copied into them it still references, and
+starts over with a new interner once most of them are gone.
+"""
+from typing import Dict, Generic, Iterable, List, Optional, Tuple, Type, TypeVar
+
+from google.protobuf.message import Message
+
+from opentelemetry.proto.logs.v1.logs_pb2 import ResourceLogs
+from opentelemetry.proto.metrics.v1.metrics_pb2 import ResourceMetrics
+from opentelemetry.proto.trace.v1.trace_pb2 import ResourceSpans
+
+# Resource-level message, like `ResourceSpans`.
+R = TypeVar("R", bound=Message)
+
+# Item along with the shared resource-level and scope-level messages it was copied into.
+InternedItem = Tuple[R, Message, Message]
+
+# Fewest items copied but no longer referenced before it is worth starting over with a new interner.
+_MIN_COMPACTION_ITEMS: int = 10_000
+
+
+class ResourceScopeInterner(Generic[R]):
+    """Copies the items of export requests into shared containers, one per distinct resource and scope.
+
+    Not thread-safe: callers copy items under the lock that guards the items they keep.
+    """
+
+    def __init__(self, resource_type: Type[R], resources_field: str, scopes_field: str, items_field: str):
+        self._resource_type: Type[R] = resource_type
+        self._resources_field: str = resources_field
+        self._scopes_field: str = scopes_field
+        self._items_field: str = items_field
+        self._resources: Dict[bytes, R] = {}
+        self._scopes: Dict[Tuple[bytes, bytes], Message] = {}
+        # Items copied so far, including those the owner no longer references.
+        self.item_count: int = 0
+
+    def intern(self, export: Message) -> List[InternedItem]:
+        """Copy the items of export request `export` into the shared containers of their resource and scope, in the
+        order they appear in the export.
+        """
+        interned: List[InternedItem] = []
+        for resource_message in getattr(export, self._resources_field):
+            resource_key: bytes = _get_key(resource_message.resource, resource_message.schema_url)
+            for scope_message in getattr(resource_message, self._scopes_field):
+                shared_resource, shared_scope = self._get_containers(resource_message, resource_key, scope_message)
+                self._copy(shared_resource, shared_scope, getattr(scope_message, self._items_field), interned)
+        return interned
+
+    def reintern(self, items: Iterable[InternedItem]) -> List[InternedItem]:
+        """Copy `items`, interned by another interner, into the shared containers of this one, in the same order."""
+        # Keys are only computed once per distinct container, which stays alive as long as `items` is.
+        containers: Dict[int, Tuple[R, Message]] = {}
+        interned: List[InternedItem] = []
+        for resource_message, scope_message, item in items:
+            shared: Optional[Tuple[R, Message]] = containers.get(id(scope_message))
+            if shared is None:
+                resource_key: bytes = _get_key(resource_message.resource, resource_message.schema_url)
+                shared = self._get_containers(resource_message, resource_key, scope_message)
+                containers[id(scope_message)] = shared
+            self._copy(shared[0], shared[1], (item,), interned)
+        return interned
+
+    def _get_containers(self, resource_message: R, resource_key: bytes, scope_message: Message) -> Tuple[R, Message]:
+        shared_resource: Optional[R] = self._resources.get(resource_key)
+        if shared_resource is None:
+            shared_resource = self._resource_type(
+                resource=resource_message.resource, schema_url=resource_message.schema_url
+            )
+            self._resources[resource_key] = shared_resource
+        scope_key: Tuple[bytes, bytes] = (resource_key, _get_key(scope_message.scope, scope_message.schema_url))
+        shared_scope: Optional[Message] = self._scopes.get(scope_key)
+        if shared_scope is None:
+            shared_scope = getattr(shared_resource, self._scopes_field).add(
+                scope=scope_message.scope, schema_url=scope_message.schema_url
+            )
+            self._scopes[scope_key] = shared_scope
+        return shared_resource, shared_scope
+
+    def _copy(
+        self, shared_resource: R, shared_scope: Message, items: Iterable[Message], interned: List[InternedItem]
+    ) -> None:
+        shared_items = getattr(shared_scope, self._items_field)
+        first: int = len(shared_items)
+        shared_items.extend(items)
+        self.item_count += len(shared_items) - first
+        interned.extend((shared_resource, shared_scope, item) for item in shared_items[first:])
+
+
+def create_span_interner() -> ResourceScopeInterner[ResourceSpans]:
+    return ResourceScopeInterner(ResourceSpans, "resource_spans", "scope_spans", "spans")
+
+
+def create_metric_interner() -> ResourceScopeInterner[ResourceMetrics]:
+    return ResourceScopeInterner(ResourceMetrics, "resource_metrics", "scope_metrics", "metrics")
+
+
+def create_log_record_interner() -> ResourceScopeInterner[ResourceLogs]:
+    return ResourceScopeInterner(ResourceLogs, "resource_logs", "scope_logs", "log_records")
+
+
+def should_compact(interner: ResourceScopeInterner, referenced_item_count: int) -> bool:
+    """Return whether most of the items copied by `interner` are no longer referenced, so that copying the rest into a
+    new interner frees more than it costs.
+    """
+    unreferenced: int = interner.item_count - referenced_item_count
+    return unreferenced >= _MIN_COMPACTION_ITEMS and unreferenced > referenced_item_count
+
+
+def _get_key(message: Message, schema_url: str) -> bytes:
+    # Deterministic serialization orders map entries, so that equal messages always get the same key. The schema URL
+    # goes first, length-prefixed, so that no two pairs can encode the same.
+    encoded_url: bytes = schema_url.encode()
+    return len(encoded_url).to_bytes(4, "big") + encoded_url + message.SerializeToString(deterministic=True)
@@ -0,0 +1,49 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+from typing import Hashable, Iterator
+
+from mock_collector_export_index import ExportIndex
+from mock_collector_interning import ResourceScopeInterner, create_log_record_interner
+from mock_collector_predicates import LogRecordMatch, LogRecordPredicate
+from mock_collector_raw_export import RawExport
+from typing_extensions import override
+
+from opentelemetry.proto.collector.logs.v1.logs_service_pb2 import ExportLogsServiceRequest
+from opentelemetry.proto.logs.v1.logs_pb2 import LogRecord
+
+
+class LogRecordIndex(ExportIndex[LogRecordMatch, LogRecordPredicate]):
+    """Index of the log records held by an `ExportStore`, by trace id, span id and severity text.
+
+    Log records that are not correlated with a trace have empty trace and span ids, so they are all indexed under the
+    same empty id entries, which queries never look up.
+    """
+
+    @override
+    def _create_interner(self) -> ResourceScopeInterner:
+        return create_log_record_interner()
+
+    @override
+    def _get_items(self, export: RawExport[ExportLogsServiceRequest]) -> Iterator[LogRecordMatch]:
+        for interned in self._interner.intern(export.parse()):
+            yield LogRecordMatch(*interned)
+
+    @override
+    def _get_index_keys(self, item: LogRecordMatch) -> Iterator[Hashable]:
+        log_record: LogRecord = item.log_record
+        yield "trace_id", log_record.trace_id
+        yield "span_id", log_record.span_id
+        yield "severity_text", log_record.severity_text
+
+    @override
+    def _get_query_keys(self, predicate: LogRecordPredicate) -> Iterator[Hashable]:
+        if predicate.trace_id:
+            yield "trace_id", predicate.trace_id
+        if predicate.span_id:
+            yield "span_id", predicate.span_id
+        if predicate.severity_text:
+            yield "severity_text", predicate.severity_text
+
+    @override
+    def _matches(self, predicate: LogRecordPredicate, item: LogRecordMatch) -> bool:
+        return predicate.matches(item.log_record)
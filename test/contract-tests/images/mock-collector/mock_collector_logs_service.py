@@ -0,0 +1,69 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+from typing import List, Optional, Tuple
+
+from mock_collector_capture import CaptureWriter, Signal
+from mock_collector_export_store import SharedSequence
+from mock_collector_log_record_index import LogRecordIndex
+from mock_collector_faults import FaultInjector, PartialSuccess
+from mock_collector_predicates import LogRecordMatch, LogRecordPredicate
+from mock_collector_self_telemetry import SelfTelemetry
+from mock_collector_signal_service import MockCollectorSignalService
+from mock_collector_soak_stats import SoakStats
+from mock_collector_wire_stats import WireStats
+from typing_extensions import override
+
+from opentelemetry.proto.collector.logs.v1 import logs_service_pb2
+from opentelemetry.proto.collector.logs.v1.logs_service_pb2 import (
+    ExportLogsPartialSuccess,
+    ExportLogsServiceRequest,
+    ExportLogsServiceResponse,
+)
+from opentelemetry.proto.collector.logs.v1.logs_service_pb2_grpc import LogsServiceServicer
+
+
+class MockCollectorLogsService(
+    MockCollectorSignalService[ExportLogsServiceRequest, ExportLogsServiceResponse], LogsServiceServicer
+):
+    def __init__(
+        self,
+        max_exports: int = 0,
+        max_bytes: int = 0,
+        soak_stats: Optional[SoakStats] = None,
+        capture: Optional[CaptureWriter] = None,
+        telemetry: Optional[SelfTelemetry] = None,
+        faults: Optional[FaultInjector] = None,
+        wire_stats: Optional[WireStats] = None,
+        sequence: Optional[SharedSequence] = None,
+    ):
+        super().__init__(
+            Signal.LOGS,
+            ExportLogsServiceRequest,
+            ExportLogsServiceResponse,
+            logs_service_pb2.DESCRIPTOR.services_by_name["LogsService"].full_name,
+            max_exports,
+            max_bytes,
+            soak_stats,
+            capture,
+            telemetry,
+            faults,
+            wire_stats,
+            sequence,
+        )
+        self._log_record_index: LogRecordIndex = LogRecordIndex(self._export_store)
+
+    def query_logs(self, predicate: LogRecordPredicate, limit: int = 0) -> Tuple[List[LogRecordMatch], int]:
+        """Returns the stored log records matching `predicate`, and the cursor of the last export the query covered."""
+        return self._log_record_index.query(predicate, limit)
+
+    @override
+    def _record_soak_stats(self, soak_stats: SoakStats, request: bytes) -> None:
+        soak_stats.record_logs(request)
+
+    @override
+    def _create_partial_success_response(self, partial_success: PartialSuccess) -> ExportLogsServiceResponse:
+        return ExportLogsServiceResponse(
+            partial_success=ExportLogsPartialSuccess(
+                rejected_log_records=partial_success.rejected_items, error_message=partial_success.error_message
+            )
+        )
@@ -1,31 +1,83 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 # SPDX-License-Identifier: Apache-2.0
-from queue import Queue
-from typing import List
+from contextlib import contextmanager
+from typing import Iterable, Iterator, List, Optional, Tuple
 
-from grpc import ServicerContext
+from mock_collector_capture import CaptureWriter, Signal
+from mock_collector_export_store import SharedSequence
+from mock_collector_faults import FaultInjector, PartialSuccess
+from mock_collector_predicates import MetricMatch, MetricNamesWaiter
+from mock_collector_self_telemetry import SelfTelemetry
+from mock_collector_signal_service import MockCollectorSignalService
+from mock_collector_soak_stats import SoakStats
+from mock_collector_wire_stats import WireStats
 from typing_extensions import override
 
+from opentelemetry.proto.collector.metrics.v1 import metrics_service_pb2
 from opentelemetry.proto.collector.metrics.v1.metrics_service_pb2 import (
+    ExportMetricsPartialSuccess,
     ExportMetricsServiceRequest,
     ExportMetricsServiceResponse,
 )
 from opentelemetry.proto.collector.metrics.v1.metrics_service_pb2_grpc import MetricsServiceServicer
 
 
-class MockCollectorMetricsService(MetricsServiceServicer):
-    _export_requests: Queue = Queue(maxsize=-1)
+class MockCollectorMetricsService(
+    MockCollectorSignalService[ExportMetricsServiceRequest, ExportMetricsServiceResponse], MetricsServiceServicer
+):
+    def __init__(
+        self,
+        max_exports: int = 0,
+        max_bytes: int = 0,
+        soak_stats: Optional[SoakStats] = None,
+        capture: Optional[CaptureWriter] = None,
+        telemetry: Optional[SelfTelemetry] = None,
+        faults: Optional[FaultInjector] = None,
+        wire_stats: Optional[WireStats] = None,
+        sequence: Optional[SharedSequence] = None,
+    ):
+        super().__init__(
+            Signal.METRICS,
+            ExportMetricsServiceRequest,
+            ExportMetricsServiceResponse,
+            metrics_service_pb2.DESCRIPTOR.services_by_name["MetricsService"].full_name,
+            max_exports,
+            max_bytes,
+            soak_stats,
+            capture,
+            telemetry,
+            faults,
+            wire_stats,
+            sequence,
+        )
 
-    def get_requests(self) -> List[ExportMetricsServiceRequest]:
-        with self._export_requests.mutex:
-            return list(self._export_requests.queue)
+    def wait_for_metrics(self, since: int, names: Iterable[str], timeout: float) -> Tuple[bool, List[MetricMatch]]:
+        """Wait until metrics with all of `names` are received after `since`, or `timeout` elapses.
 
-    def clear_requests(self) -> None:
-        with self._export_requests.mutex:
-            self._export_requests.queue.clear()
+        Returns whether they were, and the metrics with those names received by then.
+        """
+        with self.metric_names_waiter(since, names) as waiter:
+            satisfied: bool = waiter.satisfied.wait(timeout)
+        return satisfied, waiter.get_matches()
+
+    @contextmanager
+    def metric_names_waiter(self, since: int, names: Iterable[str]) -> Iterator[MetricNamesWaiter]:
+        """Feed a `MetricNamesWaiter` the exports received after `since`, until the end of the `with` block."""
+        waiter: MetricNamesWaiter = MetricNamesWaiter(names)
+        self._export_store.add_listener(waiter.on_export, since)
+        try:
+            yield waiter
+        finally:
+            self._export_store.remove_listener(waiter.on_export)
+
+    @override
+    def _record_soak_stats(self, soak_stats: SoakStats, request: bytes) -> None:
+        soak_stats.record_metrics(request)
 
     @override
-    # pylint: disable=invalid-name
-    def Export(self, request: ExportMetricsServiceRequest, context: ServicerContext) -> ExportMetricsServiceResponse:
-        self._export_requests.put(request)
-        return ExportMetricsServiceResponse()
+    def _create_partial_success_response(self, partial_success: PartialSuccess) -> ExportMetricsServiceResponse:
+        return ExportMetricsServiceResponse(
+            partial_success=ExportMetricsPartialSuccess(
+                rejected_data_points=partial_success.rejected_items, error_message=partial_success.error_message
+            )
+        )
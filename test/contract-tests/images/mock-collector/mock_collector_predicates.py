@@ -0,0 +1,251 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+from threading import Event, Lock
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from mock_collector_raw_export import RawExport
+
+from opentelemetry.proto.collector.logs.v1.logs_service_pb2 import ExportLogsServiceRequest
+from opentelemetry.proto.collector.metrics.v1.metrics_service_pb2 import ExportMetricsServiceRequest
+from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import ExportTraceServiceRequest
+from opentelemetry.proto.logs.v1.logs_pb2 import LogRecord, ResourceLogs, ScopeLogs
+from opentelemetry.proto.metrics.v1.metrics_pb2 import Metric, ResourceMetrics, ScopeMetrics
+from opentelemetry.proto.trace.v1.trace_pb2 import ResourceSpans, ScopeSpans, Span
+
+
+class SpanMatch(NamedTuple):
+    """A span, along with the resource and scope it was exported with."""
+
+    resource_spans: ResourceSpans
+    scope_spans: ScopeSpans
+    span: Span
+
+
+class MetricMatch(NamedTuple):
+    """A metric, along with the resource and scope it was exported with."""
+
+    resource_metrics: ResourceMetrics
+    scope_metrics: ScopeMetrics
+    metric: Metric
+
+
+class LogRecordMatch(NamedTuple):
+    """A log record, along with the resource and scope it was exported with."""
+
+    resource_logs: ResourceLogs
+    scope_logs: ScopeLogs
+    log_record: LogRecord
+
+
+class SpanPredicate:
+    """Matches spans by name, kind, string attribute values and ids. Criteria left empty match any span."""
+
+    def __init__(
+        self,
+        name: str = "",
+        kind: int = Span.SPAN_KIND_UNSPECIFIED,
+        attributes: Optional[Dict[str, str]] = None,
+        trace_id: bytes = b"",
+        span_id: bytes = b"",
+    ):
+        self.name: str = name
+        self.kind: int = kind
+        self.attributes: Dict[str, str] = dict(attributes or {})
+        self.trace_id: bytes = trace_id
+        self.span_id: bytes = span_id
+
+    def matches(self, span: Span) -> bool:
+        if self.trace_id and span.trace_id != self.trace_id:
+            return False
+        if self.span_id and span.span_id != self.span_id:
+            return False
+        if self.name and span.name != self.name:
+            return False
+        if self.kind != Span.SPAN_KIND_UNSPECIFIED and span.kind != self.kind:
+            return False
+        if self.attributes:
+            matched: int = 0
+            for attribute in span.attributes:
+                expected: Optional[str] = self.attributes.get(attribute.key)
+                if expected is not None:
+                    if attribute.value.string_value != expected:
+                        return False
+                    matched += 1
+            return matched == len(self.attributes)
+        return True
+
+
+class LogRecordPredicate:
+    """Matches log records by trace and span id, severity text, body and string attribute values. Criteria left empty
+    match any log record.
+
+    The body is matched as a substring of its string value, since log bodies are mostly formatted messages.
+    """
+
+    def __init__(
+        self,
+        trace_id: bytes = b"",
+        span_id: bytes = b"",
+        severity_text: str = "",
+        body: str = "",
+        attributes: Optional[Dict[str, str]] = None,
+    ):
+        self.trace_id: bytes = trace_id
+        self.span_id: bytes = span_id
+        self.severity_text: str = severity_text
+        self.body: str = body
+        self.attributes: Dict[str, str] = dict(attributes or {})
+
+    def matches(self, log_record: LogRecord) -> bool:
+        if self.trace_id and log_record.trace_id != self.trace_id:
+            return False
+        if self.span_id and log_record.span_id != self.span_id:
+            return False
+        if self.severity_text and log_record.severity_text != self.severity_text:
+            return False
+        if self.body and self.body not in log_record.body.string_value:
+            return False
+        if self.attributes:
+            matched: int = 0
+            for attribute in log_record.attributes:
+                expected: Optional[str] = self.attributes.get(attribute.key)
+                if expected is not None:
+                    if attribute.value.string_value != expected:
+                        return False
+                    matched += 1
+            return matched == len(self.attributes)
+        return True
+
+
+class SpanWaiter:
+    """Collects the spans matching a predicate from the exports it is fed, until `min_count` of them are received.
+
+    Exports are fed by `ExportStore` as they are stored, so each span is only evaluated once however long the wait.
+    """
+
+    def __init__(self, predicate: SpanPredicate, min_count: int):
+        self._predicate: SpanPredicate = predicate
+        self._min_count: int = max(1, min_count)
+        self._lock: Lock = Lock()
+        self._matches: List[SpanMatch] = []
+        self.satisfied: Event = Event()
+
+    def on_export(self, export: RawExport[ExportTraceServiceRequest]) -> None:
+        matches: List[SpanMatch] = []
+        for resource_spans in export.parse().resource_spans:
+            for scope_spans in resource_spans.scope_spans:
+                for span in scope_spans.spans:
+                    if self._predicate.matches(span):
+                        matches.append(SpanMatch(resource_spans, scope_spans, span))
+        if matches:
+            with self._lock:
+                self._matches.extend(matches)
+                if len(self._matches) >= self._min_count:
+                    self.satisfied.set()
+
+    def get_matches(self) -> List[SpanMatch]:
+        with self._lock:
+            return list(self._matches)
+
+
+class MetricNamesWaiter:
+    """Collects the metrics with the given names from the exports it is fed, until every name is received.
+
+    Names are compared case-insensitively.
+    """
+
+    def __init__(self, names: Iterable[str]):
+        self._names: Set[str] = {name.lower() for name in names}
+        self._lock: Lock = Lock()
+        self._received_names: Set[str] = set()
+        self._matches: List[MetricMatch] = []
+        self.satisfied: Event = Event()
+        if not self._names:
+            self.satisfied.set()
+
+    def on_export(self, export: RawExport[ExportMetricsServiceRequest]) -> None:
+        matches: List[MetricMatch] = []
+        for resource_metrics in export.parse().resource_metrics:
+            for scope_metrics in resource_metrics.scope_metrics:
+                for metric in scope_metrics.metrics:
+                    if metric.name.lower() in self._names:
+                        matches.append(MetricMatch(resource_metrics, scope_metrics, metric))
+        if matches:
+            with self._lock:
+                self._matches.extend(matches)
+                self._received_names.update(match.metric.name.lower() for match in matches)
+                if self._received_names == self._names:
+                    self.satisfied.set()
+
+    def get_matches(self) -> List[MetricMatch]:
+        with self._lock:
+            return list(self._matches)
+
+
+def spans_to_export(matches: Iterable[SpanMatch]) -> ExportTraceServiceRequest:
+    """Build an export request holding only the given spans, grouped under their original resource and scope."""
+    request: ExportTraceServiceRequest = ExportTraceServiceRequest()
+    resources: Dict[int, ResourceSpans] = {}
+    scopes: Dict[Tuple[int, int], ScopeSpans] = {}
+    for match in matches:
+        resource_spans: Optional[ResourceSpans] = resources.get(id(match.resource_spans))
+        if resource_spans is None:
+            resource_spans = request.resource_spans.add(
+                resource=match.resource_spans.resource, schema_url=match.resource_spans.schema_url
+            )
+            resources[id(match.resource_spans)] = resource_spans
+        scope_key: Tuple[int, int] = (id(match.resource_spans), id(match.scope_spans))
+        scope_spans: Optional[ScopeSpans] = scopes.get(scope_key)
+        if scope_spans is None:
+            scope_spans = resource_spans.scope_spans.add(
+                scope=match.scope_spans.scope, schema_url=match.scope_spans.schema_url
+            )
+            scopes[scope_key] = scope_spans
+        scope_spans.spans.append(match.span)
+    return request
+
+
+def metrics_to_export(matches: Iterable[MetricMatch]) -> ExportMetricsServiceRequest:
+    """Build an export request holding only the given metrics, grouped under their original resource and scope."""
+    request: ExportMetricsServiceRequest = ExportMetricsServiceRequest()
+    resources: Dict[int, ResourceMetrics] = {}
+    scopes: Dict[Tuple[int, int], ScopeMetrics] = {}
+    for match in matches:
+        resource_metrics: Optional[ResourceMetrics] = resources.get(id(match.resource_metrics))
+        if resource_metrics is None:
+            resource_metrics = request.resource_metrics.add(
+                resource=match.resource_metrics.resource, schema_url=match.resource_metrics.schema_url
+            )
+            resources[id(match.resource_metrics)] = resource_metrics
+        scope_key: Tuple[int, int] = (id(match.resource_metrics), id(match.scope_metrics))
+        scope_metrics: Optional[ScopeMetrics] = scopes.get(scope_key)
+        if scope_metrics is None:
+            scope_metrics = resource_metrics.scope_metrics.add(
+                scope=match.scope_metrics.scope, schema_url=match.scope_metrics.schema_url
+            )
+            scopes[scope_key] = scope_metrics
+        scope_metrics.metrics.append(match.metric)
+    return request
+
+
+def log_records_to_export(matches: Iterable[LogRecordMatch]) -> ExportLogsServiceRequest:
+    """Build an export request holding only the given log records, grouped under their original resource and scope."""
+    request: ExportLogsServiceRequest = ExportLogsServiceRequest()
+    resources: Dict[int, ResourceLogs] = {}
+    scopes: Dict[Tuple[int, int], ScopeLogs] = {}
+    for match in matches:
+        resource_logs: Optional[ResourceLogs] = resources.get(id(match.resource_logs))
+        if resource_logs is None:
+            resource_logs = request.resource_logs.add(
+                resource=match.resource_logs.resource, schema_url=match.resource_logs.schema_url
+            )
+            resources[id(match.resource_logs)] = resource_logs
+        scope_key: Tuple[int, int] = (id(match.resource_logs), id(match.scope_logs))
+        scope_logs: Optional[ScopeLogs] = scopes.get(scope_key)
+        if scope_logs is None:
+            scope_logs = resource_logs.scope_logs.add(
+                scope=match.scope_logs.scope, schema_url=match.scope_logs.schema_url
+            )
+            scopes[scope_key] = scope_logs
+        scope_logs.log_records.append(match.log_record)
+    return request
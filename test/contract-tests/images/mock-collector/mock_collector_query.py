@@ -0,0 +1,212 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""Queries over spans and metrics, like `spans.kind(Span.SPAN_KIND_SERVER).attr("aws.local.operation", "GET /")`, for
+the assertions of contract tests.
+
+The spans or metrics of a snapshot are indexed once, in a single pass, by kind, name, service, trace id, attribute key
+and attribute value. Each selector of a query adds a key of that index, and a query is evaluated in a single pass over
+the rows of its most selective key, checking the other keys through sets of rows, so that the cost of a query depends
+on how many records it matches rather than on the size of the capture. Queries are immutable, so a query can be
+narrowed down in several ways.
+"""
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Generic,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+from google.protobuf.message import Message
+from mock_collector_resource import get_service_name
+
+from opentelemetry.proto.common.v1.common_pb2 import AnyValue, KeyValue
+from opentelemetry.proto.metrics.v1.metrics_pb2 import Metric
+from opentelemetry.proto.trace.v1.trace_pb2 import Span
+
+# Attribute value types indexed by value, along with the field of `AnyValue` holding them.
+_SCALAR_VALUE_FIELDS: Dict[str, type] = {
+    "string_value": str,
+    "bool_value": bool,
+    "int_value": int,
+    "double_value": float,
+    "bytes_value": bytes,
+}
+
+# Record of a telemetry item along with its resource and scope, unpacking into them in that order, like
+# `ResourceScopeSpan`.
+R = TypeVar("R", bound=Iterable[Message])
+Q = TypeVar("Q", bound="_Query")
+
+
+class _RecordIndex(Generic[R]):
+    """Rows of the records holding each key, in ascending order."""
+
+    def __init__(self, records: Sequence[R]):
+        self.records: Sequence[R] = records
+        self._rows: Dict[Hashable, List[int]] = {}
+        self._row_sets: Dict[Hashable, FrozenSet[int]] = {}
+
+    def add(self, row: int, key: Hashable) -> None:
+        rows: List[int] = self._rows.setdefault(key, [])
+        # Items can repeat an attribute key, and metrics repeat them across data points.
+        if not rows or rows[-1] != row:
+            rows.append(row)
+
+    def get_rows(self, key: Hashable) -> List[int]:
+        return self._rows.get(key, [])
+
+    def get_row_set(self, key: Hashable) -> FrozenSet[int]:
+        row_set: Optional[FrozenSet[int]] = self._row_sets.get(key)
+        if row_set is None:
+            row_set = self._row_sets[key] = frozenset(self.get_rows(key))
+        return row_set
+
+
+class _Query(Generic[R]):
+    def __init__(
+        self,
+        index: _RecordIndex[R],
+        keys: Tuple[Hashable, ...] = (),
+        predicates: Tuple[Callable[[R], bool], ...] = (),
+    ):
+        self._index: _RecordIndex[R] = index
+        self._keys: Tuple[Hashable, ...] = keys
+        self._predicates: Tuple[Callable[[R], bool], ...] = predicates
+
+    def attr(self: Q, key: str, value: Any = ...) -> Q:
+        """Select the records with attribute `key`, equal to `value` if it is given. Values are compared along with
+        their type, so `1` does not match `True` or `1.0`, and only string, bool, int, float and bytes values can be
+        selected by value.
+        """
+        if value is ...:
+            return self._select(("attribute", key))
+        if type(value) not in _SCALAR_VALUE_FIELDS.values():
+            raise TypeError(f"Cannot select attribute {key} by a value of type {type(value).__name__}")
+        return self._select(("attribute", key, type(value), value))
+
+    def service(self: Q, service: str) -> Q:
+        """Select the records of the resources with `service.name` `service`."""
+        return self._select(("service", service))
+
+    def where(self: Q, predicate: Callable[[R], bool]) -> Q:
+        """Select the records for which `predicate` is true, evaluated after the indexed selectors."""
+        return type(self)(self._index, self._keys, self._predicates + (predicate,))
+
+    def all(self) -> List[R]:
+        return list(self)
+
+    def first(self) -> Optional[R]:
+        return next(iter(self), None)
+
+    def one(self) -> R:
+        """Return the only matching record, and fail unless exactly one record matches."""
+        matches: List[R] = self.all()
+        if len(matches) != 1:
+            raise AssertionError(f"Expected exactly one match, got {len(matches)}")
+        return matches[0]
+
+    def count(self) -> int:
+        return sum(1 for _ in self)
+
+    def __iter__(self) -> Iterator[R]:
+        records: Sequence[R] = self._index.records
+        if not self._keys:
+            candidates: Iterable[R] = records
+        else:
+            entries: List[Tuple[List[int], Hashable]] = sorted(
+                ((self._index.get_rows(key), key) for key in self._keys), key=lambda entry: len(entry[0])
+            )
+            row_sets: List[FrozenSet[int]] = [self._index.get_row_set(key) for _, key in entries[1:]]
+            candidates = (records[row] for row in entries[0][0] if all(row in row_set for row_set in row_sets))
+        for record in candidates:
+            if all(predicate(record) for predicate in self._predicates):
+                yield record
+
+    def _select(self: Q, key: Hashable) -> Q:
+        return type(self)(self._index, self._keys + (key,), self._predicates)
+
+
+class SpanQuery(_Query[R]):
+    """Query over records of spans, like `ResourceScopeSpan`, in the order they were given."""
+
+    def kind(self, kind: int) -> "SpanQuery[R]":
+        """Select the spans of kind `kind`, like `Span.SPAN_KIND_SERVER`."""
+        return self._select(("kind", kind))
+
+    def name(self, name: str) -> "SpanQuery[R]":
+        return self._select(("name", name))
+
+    def trace_id(self, trace_id: bytes) -> "SpanQuery[R]":
+        return self._select(("trace_id", trace_id))
+
+
+class MetricQuery(_Query[R]):
+    """Query over records of metrics, like `ResourceScopeMetric`, in the order they were given. Attributes are those
+    of the data points: `attr` selects the metrics with at least one data point holding the attribute.
+    """
+
+    def name(self, name: str) -> "MetricQuery[R]":
+        """Select the metrics named `name`, compared case-insensitively."""
+        return self._select(("name", name.lower()))
+
+    def type(self, data_type: str) -> "MetricQuery[R]":
+        """Select the metrics of type `data_type`, as the name of their data field, like "exponential_histogram"."""
+        return self._select(("type", data_type))
+
+
+def query_spans(records: Iterable[R]) -> SpanQuery[R]:
+    """Index the given records of spans, and return a query matching all of them."""
+    index: _RecordIndex[R] = _RecordIndex(list(records))
+    service_names: Dict[int, str] = {}
+    span: Span
+    for row, (resource_spans, _, span) in enumerate(index.records):
+        index.add(row, ("kind", span.kind))
+        index.add(row, ("name", span.name))
+        index.add(row, ("trace_id", span.trace_id))
+        index.add(row, ("service", _get_resource_service_name(service_names, resource_spans)))
+        _add_attributes(index, row, span.attributes)
+    return SpanQuery(index)
+
+
+def query_metrics(records: Iterable[R]) -> MetricQuery[R]:
+    """Index the given records of metrics, and return a query matching all of them."""
+    index: _RecordIndex[R] = _RecordIndex(list(records))
+    service_names: Dict[int, str] = {}
+    metric: Metric
+    for row, (resource_metrics, _, metric) in enumerate(index.records):
+        index.add(row, ("name", metric.name.lower()))
+        index.add(row, ("service", _get_resource_service_name(service_names, resource_metrics)))
+        data_type: Optional[str] = metric.WhichOneof("data")
+        if data_type is None:
+            continue
+        index.add(row, ("type", data_type))
+        for data_point in getattr(metric, data_type).data_points:
+            _add_attributes(index, row, data_point.attributes)
+    return MetricQuery(index)
+
+
+def _add_attributes(index: _RecordIndex, row: int, attributes: Iterable[KeyValue]) -> None:
+    for attribute in attributes:
+        index.add(row, ("attribute", attribute.key))
+        value: AnyValue = attribute.value
+        value_field: Optional[str] = value.WhichOneof("value")
+        if value_field in _SCALAR_VALUE_FIELDS:
+            index.add(row, ("attribute", attribute.key, _SCALAR_VALUE_FIELDS[value_field], getattr(value, value_field)))
+
+
+def _get_resource_service_name(service_names: Dict[int, str], resource_message: Message) -> str:
+    # Interned records share their resource-level message, which the records being indexed keep alive, so the service
+    # name is only looked up once per resource.
+    service_name: Optional[str] = service_names.get(id(resource_message))
+    if service_name is None:
+        service_name = service_names[id(resource_message)] = get_service_name(resource_message.resource.attributes)
+    return service_name
@@ -0,0 +1,79 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+from time import time_ns
+from typing import Awaitable, Callable, Generic, Iterable, List, Type, TypeVar, Union
+
+from google.protobuf.message import Message
+from grpc import Server, ServicerContext, aio, method_handlers_generic_handler, unary_unary_rpc_method_handler
+
+T = TypeVar("T", bound=Message)
+
+_WIRE_TYPE_LENGTH_DELIMITED: int = 2
+
+
+class RawExport(Generic[T]):
+    """Export request kept in the wire format it was received in.
+
+    The request is only parsed when one of its fields is needed, and the parsed message is not cached: the indexes
+    only keep interned copies of its items, and a cached message would keep every stored export in memory twice.
+    """
+
+    __slots__ = ("data", "sequence_number", "received_time_unix_nano", "_request_type")
+
+    def __init__(self, data: bytes, request_type: Type[T], sequence_number: int = 0):
+        self.data: bytes = data
+        self.sequence_number: int = sequence_number
+        self.received_time_unix_nano: int = time_ns()
+        self._request_type: Type[T] = request_type
+
+    def parse(self) -> T:
+        return self._request_type.FromString(self.data)
+
+
+def add_raw_export_handler_to_server(
+    service_name: str,
+    export: Callable[[bytes, ServicerContext], Message],
+    export_async: Callable[[bytes, aio.ServicerContext], Awaitable[Message]],
+    response_type: Type[Message],
+    server: Union[Server, aio.Server],
+) -> None:
+    """Register `export`, or `export_async` on an `aio` server, as the `Export` method of `service_name`, without
+    deserializing the request.
+
+    The generated `add_*Servicer_to_server` functions parse every request on arrival. Registering the handler with
+    an identity deserializer hands the servicer the bytes received on the wire instead.
+
+    Exports are only stored or counted, without blocking, so an `aio` server runs `export_async` on its event loop
+    rather than handing `export` to a thread like it does for the synchronous methods of a servicer.
+    """
+    handler = unary_unary_rpc_method_handler(
+        export_async if isinstance(server, aio.Server) else export,
+        request_deserializer=None,
+        response_serializer=response_type.SerializeToString,
+    )
+    server.add_generic_rpc_handlers((method_handlers_generic_handler(service_name, {"Export": handler}),))
+
+
+def serialize_with_bytes_field(message: Message, field_number: int, values: Iterable[bytes]) -> bytes:
+    """Serialize `message` with `values` appended as the repeated bytes field `field_number`.
+
+    Protobuf parsers accept fields in any order and append repeated fields as they are read, so the result decodes
+    exactly as if `values` had been set on `message`. Encoding the field directly avoids copying every stored buffer
+    into a message only to copy it out again when the message is serialized.
+    """
+    tag: bytes = _encode_varint((field_number << 3) | _WIRE_TYPE_LENGTH_DELIMITED)
+    parts: List[bytes] = [message.SerializeToString()]
+    for value in values:
+        parts.append(tag)
+        parts.append(_encode_varint(len(value)))
+        parts.append(value)
+    return b"".join(parts)
+
+
+def _encode_varint(value: int) -> bytes:
+    encoded: bytearray = bytearray()
+    while value > 0x7F:
+        encoded.append((value & 0x7F) | 0x80)
+        value >>= 7
+    encoded.append(value)
+    return bytes(encoded)
@@ -0,0 +1,16 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""Helpers for the resources telemetry is received with."""
+from typing import Iterable
+
+from opentelemetry.proto.common.v1.common_pb2 import KeyValue
+
+SERVICE_NAME_ATTRIBUTE: str = "service.name"
+
+
+def get_service_name(attributes: Iterable[KeyValue]) -> str:
+    """Return the `service.name` of a resource, given its attributes, or "" if it has none."""
+    for attribute in attributes:
+        if attribute.key == SERVICE_NAME_ATTRIBUTE:
+            return attribute.value.string_value
+    return ""
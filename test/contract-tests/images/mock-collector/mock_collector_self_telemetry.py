@@ -0,0 +1,317 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""Operational metrics of the mock collector itself, served in the Prometheus text format.
+
+They tell whether the mock collector is the bottleneck of a slow test: how many exports and bytes it received, how long
+its Export handlers and other rpcs took, how much it stores, and how many watch streams are open.
+"""
+import inspect
+from bisect import bisect_left
+from collections import defaultdict
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from logging import Logger, getLogger
+from threading import Lock, Thread
+from time import perf_counter
+from typing import Any, AsyncIterator, Awaitable, Callable, DefaultDict, Dict, Iterator, List, Optional, Tuple, Union
+
+from grpc import HandlerCallDetails, RpcMethodHandler, ServerInterceptor, aio
+from mock_collector_capture import Signal
+from mock_collector_export_store import StorageStats
+
+_logger: Logger = getLogger(__name__)
+
+_PROMETHEUS_CONTENT_TYPE: str = "text/plain; version=0.0.4; charset=utf-8"
+# Upper bounds of the latency histogram buckets, in seconds.
+_LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+# Fields of `StorageStats` exposed as metrics, with their metric type and description.
+_STORAGE_METRICS: Tuple[Tuple[str, str, str], ...] = (
+    ("stored_exports", "gauge", "Exports currently stored."),
+    ("stored_bytes", "gauge", "Encoded bytes of the exports currently stored."),
+    ("evicted_exports", "counter", "Exports evicted to stay within the storage budget."),
+    ("evicted_bytes", "counter", "Encoded bytes of the exports evicted to stay within the storage budget."),
+)
+
+StorageStatsSource = Callable[[], StorageStats]
+
+
+class _Histogram:
+    def __init__(self):
+        # One more bucket than bounds, for the observations above the last one.
+        self.bucket_counts: List[int] = [0] * (len(_LATENCY_BUCKETS) + 1)
+        self.sum: float = 0.0
+        self.count: int = 0
+
+    def observe(self, value: float) -> None:
+        self.bucket_counts[bisect_left(_LATENCY_BUCKETS, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class SelfTelemetry:
+    """Thread-safe metrics of the mock collector, rendered in the Prometheus text exposition format.
+
+    Exports are recorded by the collector services, for whichever protocol they were received with. Rpcs are recorded
+    by the interceptor returned by `server_interceptor`, and stored exports are read from the collectors on every
+    scrape.
+    """
+
+    def __init__(self):
+        self._lock: Lock = Lock()
+        self._exports: DefaultDict[Signal, int] = defaultdict(int)
+        self._bytes: DefaultDict[Signal, int] = defaultdict(int)
+        self._export_durations: DefaultDict[Signal, _Histogram] = defaultdict(_Histogram)
+        self._rpc_durations: DefaultDict[str, _Histogram] = defaultdict(_Histogram)
+        self._active_streams: DefaultDict[str, int] = defaultdict(int)
+        self._storage_sources: Dict[Signal, StorageStatsSource] = {}
+
+    def add_storage_source(self, signal: Signal, source: StorageStatsSource) -> None:
+        self._storage_sources[signal] = source
+
+    def record_export(self, signal: Signal, size: int, duration: float) -> None:
+        with self._lock:
+            self._exports[signal] += 1
+            self._bytes[signal] += size
+            self._export_durations[signal].observe(duration)
+
+    def record_rpc(self, method: str, duration: float) -> None:
+        with self._lock:
+            self._rpc_durations[method].observe(duration)
+
+    def stream_started(self, method: str) -> None:
+        with self._lock:
+            self._active_streams[method] += 1
+
+    def stream_ended(self, method: str) -> None:
+        with self._lock:
+            self._active_streams[method] -= 1
+
+    def server_interceptor(self, asynchronous: bool = False) -> Union[ServerInterceptor, aio.ServerInterceptor]:
+        """Return an interceptor recording the rpcs of a `grpc.Server`, or of a `grpc.aio.Server` if `asynchronous`."""
+        return _AsyncTelemetryInterceptor(self) if asynchronous else _TelemetryInterceptor(self)
+
+    def render(self) -> str:
+        storage: Dict[Signal, StorageStats] = {signal: source() for signal, source in self._storage_sources.items()}
+        lines: List[str] = []
+        with self._lock:
+            _add_metric(
+                lines,
+                "mock_collector_exports_received_total",
+                "counter",
+                "Exports received.",
+                [({"signal": _label(signal)}, count) for signal, count in self._exports.items()],
+            )
+            _add_metric(
+                lines,
+                "mock_collector_bytes_received_total",
+                "counter",
+                "Encoded bytes of the exports received.",
+                [({"signal": _label(signal)}, count) for signal, count in self._bytes.items()],
+            )
+            _add_histogram(
+                lines,
+                "mock_collector_export_duration_seconds",
+                "Time spent by the Export handlers.",
+                [({"signal": _label(signal)}, histogram) for signal, histogram in self._export_durations.items()],
+            )
+            _add_histogram(
+                lines,
+                "mock_collector_rpc_duration_seconds",
+                "Time spent serving unary rpcs, Export included.",
+                [({"method": method}, histogram) for method, histogram in self._rpc_durations.items()],
+            )
+            _add_metric(
+                lines,
+                "mock_collector_active_streams",
+                "gauge",
+                "Streaming rpcs in progress.",
+                [({"method": method}, count) for method, count in self._active_streams.items()],
+            )
+        for field, metric_type, description in _STORAGE_METRICS:
+            _add_metric(
+                lines,
+                f"mock_collector_{field}_total" if metric_type == "counter" else f"mock_collector_{field}",
+                metric_type,
+                description,
+                [({"signal": _label(signal)}, getattr(stats, field)) for signal, stats in storage.items()],
+            )
+        return "\n".join(lines) + "\n"
+
+
+class SelfTelemetryServer:
+    """Serves the metrics of a `SelfTelemetry` on `/metrics`, from a background thread."""
+
+    def __init__(self, port: int, telemetry: SelfTelemetry):
+        self._server: _SelfTelemetryHttpServer = _SelfTelemetryHttpServer(("0.0.0.0", port), telemetry)
+        self._thread: Thread = Thread(target=self._server.serve_forever, name="self-telemetry", daemon=True)
+
+    @property
+    def port(self) -> int:
+        return self._server.server_address[1]
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class _SelfTelemetryHttpServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, server_address: Tuple[str, int], telemetry: SelfTelemetry):
+        super().__init__(server_address, _SelfTelemetryRequestHandler)
+        self.telemetry: SelfTelemetry = telemetry
+
+
+class _SelfTelemetryRequestHandler(BaseHTTPRequestHandler):
+    server: _SelfTelemetryHttpServer
+
+    # pylint: disable=invalid-name
+    def do_GET(self) -> None:
+        if self.path.split("?", 1)[0] != "/metrics":
+            self.send_error(HTTPStatus.NOT_FOUND)
+            return
+        body: bytes = self.server.telemetry.render().encode()
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", _PROMETHEUS_CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:  # pylint: disable=redefined-builtin
+        # Every scrape would otherwise be logged to stderr.
+        _logger.debug(format, *args)
+
+
+class _TelemetryInterceptor(ServerInterceptor):
+    def __init__(self, telemetry: SelfTelemetry):
+        self._telemetry: SelfTelemetry = telemetry
+
+    def intercept_service(
+        self,
+        continuation: Callable[[HandlerCallDetails], Optional[RpcMethodHandler]],
+        handler_call_details: HandlerCallDetails,
+    ) -> Optional[RpcMethodHandler]:
+        return _instrument(self._telemetry, handler_call_details.method, continuation(handler_call_details))
+
+
+class _AsyncTelemetryInterceptor(aio.ServerInterceptor):
+    def __init__(self, telemetry: SelfTelemetry):
+        self._telemetry: SelfTelemetry = telemetry
+
+    async def intercept_service(
+        self,
+        continuation: Callable[[HandlerCallDetails], Awaitable[Optional[RpcMethodHandler]]],
+        handler_call_details: HandlerCallDetails,
+    ) -> Optional[RpcMethodHandler]:
+        return _instrument(self._telemetry, handler_call_details.method, await continuation(handler_call_details))
+
+
+def _instrument(telemetry: SelfTelemetry, path: str, handler: Optional[RpcMethodHandler]) -> Optional[RpcMethodHandler]:
+    # Handlers are wrapped in the same kind of callable they are, so that an aio server still runs coroutines on its
+    # event loop and synchronous methods on its thread pool.
+    if handler is None:
+        return None
+    method: str = _get_method_name(path)
+    if handler.unary_unary is not None:
+        behavior: Callable = handler.unary_unary
+        if inspect.iscoroutinefunction(behavior):
+
+            async def timed_coroutine(request: Any, context: Any) -> Any:
+                start: float = perf_counter()
+                try:
+                    return await behavior(request, context)
+                finally:
+                    telemetry.record_rpc(method, perf_counter() - start)
+
+            return handler._replace(unary_unary=timed_coroutine)
+
+        def timed(request: Any, context: Any) -> Any:
+            start: float = perf_counter()
+            try:
+                return behavior(request, context)
+            finally:
+                telemetry.record_rpc(method, perf_counter() - start)
+
+        return handler._replace(unary_unary=timed)
+    if handler.unary_stream is not None:
+        stream: Callable = handler.unary_stream
+        if inspect.isasyncgenfunction(stream):
+
+            async def counted_async_stream(request: Any, context: Any) -> AsyncIterator[Any]:
+                telemetry.stream_started(method)
+                try:
+                    async for response in stream(request, context):
+                        yield response
+                finally:
+                    telemetry.stream_ended(method)
+
+            return handler._replace(unary_stream=counted_async_stream)
+
+        def counted_stream(request: Any, context: Any) -> Iterator[Any]:
+            telemetry.stream_started(method)
+            try:
+                yield from stream(request, context)
+            finally:
+                telemetry.stream_ended(method)
+
+        return handler._replace(unary_stream=counted_stream)
+    return handler
+
+
+def _get_method_name(path: str) -> str:
+    # "/opentelemetry.proto.collector.trace.v1.TraceService/Export" is recorded as "TraceService/Export".
+    service, _, method = path.lstrip("/").partition("/")
+    return f"{service.rsplit('.', 1)[-1]}/{method}"
+
+
+def _label(signal: Signal) -> str:
+    return signal.name.lower()
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    return ",".join(f'{key}="{value}"' for key, value in labels.items())
+
+
+def _add_metric(
+    lines: List[str], name: str, metric_type: str, description: str, samples: List[Tuple[Dict[str, str], float]]
+) -> None:
+    lines.append(f"# HELP {name} {description}")
+    lines.append(f"# TYPE {name} {metric_type}")
+    for labels, value in samples:
+        lines.append(f"{name}{{{_format_labels(labels)}}} {value}")
+
+
+def _add_histogram(
+    lines: List[str], name: str, description: str, samples: List[Tuple[Dict[str, str], _Histogram]]
+) -> None:
+    lines.append(f"# HELP {name} {description}")
+    lines.append(f"# TYPE {name} histogram")
+    for labels, histogram in samples:
+        cumulative: int = 0
+        for bound, count in zip((*_LATENCY_BUCKETS, float("inf")), histogram.bucket_counts):
+            cumulative += count
+            bound_label: str = "+Inf" if bound == float("inf") else repr(bound)
+            lines.append(f'{name}_bucket{{{_format_labels({**labels, "le": bound_label})}}} {cumulative}')
+        lines.append(f"{name}_sum{{{_format_labels(labels)}}} {histogram.sum}")
+        lines.append(f"{name}_count{{{_format_labels(labels)}}} {histogram.count}")
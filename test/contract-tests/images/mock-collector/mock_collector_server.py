@@ -1,35 +1,226 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 # SPDX-License-Identifier: Apache-2.0
+import asyncio
 import atexit
+import os
 from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
 
-from grpc import server
+import grpc
+from grpc import aio
+from mock_collector_capture import CaptureWriter, Signal
+from mock_collector_duplicate_spans import DuplicateSpanFilter
+from mock_collector_export_store import SharedSequence
+from mock_collector_faults import FaultInjector
+from mock_collector_http_receiver import OtlpHttpReceiver
+from mock_collector_logs_service import MockCollectorLogsService
 from mock_collector_metrics_service import MockCollectorMetricsService
-from mock_collector_service import MockCollectorService
-from mock_collector_service_pb2_grpc import add_MockCollectorServiceServicer_to_server
+from mock_collector_self_telemetry import SelfTelemetry, SelfTelemetryServer
+from mock_collector_service import AsyncMockCollectorService, MockCollectorService
+from mock_collector_soak_stats import SoakStats
 from mock_collector_trace_service import MockCollectorTraceService
+from mock_collector_wire_stats import WireStats
+from mock_collector_workers import AsyncFanOutMockCollectorService, FanOutMockCollectorService, Worker, run_workers
 
-from opentelemetry.proto.collector.metrics.v1.metrics_service_pb2_grpc import add_MetricsServiceServicer_to_server
-from opentelemetry.proto.collector.trace.v1.trace_service_pb2_grpc import add_TraceServiceServicer_to_server
+# Port the OTLP/gRPC services and the mock collector service are served on.
+_PORT_ENV: str = "MOCK_COLLECTOR_PORT"
+_DEFAULT_PORT: int = 4315
+# Port OTLP/HTTP exports are received on.
+_HTTP_PORT_ENV: str = "MOCK_COLLECTOR_HTTP_PORT"
+_DEFAULT_HTTP_PORT: int = 4318
+# Port the operational metrics of the mock collector are served on, in the Prometheus text format, at `/metrics`.
+_TELEMETRY_PORT_ENV: str = "MOCK_COLLECTOR_TELEMETRY_PORT"
+_DEFAULT_TELEMETRY_PORT: int = 9464
+# Set to "aio" to serve from an asyncio server instead of a thread pool, which scales to many more concurrent exporters
+# and watch or wait_for calls.
+_SERVER_ENV: str = "MOCK_COLLECTOR_SERVER"
+_AIO_SERVER: str = "aio"
+
+# Number of worker processes to serve from, all bound to the same ports, for ingest throughput to scale with cores.
+# Unset, 0 or 1 serves from a single process.
+_WORKERS_ENV: str = "MOCK_COLLECTOR_WORKERS"
+
+# Set to "true" to only count the telemetry received, and drop it instead of storing it.
+_SOAK_MODE_ENV: str = "MOCK_COLLECTOR_SOAK_MODE"
+
+# Set to "true" to record the compressed and uncompressed size of every export, per export, service and attribute key.
+_WIRE_STATS_ENV: str = "MOCK_COLLECTOR_WIRE_STATS"
+
+# Set to "true" to store spans received more than once, by trace id and span id, only once, and count the duplicates.
+_DEDUPLICATE_SPANS_ENV: str = "MOCK_COLLECTOR_DEDUPLICATE_SPANS"
+
+# Path of a file to append every export received to, for post-mortem analysis with `CaptureReader`. Unset disables it.
+_CAPTURE_FILE_ENV: str = "MOCK_COLLECTOR_CAPTURE_FILE"
+
+# Storage budgets of each signal, evicting the oldest exports beyond them. Unset or 0 is unbounded.
+_TRACES_MAX_EXPORTS_ENV: str = "MOCK_COLLECTOR_TRACES_MAX_EXPORTS"
+_TRACES_MAX_BYTES_ENV: str = "MOCK_COLLECTOR_TRACES_MAX_BYTES"
+_METRICS_MAX_EXPORTS_ENV: str = "MOCK_COLLECTOR_METRICS_MAX_EXPORTS"
+_METRICS_MAX_BYTES_ENV: str = "MOCK_COLLECTOR_METRICS_MAX_BYTES"
+_LOGS_MAX_EXPORTS_ENV: str = "MOCK_COLLECTOR_LOGS_MAX_EXPORTS"
+_LOGS_MAX_BYTES_ENV: str = "MOCK_COLLECTOR_LOGS_MAX_BYTES"
 
 
 def main() -> None:
-    mock_collector_server: server = server(thread_pool=ThreadPoolExecutor(max_workers=10))
-    mock_collector_server.add_insecure_port("0.0.0.0:4315")
+    capture: Optional[CaptureWriter] = None
+    if os.environ.get(_CAPTURE_FILE_ENV):
+        # Workers share the capture file, which every export is appended to with a single write.
+        capture = CaptureWriter(os.environ[_CAPTURE_FILE_ENV])
+        atexit.register(capture.close)
+    workers: int = _get_int_env(_WORKERS_ENV)
+    if workers > 1:
+        run_workers(workers, lambda worker: _run(capture, worker))
+    else:
+        _run(capture)
+
+
+def _run(capture: Optional[CaptureWriter], worker: Optional[Worker] = None) -> None:
+    sequences: Dict[Signal, Optional[SharedSequence]] = {
+        signal: worker.sequences[signal] if worker is not None else None for signal in Signal
+    }
+    soak_stats: Optional[SoakStats] = SoakStats() if os.environ.get(_SOAK_MODE_ENV, "").lower() == "true" else None
+    telemetry: SelfTelemetry = SelfTelemetry()
+    faults: FaultInjector = FaultInjector()
+    wire_stats: Optional[WireStats] = WireStats() if os.environ.get(_WIRE_STATS_ENV, "").lower() == "true" else None
+    duplicate_spans: Optional[DuplicateSpanFilter] = None
+    if os.environ.get(_DEDUPLICATE_SPANS_ENV, "").lower() == "true":
+        duplicate_spans = DuplicateSpanFilter()
+    trace_collector: MockCollectorTraceService = MockCollectorTraceService(
+        _get_int_env(_TRACES_MAX_EXPORTS_ENV),
+        _get_int_env(_TRACES_MAX_BYTES_ENV),
+        soak_stats,
+        capture,
+        telemetry,
+        faults,
+        wire_stats,
+        sequences[Signal.TRACES],
+        duplicate_spans,
+    )
+    metrics_collector: MockCollectorMetricsService = MockCollectorMetricsService(
+        _get_int_env(_METRICS_MAX_EXPORTS_ENV),
+        _get_int_env(_METRICS_MAX_BYTES_ENV),
+        soak_stats,
+        capture,
+        telemetry,
+        faults,
+        wire_stats,
+        sequences[Signal.METRICS],
+    )
+    logs_collector: MockCollectorLogsService = MockCollectorLogsService(
+        _get_int_env(_LOGS_MAX_EXPORTS_ENV),
+        _get_int_env(_LOGS_MAX_BYTES_ENV),
+        soak_stats,
+        capture,
+        telemetry,
+        faults,
+        wire_stats,
+        sequences[Signal.LOGS],
+    )
+    telemetry.add_storage_source(Signal.TRACES, trace_collector.get_storage_stats)
+    telemetry.add_storage_source(Signal.METRICS, metrics_collector.get_storage_stats)
+    telemetry.add_storage_source(Signal.LOGS, logs_collector.get_storage_stats)
+    # Each worker serves its own telemetry, on the port after that of the previous worker.
+    telemetry_port: int = _get_int_env(_TELEMETRY_PORT_ENV) or _DEFAULT_TELEMETRY_PORT
+    SelfTelemetryServer(telemetry_port + (worker.index if worker is not None else 0), telemetry).start()
+    port: int = _get_int_env(_PORT_ENV) or _DEFAULT_PORT
+    OtlpHttpReceiver(
+        _get_int_env(_HTTP_PORT_ENV) or _DEFAULT_HTTP_PORT,
+        trace_collector,
+        metrics_collector,
+        logs_collector,
+        reuse_port=worker is not None,
+    ).start()
+
+    if os.environ.get(_SERVER_ENV, "").lower() == _AIO_SERVER:
+        async_mock_collector: AsyncMockCollectorService = AsyncMockCollectorService(
+            trace_collector, metrics_collector, logs_collector, soak_stats, faults, wire_stats, duplicate_spans
+        )
+        asyncio.run(
+            _serve_aio(
+                port, trace_collector, metrics_collector, logs_collector, async_mock_collector, telemetry, worker
+            )
+        )
+    else:
+        mock_collector: MockCollectorService = MockCollectorService(
+            trace_collector, metrics_collector, logs_collector, soak_stats, faults, wire_stats, duplicate_spans
+        )
+        _serve(port, trace_collector, metrics_collector, logs_collector, mock_collector, telemetry, worker)
 
-    trace_collector: MockCollectorTraceService = MockCollectorTraceService()
-    metrics_collector: MockCollectorMetricsService = MockCollectorMetricsService()
-    mock_collector: MockCollectorService = MockCollectorService(trace_collector, metrics_collector)
 
-    add_TraceServiceServicer_to_server(trace_collector, mock_collector_server)
-    add_MetricsServiceServicer_to_server(metrics_collector, mock_collector_server)
-    add_MockCollectorServiceServicer_to_server(mock_collector, mock_collector_server)
+def _serve(
+    port: int,
+    trace_collector: MockCollectorTraceService,
+    metrics_collector: MockCollectorMetricsService,
+    logs_collector: MockCollectorLogsService,
+    mock_collector: MockCollectorService,
+    telemetry: SelfTelemetry,
+    worker: Optional[Worker] = None,
+) -> None:
+    mock_collector_server: grpc.Server = grpc.server(
+        thread_pool=ThreadPoolExecutor(max_workers=10), interceptors=(telemetry.server_interceptor(),)
+    )
+    mock_collector_server.add_insecure_port(f"0.0.0.0:{port}")
+
+    trace_collector.add_to_server(mock_collector_server)
+    metrics_collector.add_to_server(mock_collector_server)
+    logs_collector.add_to_server(mock_collector_server)
+    if worker is None:
+        mock_collector.add_to_server(mock_collector_server)
+    else:
+        # The mock collector service of this worker is only served to the fan-out service of every worker.
+        FanOutMockCollectorService(worker).add_to_server(mock_collector_server)
+        worker_server: grpc.Server = grpc.server(thread_pool=ThreadPoolExecutor(max_workers=10))
+        worker_server.add_insecure_port(worker.address)
+        mock_collector.add_to_server(worker_server)
+        worker_server.start()
+        atexit.register(worker_server.stop, None)
 
     mock_collector_server.start()
     atexit.register(mock_collector_server.stop, None)
-    print("Ready")
+    _ready(worker)
     mock_collector_server.wait_for_termination(None)
 
 
+async def _serve_aio(
+    port: int,
+    trace_collector: MockCollectorTraceService,
+    metrics_collector: MockCollectorMetricsService,
+    logs_collector: MockCollectorLogsService,
+    mock_collector: AsyncMockCollectorService,
+    telemetry: SelfTelemetry,
+    worker: Optional[Worker] = None,
+) -> None:
+    mock_collector_server: aio.Server = aio.server(interceptors=(telemetry.server_interceptor(asynchronous=True),))
+    mock_collector_server.add_insecure_port(f"0.0.0.0:{port}")
+
+    trace_collector.add_to_server(mock_collector_server)
+    metrics_collector.add_to_server(mock_collector_server)
+    logs_collector.add_to_server(mock_collector_server)
+    if worker is None:
+        mock_collector.add_to_server(mock_collector_server)
+    else:
+        AsyncFanOutMockCollectorService(worker).add_to_server(mock_collector_server)
+        worker_server: aio.Server = aio.server()
+        worker_server.add_insecure_port(worker.address)
+        mock_collector.add_to_server(worker_server)
+        await worker_server.start()
+
+    await mock_collector_server.start()
+    _ready(worker)
+    await mock_collector_server.wait_for_termination()
+
+
+def _ready(worker: Optional[Worker]) -> None:
+    # A multi-process mock collector is ready once all of its workers are, which its parent process reports.
+    if worker is None:
+        print("Ready")
+    else:
+        worker.ready()
+
+
+def _get_int_env(name: str) -> int:
+    return int(os.environ.get(name) or 0)
+
+
 if __name__ == "__main__":
     main()
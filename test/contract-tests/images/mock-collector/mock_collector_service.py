@@ -1,52 +1,500 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 # SPDX-License-Identifier: Apache-2.0
-from typing import List
+import asyncio
+from time import time_ns
+from typing import AsyncIterator, Callable, Dict, Iterator, List, Optional, Type, Union
 
-from grpc import ServicerContext
+from google.protobuf.message import Message
+from grpc import (
+    Server,
+    ServicerContext,
+    StatusCode,
+    aio,
+    method_handlers_generic_handler,
+    unary_stream_rpc_method_handler,
+    unary_unary_rpc_method_handler,
+)
+from mock_collector_capture import Signal
+from mock_collector_duplicate_spans import DuplicateSpanFilter
+from mock_collector_export_store import ExportSlice, StorageStats
+from mock_collector_faults import FaultInjector
+from mock_collector_logs_service import MockCollectorLogsService
 from mock_collector_metrics_service import MockCollectorMetricsService
+from mock_collector_predicates import (
+    LogRecordPredicate,
+    MetricMatch,
+    SpanMatch,
+    SpanPredicate,
+    log_records_to_export,
+    metrics_to_export,
+    spans_to_export,
+)
+from mock_collector_raw_export import serialize_with_bytes_field
 from mock_collector_service_pb2 import (
+    DESCRIPTOR,
+    AttributeSize,
     ClearRequest,
     ClearResponse,
+    ConfigureFaultsRequest,
+    ConfigureFaultsResponse,
+    DuplicateSpanCount,
+    ExportSize,
+    FaultConfig,
+    GetDuplicateSpanStatsRequest,
+    GetDuplicateSpanStatsResponse,
+    GetFaultStatsRequest,
+    GetFaultStatsResponse,
+    GetLogsRequest,
+    GetLogsResponse,
     GetMetricsRequest,
     GetMetricsResponse,
+    GetSoakStatsRequest,
+    GetSoakStatsResponse,
+    GetStorageStatsRequest,
+    GetStorageStatsResponse,
     GetTracesRequest,
     GetTracesResponse,
+    GetTraceTreeRequest,
+    GetTraceTreeResponse,
+    GetWireStatsRequest,
+    GetWireStatsResponse,
+    LogRecordCount,
+    MetricPointCount,
+    QueryLogsRequest,
+    QueryLogsResponse,
+    QuerySpansRequest,
+    QuerySpansResponse,
+    ServiceSize,
+    SignalCounts,
+    SpanCount,
+    StorageStats as StorageStatsMessage,
+    WaitForMetricsRequest,
+    WaitForMetricsResponse,
+    WaitForSpansRequest,
+    WaitForSpansResponse,
 )
-from mock_collector_service_pb2_grpc import MockCollectorServiceServicer
+from mock_collector_service_pb2_grpc import MockCollectorServiceServicer, add_MockCollectorServiceServicer_to_server
+from mock_collector_soak_stats import SoakStats, SoakStatsSnapshot
 from mock_collector_trace_service import MockCollectorTraceService
+from mock_collector_trace_tree import to_trace_tree_response
+from mock_collector_wire_stats import WireStats, WireStatsSnapshot
 from typing_extensions import override
 
-from opentelemetry.proto.collector.metrics.v1.metrics_service_pb2 import ExportMetricsServiceRequest
-from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import ExportTraceServiceRequest
+# How often an idle watch stream checks whether its client is still connected.
+_WATCH_IDLE_TIMEOUT_SEC: float = 1.0
+# Time left to send the response of a wait_for rpc before the deadline of the call.
+_DEADLINE_MARGIN_SEC: float = 0.1
+
+_Collector = Union[MockCollectorTraceService, MockCollectorMetricsService, MockCollectorLogsService]
 
 
 class MockCollectorService(MockCollectorServiceServicer):
-    """Implements clear, get_traces, and get_metrics for the mock collector.
+    """Implements the clear, get, watch, wait_for, query and stats rpcs for the mock collector.
 
-    Relies on metrics and trace collector services to collect the telemetry.
+    Relies on trace, metrics and logs collector services to collect the telemetry, on their `SoakStats` in soak mode,
+    on their `FaultInjector` for the fault rpcs, on their `WireStats` for the wire stats rpc, and on the
+    `DuplicateSpanFilter` of the trace collector for the duplicate span stats rpc.
     """
 
-    def __init__(self, trace_collector: MockCollectorTraceService, metrics_collector: MockCollectorMetricsService):
+    def __init__(
+        self,
+        trace_collector: MockCollectorTraceService,
+        metrics_collector: MockCollectorMetricsService,
+        logs_collector: MockCollectorLogsService,
+        soak_stats: Optional[SoakStats] = None,
+        faults: Optional[FaultInjector] = None,
+        wire_stats: Optional[WireStats] = None,
+        duplicate_spans: Optional[DuplicateSpanFilter] = None,
+    ):
         super().__init__()
         self.trace_collector: MockCollectorTraceService = trace_collector
         self.metrics_collector: MockCollectorMetricsService = metrics_collector
+        self.logs_collector: MockCollectorLogsService = logs_collector
+        self.soak_stats: Optional[SoakStats] = soak_stats
+        self.faults: Optional[FaultInjector] = faults
+        self.wire_stats: Optional[WireStats] = wire_stats
+        self.duplicate_spans: Optional[DuplicateSpanFilter] = duplicate_spans
+
+    def add_to_server(self, server: Union[Server, aio.Server]) -> None:
+        # The get and watch methods return responses that are already serialized. Their handlers are registered ahead
+        # of the generated ones, which take precedence for every other method.
+        raw_response_handlers = {
+            "get_traces": unary_unary_rpc_method_handler(
+                self.get_traces, request_deserializer=GetTracesRequest.FromString, response_serializer=None
+            ),
+            "get_metrics": unary_unary_rpc_method_handler(
+                self.get_metrics, request_deserializer=GetMetricsRequest.FromString, response_serializer=None
+            ),
+            "get_logs": unary_unary_rpc_method_handler(
+                self.get_logs, request_deserializer=GetLogsRequest.FromString, response_serializer=None
+            ),
+            "watch_traces": unary_stream_rpc_method_handler(
+                self.watch_traces, request_deserializer=GetTracesRequest.FromString, response_serializer=None
+            ),
+            "watch_metrics": unary_stream_rpc_method_handler(
+                self.watch_metrics, request_deserializer=GetMetricsRequest.FromString, response_serializer=None
+            ),
+            "watch_logs": unary_stream_rpc_method_handler(
+                self.watch_logs, request_deserializer=GetLogsRequest.FromString, response_serializer=None
+            ),
+        }
+        service_name: str = DESCRIPTOR.services_by_name["MockCollectorService"].full_name
+        server.add_generic_rpc_handlers((method_handlers_generic_handler(service_name, raw_response_handlers),))
+        add_MockCollectorServiceServicer_to_server(self, server)
 
     @override
     def clear(self, request: ClearRequest, context: ServicerContext) -> ClearResponse:
-        self.trace_collector.clear_requests()
-        self.metrics_collector.clear_requests()
-        return ClearResponse()
+        traces_cursor: int = self.trace_collector.clear_requests(request.traces_cursor)
+        metrics_cursor: int = self.metrics_collector.clear_requests(request.metrics_cursor)
+        logs_cursor: int = self.logs_collector.clear_requests(request.logs_cursor)
+        if self.soak_stats is not None:
+            self.soak_stats.reset()
+        if self.wire_stats is not None:
+            self.wire_stats.reset()
+        if self.duplicate_spans is not None:
+            self.duplicate_spans.reset()
+        return ClearResponse(traces_cursor=traces_cursor, metrics_cursor=metrics_cursor, logs_cursor=logs_cursor)
+
+    @override
+    def get_traces(self, request: GetTracesRequest, context: ServicerContext) -> bytes:
+        """Returns a serialized `GetTracesResponse` built from the stored export buffers, without re-encoding them."""
+        exports: ExportSlice = self.trace_collector.get_requests(request.since)
+        return _serialize_exports(GetTracesResponse, GetTracesResponse.TRACES_FIELD_NUMBER, exports)
+
+    @override
+    def get_metrics(self, request: GetMetricsRequest, context: ServicerContext) -> bytes:
+        """Returns a serialized `GetMetricsResponse` built from the stored export buffers, without re-encoding them."""
+        exports: ExportSlice = self.metrics_collector.get_requests(request.since)
+        return _serialize_exports(GetMetricsResponse, GetMetricsResponse.METRICS_FIELD_NUMBER, exports)
+
+    @override
+    def get_logs(self, request: GetLogsRequest, context: ServicerContext) -> bytes:
+        """Returns a serialized `GetLogsResponse` built from the stored export buffers, without re-encoding them."""
+        exports: ExportSlice = self.logs_collector.get_requests(request.since)
+        return _serialize_exports(GetLogsResponse, GetLogsResponse.LOGS_FIELD_NUMBER, exports)
+
+    @override
+    def watch_traces(self, request: GetTracesRequest, context: ServicerContext) -> Iterator[bytes]:
+        """Streams serialized `GetTracesResponse`s, pushing each export as soon as it is received."""
+        return _watch_exports(
+            self.trace_collector, GetTracesResponse, GetTracesResponse.TRACES_FIELD_NUMBER, request.since, context
+        )
+
+    @override
+    def watch_metrics(self, request: GetMetricsRequest, context: ServicerContext) -> Iterator[bytes]:
+        """Streams serialized `GetMetricsResponse`s, pushing each export as soon as it is received."""
+        return _watch_exports(
+            self.metrics_collector, GetMetricsResponse, GetMetricsResponse.METRICS_FIELD_NUMBER, request.since, context
+        )
+
+    @override
+    def watch_logs(self, request: GetLogsRequest, context: ServicerContext) -> Iterator[bytes]:
+        """Streams serialized `GetLogsResponse`s, pushing each export as soon as it is received."""
+        return _watch_exports(
+            self.logs_collector, GetLogsResponse, GetLogsResponse.LOGS_FIELD_NUMBER, request.since, context
+        )
+
+    @override
+    def wait_for_spans(self, request: WaitForSpansRequest, context: ServicerContext) -> WaitForSpansResponse:
+        predicate: SpanPredicate = SpanPredicate(request.name, request.kind, dict(request.attributes))
+        satisfied, matches = self.trace_collector.wait_for_spans(
+            request.since, predicate, request.min_count, _get_wait_timeout(request.timeout_millis, context)
+        )
+        return _to_wait_for_spans_response(satisfied, matches)
+
+    @override
+    def wait_for_metrics(self, request: WaitForMetricsRequest, context: ServicerContext) -> WaitForMetricsResponse:
+        satisfied, matches = self.metrics_collector.wait_for_metrics(
+            request.since, request.names, _get_wait_timeout(request.timeout_millis, context)
+        )
+        return _to_wait_for_metrics_response(satisfied, matches)
+
+    @override
+    def query_spans(self, request: QuerySpansRequest, context: ServicerContext) -> QuerySpansResponse:
+        predicate: SpanPredicate = SpanPredicate(
+            request.name, request.kind, dict(request.attributes), request.trace_id, request.span_id
+        )
+        matches, cursor = self.trace_collector.query_spans(predicate, request.limit)
+        traces: List[bytes] = [spans_to_export(matches).SerializeToString()] if matches else []
+        return QuerySpansResponse(traces=traces, cursor=cursor)
+
+    @override
+    def query_logs(self, request: QueryLogsRequest, context: ServicerContext) -> QueryLogsResponse:
+        predicate: LogRecordPredicate = LogRecordPredicate(
+            request.trace_id, request.span_id, request.severity_text, request.body, dict(request.attributes)
+        )
+        matches, cursor = self.logs_collector.query_logs(predicate, request.limit)
+        logs: List[bytes] = [log_records_to_export(matches).SerializeToString()] if matches else []
+        return QueryLogsResponse(logs=logs, cursor=cursor)
+
+    @override
+    def get_trace_tree(self, request: GetTraceTreeRequest, context: ServicerContext) -> GetTraceTreeResponse:
+        return to_trace_tree_response(self.trace_collector.get_trace_tree(request.trace_id))
+
+    @override
+    def get_storage_stats(self, request: GetStorageStatsRequest, context: ServicerContext) -> GetStorageStatsResponse:
+        return GetStorageStatsResponse(
+            traces=_to_storage_stats_message(self.trace_collector.get_storage_stats()),
+            metrics=_to_storage_stats_message(self.metrics_collector.get_storage_stats()),
+            logs=_to_storage_stats_message(self.logs_collector.get_storage_stats()),
+        )
+
+    @override
+    def get_soak_stats(self, request: GetSoakStatsRequest, context: ServicerContext) -> GetSoakStatsResponse:
+        if self.soak_stats is None:
+            context.abort(StatusCode.FAILED_PRECONDITION, "The mock collector is not in soak mode")
+        snapshot: SoakStatsSnapshot = self.soak_stats.get_snapshot()
+        return GetSoakStatsResponse(
+            traces=SignalCounts(exports=snapshot.traces.exports, bytes=snapshot.traces.bytes),
+            metrics=SignalCounts(exports=snapshot.metrics.exports, bytes=snapshot.metrics.bytes),
+            span_counts=[
+                SpanCount(service_name=service_name, name=name, kind=kind, count=count)
+                for (service_name, name, kind), count in snapshot.span_counts.items()
+            ],
+            metric_point_counts=[
+                MetricPointCount(name=name, count=count) for name, count in snapshot.metric_point_counts.items()
+            ],
+            elapsed_seconds=snapshot.elapsed_seconds,
+            exports_per_second=snapshot.exports_per_second,
+            logs=SignalCounts(exports=snapshot.logs.exports, bytes=snapshot.logs.bytes),
+            log_record_counts=[
+                LogRecordCount(
+                    service_name=service_name,
+                    count=count,
+                    correlated_count=snapshot.correlated_log_record_counts[service_name],
+                )
+                for service_name, count in snapshot.log_record_counts.items()
+            ],
+        )
+
+    @override
+    def configure_faults(self, request: ConfigureFaultsRequest, context: ServicerContext) -> ConfigureFaultsResponse:
+        if self.faults is None:
+            context.abort(StatusCode.FAILED_PRECONDITION, "The mock collector does not inject faults")
+        configs: Dict[Signal, FaultConfig] = {
+            signal: getattr(request, signal.name.lower()) for signal in Signal if request.HasField(signal.name.lower())
+        }
+        try:
+            self.faults.configure(configs, request.seed)
+        except ValueError as error:
+            context.abort(StatusCode.INVALID_ARGUMENT, str(error))
+        return ConfigureFaultsResponse()
 
     @override
-    def get_traces(self, request: GetTracesRequest, context: ServicerContext) -> GetTracesResponse:
-        trace_requests: List[ExportTraceServiceRequest] = self.trace_collector.get_requests()
-        traces: List[bytes] = list(map(ExportTraceServiceRequest.SerializeToString, trace_requests))
-        response: GetTracesResponse = GetTracesResponse(traces=traces)
-        return response
+    def get_fault_stats(self, request: GetFaultStatsRequest, context: ServicerContext) -> GetFaultStatsResponse:
+        if self.faults is None:
+            context.abort(StatusCode.FAILED_PRECONDITION, "The mock collector does not inject faults")
+        return GetFaultStatsResponse(
+            traces=self.faults.get_stats(Signal.TRACES),
+            metrics=self.faults.get_stats(Signal.METRICS),
+            logs=self.faults.get_stats(Signal.LOGS),
+        )
 
     @override
-    def get_metrics(self, request: GetMetricsRequest, context: ServicerContext) -> GetMetricsResponse:
-        metric_requests: List[ExportMetricsServiceRequest] = self.metrics_collector.get_requests()
-        metrics: List[bytes] = list(map(ExportTraceServiceRequest.SerializeToString, metric_requests))
-        response: GetMetricsResponse = GetMetricsResponse(metrics=metrics)
-        return response
+    def get_wire_stats(self, request: GetWireStatsRequest, context: ServicerContext) -> GetWireStatsResponse:
+        if self.wire_stats is None:
+            context.abort(StatusCode.FAILED_PRECONDITION, "The mock collector does not record wire stats")
+        snapshot: WireStatsSnapshot = self.wire_stats.get_snapshot()
+        return GetWireStatsResponse(
+            exports=[
+                ExportSize(
+                    signal=export.signal.name.lower(),
+                    received_time_unix_nano=export.received_time_unix_nano,
+                    protocol=export.protocol,
+                    content_encoding=export.content_encoding,
+                    uncompressed_bytes=export.uncompressed_bytes,
+                    compressed_bytes=export.compressed_bytes,
+                    estimated_compressed_bytes=export.estimated_compressed_bytes,
+                    service_names=export.service_names,
+                )
+                for export in snapshot.exports
+            ],
+            services=[
+                ServiceSize(
+                    signal=signal.name.lower(),
+                    service_name=service_name,
+                    exports=totals.count,
+                    uncompressed_bytes=totals.uncompressed_bytes,
+                    compressed_bytes=totals.compressed_bytes,
+                    estimated_compressed_bytes=totals.estimated_compressed_bytes,
+                )
+                for (signal, service_name), totals in snapshot.services.items()
+            ],
+            attributes=[
+                AttributeSize(
+                    signal=signal.name.lower(),
+                    key=key,
+                    count=totals.count,
+                    uncompressed_bytes=totals.uncompressed_bytes,
+                )
+                for (signal, key), totals in snapshot.attributes.items()
+            ],
+        )
+
+    @override
+    def get_duplicate_span_stats(
+        self, request: GetDuplicateSpanStatsRequest, context: ServicerContext
+    ) -> GetDuplicateSpanStatsResponse:
+        if self.duplicate_spans is None:
+            context.abort(StatusCode.FAILED_PRECONDITION, "The mock collector does not filter duplicate spans")
+        return GetDuplicateSpanStatsResponse(
+            duplicate_span_counts=[
+                DuplicateSpanCount(service_name=service_name, count=count)
+                for service_name, count in self.duplicate_spans.get_duplicate_counts().items()
+            ]
+        )
+
+
+class AsyncMockCollectorService(MockCollectorService):
+    """Variant of `MockCollectorService` for `grpc.aio` servers.
+
+    The watch and wait_for rpcs, which block until telemetry is received, are coroutines woken up by the collectors
+    when their exports change, so that any number of them can be pending without holding a thread each. The other rpcs
+    return right away, and are run by the server on its thread pool.
+    """
+
+    @override
+    async def watch_traces(self, request: GetTracesRequest, context: aio.ServicerContext) -> AsyncIterator[bytes]:
+        """Streams serialized `GetTracesResponse`s, pushing each export as soon as it is received."""
+        async for response in _watch_exports_async(
+            self.trace_collector, GetTracesResponse, GetTracesResponse.TRACES_FIELD_NUMBER, request.since
+        ):
+            yield response
+
+    @override
+    async def watch_metrics(self, request: GetMetricsRequest, context: aio.ServicerContext) -> AsyncIterator[bytes]:
+        """Streams serialized `GetMetricsResponse`s, pushing each export as soon as it is received."""
+        async for response in _watch_exports_async(
+            self.metrics_collector, GetMetricsResponse, GetMetricsResponse.METRICS_FIELD_NUMBER, request.since
+        ):
+            yield response
+
+    @override
+    async def watch_logs(self, request: GetLogsRequest, context: aio.ServicerContext) -> AsyncIterator[bytes]:
+        """Streams serialized `GetLogsResponse`s, pushing each export as soon as it is received."""
+        async for response in _watch_exports_async(
+            self.logs_collector, GetLogsResponse, GetLogsResponse.LOGS_FIELD_NUMBER, request.since
+        ):
+            yield response
+
+    @override
+    async def wait_for_spans(self, request: WaitForSpansRequest, context: aio.ServicerContext) -> WaitForSpansResponse:
+        predicate: SpanPredicate = SpanPredicate(request.name, request.kind, dict(request.attributes))
+        with self.trace_collector.span_waiter(request.since, predicate, request.min_count) as waiter:
+            satisfied: bool = await _wait_until(
+                waiter.satisfied.is_set, self.trace_collector, _get_wait_timeout(request.timeout_millis, context)
+            )
+        return _to_wait_for_spans_response(satisfied, waiter.get_matches())
+
+    @override
+    async def wait_for_metrics(
+        self, request: WaitForMetricsRequest, context: aio.ServicerContext
+    ) -> WaitForMetricsResponse:
+        with self.metrics_collector.metric_names_waiter(request.since, request.names) as waiter:
+            satisfied: bool = await _wait_until(
+                waiter.satisfied.is_set, self.metrics_collector, _get_wait_timeout(request.timeout_millis, context)
+            )
+        return _to_wait_for_metrics_response(satisfied, waiter.get_matches())
+
+
+def _get_wait_timeout(timeout_millis: int, context: ServicerContext) -> float:
+    # Return before the deadline of the call, if it has one, so that the caller gets the matches received so far.
+    timeout: float = timeout_millis / 1000
+    time_remaining: Optional[float] = context.time_remaining()
+    if time_remaining is not None:
+        timeout = min(timeout, time_remaining - _DEADLINE_MARGIN_SEC)
+    return max(0.0, timeout)
+
+
+def _to_wait_for_spans_response(satisfied: bool, matches: List[SpanMatch]) -> WaitForSpansResponse:
+    traces: List[bytes] = [spans_to_export(matches).SerializeToString()] if matches else []
+    return WaitForSpansResponse(satisfied=satisfied, traces=traces)
+
+
+def _to_wait_for_metrics_response(satisfied: bool, matches: List[MetricMatch]) -> WaitForMetricsResponse:
+    metrics: List[bytes] = [metrics_to_export(matches).SerializeToString()] if matches else []
+    return WaitForMetricsResponse(satisfied=satisfied, metrics=metrics)
+
+
+def _to_storage_stats_message(stats: StorageStats) -> StorageStatsMessage:
+    return StorageStatsMessage(**stats._asdict())
+
+
+def _serialize_exports(response_type: Type[Message], field_number: int, exports: ExportSlice) -> bytes:
+    return serialize_with_bytes_field(
+        response_type(
+            next_cursor=exports.next_cursor,
+            start_cursor=exports.start_cursor,
+            sequence_numbers=[export.sequence_number for export in exports.exports],
+            received_times_unix_nano=[export.received_time_unix_nano for export in exports.exports],
+            server_time_unix_nano=time_ns(),
+        ),
+        field_number,
+        [export.data for export in exports.exports],
+    )
+
+
+def _watch_exports(
+    collector: _Collector,
+    response_type: Type[Message],
+    field_number: int,
+    since: int,
+    context: ServicerContext,
+) -> Iterator[bytes]:
+    exports: ExportSlice = collector.get_requests(since)
+    while True:
+        yield _serialize_exports(response_type, field_number, exports)
+        since = max(since, exports.next_cursor)
+        start_cursor: int = exports.start_cursor
+        while True:
+            if not context.is_active():
+                return
+            exports = collector.wait_for_requests(since, start_cursor, _WATCH_IDLE_TIMEOUT_SEC)
+            if exports.exports or exports.start_cursor > start_cursor:
+                break
+
+
+async def _watch_exports_async(
+    collector: _Collector,
+    response_type: Type[Message],
+    field_number: int,
+    since: int,
+) -> AsyncIterator[bytes]:
+    # The stream is cancelled, leaving the `with` block, when the client goes away.
+    loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+    changed: asyncio.Event = asyncio.Event()
+    with collector.change_listener(lambda: loop.call_soon_threadsafe(changed.set)):
+        exports: ExportSlice = collector.get_requests(since)
+        while True:
+            yield _serialize_exports(response_type, field_number, exports)
+            since = max(since, exports.next_cursor)
+            start_cursor: int = exports.start_cursor
+            while True:
+                await changed.wait()
+                changed.clear()
+                exports = collector.get_requests(since)
+                if exports.exports or exports.start_cursor > start_cursor:
+                    break
+
+
+async def _wait_until(
+    condition: Callable[[], bool],
+    collector: _Collector,
+    timeout: float,
+) -> bool:
+    # Re-evaluate `condition` every time the exports of `collector` change, until it holds or `timeout` elapses.
+    loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+    deadline: float = loop.time() + timeout
+    changed: asyncio.Event = asyncio.Event()
+    with collector.change_listener(lambda: loop.call_soon_threadsafe(changed.set)):
+        while True:
+            changed.clear()
+            if condition():
+                return True
+            remaining: float = deadline - loop.time()
+            if remaining <= 0:
+                return False
+            try:
+                await asyncio.wait_for(changed.wait(), remaining)
+            except asyncio.TimeoutError:
+                return condition()
@@ -14,25 +14,115 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1cmock_collector_service.proto\"\x0e\n\x0c\x43learRequest\"\x0f\n\rClearResponse\"\x12\n\x10GetTracesRequest\"#\n\x11GetTracesResponse\x12\x0e\n\x06traces\x18\x01 \x03(\x0c\"\x13\n\x11GetMetricsRequest\"%\n\x12GetMetricsResponse\x12\x0f\n\x07metrics\x18\x01 \x03(\x0c\x32\xb1\x01\n\x14MockCollectorService\x12(\n\x05\x63lear\x12\r.ClearRequest\x1a\x0e.ClearResponse\"\x00\x12\x35\n\nget_traces\x12\x11.GetTracesRequest\x1a\x12.GetTracesResponse\"\x00\x12\x38\n\x0bget_metrics\x12\x12.GetMetricsRequest\x1a\x13.GetMetricsResponse\"\x00\x62\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1cmock_collector_service.proto\"R\n\x0c\x43learRequest\x12\x15\n\rtraces_cursor\x18\x01 \x01(\x04\x12\x16\n\x0emetrics_cursor\x18\x02 \x01(\x04\x12\x13\n\x0blogs_cursor\x18\x03 \x01(\x04\"S\n\rClearResponse\x12\x15\n\rtraces_cursor\x18\x01 \x01(\x04\x12\x16\n\x0emetrics_cursor\x18\x02 \x01(\x04\x12\x13\n\x0blogs_cursor\x18\x03 \x01(\x04\"!\n\x10GetTracesRequest\x12\r\n\x05since\x18\x01 \x01(\x04\"\xa9\x01\n\x11GetTracesResponse\x12\x0e\n\x06traces\x18\x01 \x03(\x0c\x12\x13\n\x0bnext_cursor\x18\x02 \x01(\x04\x12\x14\n\x0cstart_cursor\x18\x03 \x01(\x04\x12\x18\n\x10sequence_numbers\x18\x04 \x03(\x04\x12 \n\x18received_times_unix_nano\x18\x05 \x03(\x04\x12\x1d\n\x15server_time_unix_nano\x18\x06 \x01(\x04\"\"\n\x11GetMetricsRequest\x12\r\n\x05since\x18\x01 \x01(\x04\"\xab\x01\n\x12GetMetricsResponse\x12\x0f\n\x07metrics\x18\x01 \x03(\x0c\x12\x13\n\x0bnext_cursor\x18\x02 \x01(\x04\x12\x14\n\x0cstart_cursor\x18\x03 \x01(\x04\x12\x18\n\x10sequence_numbers\x18\x04 \x03(\x04\x12 \n\x18received_times_unix_nano\x18\x05 \x03(\x04\x12\x1d\n\x15server_time_unix_nano\x18\x06 \x01(\x04\"\x1f\n\x0eGetLogsRequest\x12\r\n\x05since\x18\x01 \x01(\x04\"\xa5\x01\n\x0fGetLogsResponse\x12\x0c\n\x04logs\x18\x01 \x03(\x0c\x12\x13\n\x0bnext_cursor\x18\x02 \x01(\x04\x12\x14\n\x0cstart_cursor\x18\x03 \x01(\x04\x12\x18\n\x10sequence_numbers\x18\x04 \x03(\x04\x12 \n\x18received_times_unix_nano\x18\x05 \x03(\x04\x12\x1d\n\x15server_time_unix_nano\x18\x06 \x01(\x04\"\xd8\x01\n\x13WaitForSpansRequest\x12\r\n\x05since\x18\x01 \x01(\x04\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0c\n\x04kind\x18\x03 \x01(\x05\x12\x38\n\nattributes\x18\x04 \x03(\x0b\x32$.WaitForSpansRequest.AttributesEntry\x12\x11\n\tmin_count\x18\x05 \x01(\r\x12\x16\n\x0etimeout_millis\x18\x06 \x01(\r\x1a\x31\n\x0f\x41ttributesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"9\n\x14WaitForSpansResponse\x12\x11\n\tsatisfied\x18\x01 \x01(\x08\x12\x0e\n\x06traces\x18\x02 \x03(\x0c\"M\n\x15WaitForMetricsRequest\x12\r\n\x05since\x18\x01 \x01(\x04\x12\r\n\x05names\x18\x02 \x03(\t\x12\x16\n\x0etimeout_millis\x18\x03 \x01(\r\"<\n\x16WaitForMetricsResponse\x12\x11\n\tsatisfied\x18\x01 \x01(\x08\x12\x0f\n\x07metrics\x18\x02 \x03(\x0c\"\xcc\x01\n\x11QuerySpansRequest\x12\x10\n\x08trace_id\x18\x01 \x01(\x0c\x12\x0f\n\x07span_id\x18\x02 \x01(\x0c\x12\x0c\n\x04name\x18\x03 \x01(\t\x12\x0c\n\x04kind\x18\x04 \x01(\x05\x12\x36\n\nattributes\x18\x05 \x03(\x0b\x32\".QuerySpansRequest.AttributesEntry\x12\r\n\x05limit\x18\x06 \x01(\r\x1a\x31\n\x0f\x41ttributesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"4\n\x12QuerySpansResponse\x12\x0e\n\x06traces\x18\x01 \x03(\x0c\x12\x0e\n\x06\x63ursor\x18\x02 \x01(\x04\"\xd3\x01\n\x10QueryLogsRequest\x12\x10\n\x08trace_id\x18\x01 \x01(\x0c\x12\x0f\n\x07span_id\x18\x02 \x01(\x0c\x12\x15\n\rseverity_text\x18\x03 \x01(\t\x12\x0c\n\x04\x62ody\x18\x04 \x01(\t\x12\x35\n\nattributes\x18\x05 \x03(\x0b\x32!.QueryLogsRequest.AttributesEntry\x12\r\n\x05limit\x18\x06 \x01(\r\x1a\x31\n\x0f\x41ttributesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"1\n\x11QueryLogsResponse\x12\x0c\n\x04logs\x18\x01 \x03(\x0c\x12\x0e\n\x06\x63ursor\x18\x02 \x01(\x04\"\'\n\x13GetTraceTreeRequest\x12\x10\n\x08trace_id\x18\x01 \x01(\x0c\"\xff\x01\n\rTraceTreeNode\x12\x0f\n\x07span_id\x18\x01 \x01(\x0c\x12\x16\n\x0eparent_span_id\x18\x02 \x01(\x0c\x12\x14\n\x0cparent_index\x18\x03 \x01(\x05\x12\r\n\x05\x64\x65pth\x18\x04 \x01(\r\x12\x14\n\x0cservice_name\x18\x05 \x01(\t\x12\x0c\n\x04name\x18\x06 \x01(\t\x12\x0c\n\x04kind\x18\x07 \x01(\x05\x12\x1c\n\x14start_time_unix_nano\x18\x08 \x01(\x04\x12\x1a\n\x12\x65nd_time_unix_nano\x18\t \x01(\x04\x12\x17\n\x0fself_time_nanos\x18\n \x01(\x04\x12\x1b\n\x13\x63ritical_path_nanos\x18\x0b \x01(\x04\"`\n\x13\x43riticalPathSegment\x12\x0f\n\x07span_id\x18\x01 \x01(\x0c\x12\x1c\n\x14start_time_unix_nano\x18\x02 \x01(\x04\x12\x1a\n\x12\x65nd_time_unix_nano\x18\x03 \x01(\x04\"b\n\x14GetTraceTreeResponse\x12\x1d\n\x05nodes\x18\x01 \x03(\x0b\x32\x0e.TraceTreeNode\x12+\n\rcritical_path\x18\x02 \x03(\x0b\x32\x14.CriticalPathSegment\"\x18\n\x16GetStorageStatsRequest\"\x94\x01\n\x0cStorageStats\x12\x16\n\x0estored_exports\x18\x01 \x01(\x04\x12\x14\n\x0cstored_bytes\x18\x02 \x01(\x04\x12\x17\n\x0f\x65victed_exports\x18\x03 \x01(\x04\x12\x15\n\revicted_bytes\x18\x04 \x01(\x04\x12\x13\n\x0bmax_exports\x18\x05 \x01(\x04\x12\x11\n\tmax_bytes\x18\x06 \x01(\x04\"u\n\x17GetStorageStatsResponse\x12\x1d\n\x06traces\x18\x01 \x01(\x0b\x32\r.StorageStats\x12\x1e\n\x07metrics\x18\x02 \x01(\x0b\x32\r.StorageStats\x12\x1b\n\x04logs\x18\x03 \x01(\x0b\x32\r.StorageStats\"\x15\n\x13GetSoakStatsRequest\".\n\x0cSignalCounts\x12\x0f\n\x07\x65xports\x18\x01 \x01(\x04\x12\r\n\x05\x62ytes\x18\x02 \x01(\x04\"L\n\tSpanCount\x12\x14\n\x0cservice_name\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0c\n\x04kind\x18\x03 \x01(\x05\x12\r\n\x05\x63ount\x18\x04 \x01(\x04\"/\n\x10MetricPointCount\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\r\n\x05\x63ount\x18\x02 \x01(\x04\"O\n\x0eLogRecordCount\x12\x14\n\x0cservice_name\x18\x01 \x01(\t\x12\r\n\x05\x63ount\x18\x02 \x01(\x04\x12\x18\n\x10\x63orrelated_count\x18\x03 \x01(\x04\"\xa4\x02\n\x14GetSoakStatsResponse\x12\x1d\n\x06traces\x18\x01 \x01(\x0b\x32\r.SignalCounts\x12\x1e\n\x07metrics\x18\x02 \x01(\x0b\x32\r.SignalCounts\x12\x1f\n\x0bspan_counts\x18\x03 \x03(\x0b\x32\n.SpanCount\x12.\n\x13metric_point_counts\x18\x04 \x03(\x0b\x32\x11.MetricPointCount\x12\x17\n\x0f\x65lapsed_seconds\x18\x05 \x01(\x01\x12\x1a\n\x12\x65xports_per_second\x18\x06 \x01(\x01\x12\x1b\n\x04logs\x18\x07 \x01(\x0b\x32\r.SignalCounts\x12*\n\x11log_record_counts\x18\x08 \x03(\x0b\x32\x0f.LogRecordCount\"\xb9\x01\n\x0cLatencyFault\x12\x30\n\x0c\x64istribution\x18\x01 \x01(\x0e\x32\x1a.LatencyFault.Distribution\x12\x12\n\nmin_millis\x18\x02 \x01(\x01\x12\x12\n\nmax_millis\x18\x03 \x01(\x01\x12\x13\n\x0bmean_millis\x18\x04 \x01(\x01\":\n\x0c\x44istribution\x12\x0c\n\x08\x43ONSTANT\x10\x00\x12\x0b\n\x07UNIFORM\x10\x01\x12\x0f\n\x0b\x45XPONENTIAL\x10\x02\"\xea\x01\n\x0b\x46\x61ultConfig\x12\x1e\n\x07latency\x18\x01 \x01(\x0b\x32\r.LatencyFault\x12\x1c\n\x14unavailable_fraction\x18\x02 \x01(\x01\x12#\n\x1bresource_exhausted_fraction\x18\x03 \x01(\x01\x12\x15\n\rhang_fraction\x18\x04 \x01(\x01\x12 \n\x18partial_success_fraction\x18\x05 \x01(\x01\x12\x1e\n\x16rejected_item_fraction\x18\x06 \x01(\x01\x12\x1f\n\x17partial_success_message\x18\x07 \x01(\t\"\x7f\n\x16\x43onfigureFaultsRequest\x12\x1c\n\x06traces\x18\x01 \x01(\x0b\x32\x0c.FaultConfig\x12\x1d\n\x07metrics\x18\x02 \x01(\x0b\x32\x0c.FaultConfig\x12\x1a\n\x04logs\x18\x03 \x01(\x0b\x32\x0c.FaultConfig\x12\x0c\n\x04seed\x18\x04 \x01(\x04\"\x19\n\x17\x43onfigureFaultsResponse\"\x16\n\x14GetFaultStatsRequest\"\xc5\x01\n\nFaultStats\x12\x0f\n\x07\x65xports\x18\x01 \x01(\x04\x12\x17\n\x0f\x64\x65layed_exports\x18\x02 \x01(\x04\x12\x1a\n\x12total_delay_millis\x18\x03 \x01(\x01\x12\x13\n\x0bunavailable\x18\x04 \x01(\x04\x12\x1a\n\x12resource_exhausted\x18\x05 \x01(\x04\x12\r\n\x05hangs\x18\x06 \x01(\x04\x12\x19\n\x11partial_successes\x18\x07 \x01(\x04\x12\x16\n\x0erejected_items\x18\x08 \x01(\x04\"m\n\x15GetFaultStatsResponse\x12\x1b\n\x06traces\x18\x01 \x01(\x0b\x32\x0b.FaultStats\x12\x1c\n\x07metrics\x18\x02 \x01(\x0b\x32\x0b.FaultStats\x12\x19\n\x04logs\x18\x03 \x01(\x0b\x32\x0b.FaultStats\"\x15\n\x13GetWireStatsRequest\"\xda\x01\n\nExportSize\x12\x0e\n\x06signal\x18\x01 \x01(\t\x12\x1f\n\x17received_time_unix_nano\x18\x02 \x01(\x04\x12\x10\n\x08protocol\x18\x03 \x01(\t\x12\x18\n\x10\x63ontent_encoding\x18\x04 \x01(\t\x12\x1a\n\x12uncompressed_bytes\x18\x05 \x01(\x04\x12\x18\n\x10\x63ompressed_bytes\x18\x06 \x01(\x04\x12\"\n\x1a\x65stimated_compressed_bytes\x18\x07 \x01(\x04\x12\x15\n\rservice_names\x18\x08 \x03(\t\"\x9e\x01\n\x0bServiceSize\x12\x0e\n\x06signal\x18\x01 \x01(\t\x12\x14\n\x0cservice_name\x18\x02 \x01(\t\x12\x0f\n\x07\x65xports\x18\x03 \x01(\x04\x12\x1a\n\x12uncompressed_bytes\x18\x04 \x01(\x04\x12\x18\n\x10\x63ompressed_bytes\x18\x05 \x01(\x04\x12\"\n\x1a\x65stimated_compressed_bytes\x18\x06 \x01(\x04\"W\n\rAttributeSize\x12\x0e\n\x06signal\x18\x01 \x01(\t\x12\x0b\n\x03key\x18\x02 \x01(\t\x12\r\n\x05\x63ount\x18\x03 \x01(\x04\x12\x1a\n\x12uncompressed_bytes\x18\x04 \x01(\x04\"x\n\x14GetWireStatsResponse\x12\x1c\n\x07\x65xports\x18\x01 \x03(\x0b\x32\x0b.ExportSize\x12\x1e\n\x08services\x18\x02 \x03(\x0b\x32\x0c.ServiceSize\x12\"\n\nattributes\x18\x03 \x03(\x0b\x32\x0e.AttributeSize\"\x1e\n\x1cGetDuplicateSpanStatsRequest\"9\n\x12\x44uplicateSpanCount\x12\x14\n\x0cservice_name\x18\x01 \x01(\t\x12\r\n\x05\x63ount\x18\x02 \x01(\x04\"S\n\x1dGetDuplicateSpanStatsResponse\x12\x32\n\x15\x64uplicate_span_counts\x18\x01 \x03(\x0b\x32\x13.DuplicateSpanCount2\x80\t\n\x14MockCollectorService\x12(\n\x05\x63lear\x12\r.ClearRequest\x1a\x0e.ClearResponse\"\x00\x12\x35\n\nget_traces\x12\x11.GetTracesRequest\x1a\x12.GetTracesResponse\"\x00\x12\x38\n\x0bget_metrics\x12\x12.GetMetricsRequest\x1a\x13.GetMetricsResponse\"\x00\x12/\n\x08get_logs\x12\x0f.GetLogsRequest\x1a\x10.GetLogsResponse\"\x00\x12\x39\n\x0cwatch_traces\x12\x11.GetTracesRequest\x1a\x12.GetTracesResponse\"\x00\x30\x01\x12<\n\rwatch_metrics\x12\x12.GetMetricsRequest\x1a\x13.GetMetricsResponse\"\x00\x30\x01\x12\x33\n\nwatch_logs\x12\x0f.GetLogsRequest\x1a\x10.GetLogsResponse\"\x00\x30\x01\x12?\n\x0ewait_for_spans\x12\x14.WaitForSpansRequest\x1a\x15.WaitForSpansResponse\"\x00\x12\x45\n\x10wait_for_metrics\x12\x16.WaitForMetricsRequest\x1a\x17.WaitForMetricsResponse\"\x00\x12\x38\n\x0bquery_spans\x12\x12.QuerySpansRequest\x1a\x13.QuerySpansResponse\"\x00\x12\x35\n\nquery_logs\x12\x11.QueryLogsRequest\x1a\x12.QueryLogsResponse\"\x00\x12?\n\x0eget_trace_tree\x12\x14.GetTraceTreeRequest\x1a\x15.GetTraceTreeResponse\"\x00\x12H\n\x11get_storage_stats\x12\x17.GetStorageStatsRequest\x1a\x18.GetStorageStatsResponse\"\x00\x12?\n\x0eget_soak_stats\x12\x14.GetSoakStatsRequest\x1a\x15.GetSoakStatsResponse\"\x00\x12G\n\x10\x63onfigure_faults\x12\x17.ConfigureFaultsRequest\x1a\x18.ConfigureFaultsResponse\"\x00\x12\x42\n\x0fget_fault_stats\x12\x15.GetFaultStatsRequest\x1a\x16.GetFaultStatsResponse\"\x00\x12?\n\x0eget_wire_stats\x12\x14.GetWireStatsRequest\x1a\x15.GetWireStatsResponse\"\x00\x12[\n\x18get_duplicate_span_stats\x12\x1d.GetDuplicateSpanStatsRequest\x1a\x1e.GetDuplicateSpanStatsResponse\"\x00\x62\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'mock_collector_service_pb2', _globals)
 if _descriptor._USE_C_DESCRIPTORS == False:
   DESCRIPTOR._options = None
+  _globals['_WAITFORSPANSREQUEST_ATTRIBUTESENTRY']._options = None
+  _globals['_WAITFORSPANSREQUEST_ATTRIBUTESENTRY']._serialized_options = b'8\001'
+  _globals['_QUERYSPANSREQUEST_ATTRIBUTESENTRY']._options = None
+  _globals['_QUERYSPANSREQUEST_ATTRIBUTESENTRY']._serialized_options = b'8\001'
+  _globals['_QUERYLOGSREQUEST_ATTRIBUTESENTRY']._options = None
+  _globals['_QUERYLOGSREQUEST_ATTRIBUTESENTRY']._serialized_options = b'8\001'
   _globals['_CLEARREQUEST']._serialized_start=32
-  _globals['_CLEARREQUEST']._serialized_end=46
-  _globals['_CLEARRESPONSE']._serialized_start=48
-  _globals['_CLEARRESPONSE']._serialized_end=63
-  _globals['_GETTRACESREQUEST']._serialized_start=65
-  _globals['_GETTRACESREQUEST']._serialized_end=83
-  _globals['_GETTRACESRESPONSE']._serialized_start=85
-  _globals['_GETTRACESRESPONSE']._serialized_end=120
-  _globals['_GETMETRICSREQUEST']._serialized_start=122
-  _globals['_GETMETRICSREQUEST']._serialized_end=141
-  _globals['_GETMETRICSRESPONSE']._serialized_start=143
-  _globals['_GETMETRICSRESPONSE']._serialized_end=180
-  _globals['_MOCKCOLLECTORSERVICE']._serialized_start=183
-  _globals['_MOCKCOLLECTORSERVICE']._serialized_end=360
+  _globals['_CLEARREQUEST']._serialized_end=114
+  _globals['_CLEARRESPONSE']._serialized_start=116
+  _globals['_CLEARRESPONSE']._serialized_end=199
+  _globals['_GETTRACESREQUEST']._serialized_start=201
+  _globals['_GETTRACESREQUEST']._serialized_end=234
+  _globals['_GETTRACESRESPONSE']._serialized_start=237
+  _globals['_GETTRACESRESPONSE']._serialized_end=406
+  _globals['_GETMETRICSREQUEST']._serialized_start=408
+  _globals['_GETMETRICSREQUEST']._serialized_end=442
+  _globals['_GETMETRICSRESPONSE']._serialized_start=445
+  _globals['_GETMETRICSRESPONSE']._serialized_end=616
+  _globals['_GETLOGSREQUEST']._serialized_start=618
+  _globals['_GETLOGSREQUEST']._serialized_end=649
+  _globals['_GETLOGSRESPONSE']._serialized_start=652
+  _globals['_GETLOGSRESPONSE']._serialized_end=817
+  _globals['_WAITFORSPANSREQUEST']._serialized_start=820
+  _globals['_WAITFORSPANSREQUEST']._serialized_end=1036
+  _globals['_WAITFORSPANSREQUEST_ATTRIBUTESENTRY']._serialized_start=987
+  _globals['_WAITFORSPANSREQUEST_ATTRIBUTESENTRY']._serialized_end=1036
+  _globals['_WAITFORSPANSRESPONSE']._serialized_start=1038
+  _globals['_WAITFORSPANSRESPONSE']._serialized_end=1095
+  _globals['_WAITFORMETRICSREQUEST']._serialized_start=1097
+  _globals['_WAITFORMETRICSREQUEST']._serialized_end=1174
+  _globals['_WAITFORMETRICSRESPONSE']._serialized_start=1176
+  _globals['_WAITFORMETRICSRESPONSE']._serialized_end=1236
+  _globals['_QUERYSPANSREQUEST']._serialized_start=1239
+  _globals['_QUERYSPANSREQUEST']._serialized_end=1443
+  _globals['_QUERYSPANSREQUEST_ATTRIBUTESENTRY']._serialized_start=987
+  _globals['_QUERYSPANSREQUEST_ATTRIBUTESENTRY']._serialized_end=1036
+  _globals['_QUERYSPANSRESPONSE']._serialized_start=1445
+  _globals['_QUERYSPANSRESPONSE']._serialized_end=1497
+  _globals['_QUERYLOGSREQUEST']._serialized_start=1500
+  _globals['_QUERYLOGSREQUEST']._serialized_end=1711
+  _globals['_QUERYLOGSREQUEST_ATTRIBUTESENTRY']._serialized_start=987
+  _globals['_QUERYLOGSREQUEST_ATTRIBUTESENTRY']._serialized_end=1036
+  _globals['_QUERYLOGSRESPONSE']._serialized_start=1713
+  _globals['_QUERYLOGSRESPONSE']._serialized_end=1762
+  _globals['_GETTRACETREEREQUEST']._serialized_start=1764
+  _globals['_GETTRACETREEREQUEST']._serialized_end=1803
+  _globals['_TRACETREENODE']._serialized_start=1806
+  _globals['_TRACETREENODE']._serialized_end=2061
+  _globals['_CRITICALPATHSEGMENT']._serialized_start=2063
+  _globals['_CRITICALPATHSEGMENT']._serialized_end=2159
+  _globals['_GETTRACETREERESPONSE']._serialized_start=2161
+  _globals['_GETTRACETREERESPONSE']._serialized_end=2259
+  _globals['_GETSTORAGESTATSREQUEST']._serialized_start=2261
+  _globals['_GETSTORAGESTATSREQUEST']._serialized_end=2285
+  _globals['_STORAGESTATS']._serialized_start=2288
+  _globals['_STORAGESTATS']._serialized_end=2436
+  _globals['_GETSTORAGESTATSRESPONSE']._serialized_start=2438
+  _globals['_GETSTORAGESTATSRESPONSE']._serialized_end=2555
+  _globals['_GETSOAKSTATSREQUEST']._serialized_start=2557
+  _globals['_GETSOAKSTATSREQUEST']._serialized_end=2578
+  _globals['_SIGNALCOUNTS']._serialized_start=2580
+  _globals['_SIGNALCOUNTS']._serialized_end=2626
+  _globals['_SPANCOUNT']._serialized_start=2628
+  _globals['_SPANCOUNT']._serialized_end=2704
+  _globals['_METRICPOINTCOUNT']._serialized_start=2706
+  _globals['_METRICPOINTCOUNT']._serialized_end=2753
+  _globals['_LOGRECORDCOUNT']._serialized_start=2755
+  _globals['_LOGRECORDCOUNT']._serialized_end=2834
+  _globals['_GETSOAKSTATSRESPONSE']._serialized_start=2837
+  _globals['_GETSOAKSTATSRESPONSE']._serialized_end=3129
+  _globals['_LATENCYFAULT']._serialized_start=3132
+  _globals['_LATENCYFAULT']._serialized_end=3317
+  _globals['_LATENCYFAULT_DISTRIBUTION']._serialized_start=3259
+  _globals['_LATENCYFAULT_DISTRIBUTION']._serialized_end=3317
+  _globals['_FAULTCONFIG']._serialized_start=3320
+  _globals['_FAULTCONFIG']._serialized_end=3554
+  _globals['_CONFIGUREFAULTSREQUEST']._serialized_start=3556
+  _globals['_CONFIGUREFAULTSREQUEST']._serialized_end=3683
+  _globals['_CONFIGUREFAULTSRESPONSE']._serialized_start=3685
+  _globals['_CONFIGUREFAULTSRESPONSE']._serialized_end=3710
+  _globals['_GETFAULTSTATSREQUEST']._serialized_start=3712
+  _globals['_GETFAULTSTATSREQUEST']._serialized_end=3734
+  _globals['_FAULTSTATS']._serialized_start=3737
+  _globals['_FAULTSTATS']._serialized_end=3934
+  _globals['_GETFAULTSTATSRESPONSE']._serialized_start=3936
+  _globals['_GETFAULTSTATSRESPONSE']._serialized_end=4045
+  _globals['_GETWIRESTATSREQUEST']._serialized_start=4047
+  _globals['_GETWIRESTATSREQUEST']._serialized_end=4068
+  _globals['_EXPORTSIZE']._serialized_start=4071
+  _globals['_EXPORTSIZE']._serialized_end=4289
+  _globals['_SERVICESIZE']._serialized_start=4292
+  _globals['_SERVICESIZE']._serialized_end=4450
+  _globals['_ATTRIBUTESIZE']._serialized_start=4452
+  _globals['_ATTRIBUTESIZE']._serialized_end=4539
+  _globals['_GETWIRESTATSRESPONSE']._serialized_start=4541
+  _globals['_GETWIRESTATSRESPONSE']._serialized_end=4661
+  _globals['_GETDUPLICATESPANSTATSREQUEST']._serialized_start=4663
+  _globals['_GETDUPLICATESPANSTATSREQUEST']._serialized_end=4693
+  _globals['_DUPLICATESPANCOUNT']._serialized_start=4695
+  _globals['_DUPLICATESPANCOUNT']._serialized_end=4752
+  _globals['_GETDUPLICATESPANSTATSRESPONSE']._serialized_start=4754
+  _globals['_GETDUPLICATESPANSTATSRESPONSE']._serialized_end=4837
+  _globals['_MOCKCOLLECTORSERVICE']._serialized_start=4840
+  _globals['_MOCKCOLLECTORSERVICE']._serialized_end=5992
 # @@protoc_insertion_point(module_scope)
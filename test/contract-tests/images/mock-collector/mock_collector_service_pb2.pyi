@@ -1,34 +1,514 @@
 from google.protobuf.internal import containers as _containers
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import message as _message
-from typing import ClassVar as _ClassVar, Iterable as _Iterable, Optional as _Optional
+from typing import ClassVar as _ClassVar, Iterable as _Iterable, Mapping as _Mapping, Optional as _Optional, Union as _Union
 
 DESCRIPTOR: _descriptor.FileDescriptor
 
 class ClearRequest(_message.Message):
-    __slots__ = ()
-    def __init__(self) -> None: ...
+    __slots__ = ("traces_cursor", "metrics_cursor", "logs_cursor")
+    TRACES_CURSOR_FIELD_NUMBER: _ClassVar[int]
+    METRICS_CURSOR_FIELD_NUMBER: _ClassVar[int]
+    LOGS_CURSOR_FIELD_NUMBER: _ClassVar[int]
+    traces_cursor: int
+    metrics_cursor: int
+    logs_cursor: int
+    def __init__(self, traces_cursor: _Optional[int] = ..., metrics_cursor: _Optional[int] = ..., logs_cursor: _Optional[int] = ...) -> None: ...
 
 class ClearResponse(_message.Message):
-    __slots__ = ()
-    def __init__(self) -> None: ...
+    __slots__ = ("traces_cursor", "metrics_cursor", "logs_cursor")
+    TRACES_CURSOR_FIELD_NUMBER: _ClassVar[int]
+    METRICS_CURSOR_FIELD_NUMBER: _ClassVar[int]
+    LOGS_CURSOR_FIELD_NUMBER: _ClassVar[int]
+    traces_cursor: int
+    metrics_cursor: int
+    logs_cursor: int
+    def __init__(self, traces_cursor: _Optional[int] = ..., metrics_cursor: _Optional[int] = ..., logs_cursor: _Optional[int] = ...) -> None: ...
 
 class GetTracesRequest(_message.Message):
-    __slots__ = ()
-    def __init__(self) -> None: ...
+    __slots__ = ("since",)
+    SINCE_FIELD_NUMBER: _ClassVar[int]
+    since: int
+    def __init__(self, since: _Optional[int] = ...) -> None: ...
 
 class GetTracesResponse(_message.Message):
-    __slots__ = ("traces",)
+    __slots__ = ("traces", "next_cursor", "start_cursor", "sequence_numbers", "received_times_unix_nano", "server_time_unix_nano")
     TRACES_FIELD_NUMBER: _ClassVar[int]
+    NEXT_CURSOR_FIELD_NUMBER: _ClassVar[int]
+    START_CURSOR_FIELD_NUMBER: _ClassVar[int]
+    SEQUENCE_NUMBERS_FIELD_NUMBER: _ClassVar[int]
+    RECEIVED_TIMES_UNIX_NANO_FIELD_NUMBER: _ClassVar[int]
+    SERVER_TIME_UNIX_NANO_FIELD_NUMBER: _ClassVar[int]
     traces: _containers.RepeatedScalarFieldContainer[bytes]
-    def __init__(self, traces: _Optional[_Iterable[bytes]] = ...) -> None: ...
+    next_cursor: int
+    start_cursor: int
+    sequence_numbers: _containers.RepeatedScalarFieldContainer[int]
+    received_times_unix_nano: _containers.RepeatedScalarFieldContainer[int]
+    server_time_unix_nano: int
+    def __init__(self, traces: _Optional[_Iterable[bytes]] = ..., next_cursor: _Optional[int] = ..., start_cursor: _Optional[int] = ..., sequence_numbers: _Optional[_Iterable[int]] = ..., received_times_unix_nano: _Optional[_Iterable[int]] = ..., server_time_unix_nano: _Optional[int] = ...) -> None: ...
 
 class GetMetricsRequest(_message.Message):
-    __slots__ = ()
-    def __init__(self) -> None: ...
+    __slots__ = ("since",)
+    SINCE_FIELD_NUMBER: _ClassVar[int]
+    since: int
+    def __init__(self, since: _Optional[int] = ...) -> None: ...
 
 class GetMetricsResponse(_message.Message):
-    __slots__ = ("metrics",)
+    __slots__ = ("metrics", "next_cursor", "start_cursor", "sequence_numbers", "received_times_unix_nano", "server_time_unix_nano")
+    METRICS_FIELD_NUMBER: _ClassVar[int]
+    NEXT_CURSOR_FIELD_NUMBER: _ClassVar[int]
+    START_CURSOR_FIELD_NUMBER: _ClassVar[int]
+    SEQUENCE_NUMBERS_FIELD_NUMBER: _ClassVar[int]
+    RECEIVED_TIMES_UNIX_NANO_FIELD_NUMBER: _ClassVar[int]
+    SERVER_TIME_UNIX_NANO_FIELD_NUMBER: _ClassVar[int]
+    metrics: _containers.RepeatedScalarFieldContainer[bytes]
+    next_cursor: int
+    start_cursor: int
+    sequence_numbers: _containers.RepeatedScalarFieldContainer[int]
+    received_times_unix_nano: _containers.RepeatedScalarFieldContainer[int]
+    server_time_unix_nano: int
+    def __init__(self, metrics: _Optional[_Iterable[bytes]] = ..., next_cursor: _Optional[int] = ..., start_cursor: _Optional[int] = ..., sequence_numbers: _Optional[_Iterable[int]] = ..., received_times_unix_nano: _Optional[_Iterable[int]] = ..., server_time_unix_nano: _Optional[int] = ...) -> None: ...
+
+class GetLogsRequest(_message.Message):
+    __slots__ = ("since",)
+    SINCE_FIELD_NUMBER: _ClassVar[int]
+    since: int
+    def __init__(self, since: _Optional[int] = ...) -> None: ...
+
+class GetLogsResponse(_message.Message):
+    __slots__ = ("logs", "next_cursor", "start_cursor", "sequence_numbers", "received_times_unix_nano", "server_time_unix_nano")
+    LOGS_FIELD_NUMBER: _ClassVar[int]
+    NEXT_CURSOR_FIELD_NUMBER: _ClassVar[int]
+    START_CURSOR_FIELD_NUMBER: _ClassVar[int]
+    SEQUENCE_NUMBERS_FIELD_NUMBER: _ClassVar[int]
+    RECEIVED_TIMES_UNIX_NANO_FIELD_NUMBER: _ClassVar[int]
+    SERVER_TIME_UNIX_NANO_FIELD_NUMBER: _ClassVar[int]
+    logs: _containers.RepeatedScalarFieldContainer[bytes]
+    next_cursor: int
+    start_cursor: int
+    sequence_numbers: _containers.RepeatedScalarFieldContainer[int]
+    received_times_unix_nano: _containers.RepeatedScalarFieldContainer[int]
+    server_time_unix_nano: int
+    def __init__(self, logs: _Optional[_Iterable[bytes]] = ..., next_cursor: _Optional[int] = ..., start_cursor: _Optional[int] = ..., sequence_numbers: _Optional[_Iterable[int]] = ..., received_times_unix_nano: _Optional[_Iterable[int]] = ..., server_time_unix_nano: _Optional[int] = ...) -> None: ...
+
+class WaitForSpansRequest(_message.Message):
+    __slots__ = ("since", "name", "kind", "attributes", "min_count", "timeout_millis")
+    class AttributesEntry(_message.Message):
+        __slots__ = ("key", "value")
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: str
+        value: str
+        def __init__(self, key: _Optional[str] = ..., value: _Optional[str] = ...) -> None: ...
+    SINCE_FIELD_NUMBER: _ClassVar[int]
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    KIND_FIELD_NUMBER: _ClassVar[int]
+    ATTRIBUTES_FIELD_NUMBER: _ClassVar[int]
+    MIN_COUNT_FIELD_NUMBER: _ClassVar[int]
+    TIMEOUT_MILLIS_FIELD_NUMBER: _ClassVar[int]
+    since: int
+    name: str
+    kind: int
+    attributes: _containers.ScalarMap[str, str]
+    min_count: int
+    timeout_millis: int
+    def __init__(self, since: _Optional[int] = ..., name: _Optional[str] = ..., kind: _Optional[int] = ..., attributes: _Optional[_Mapping[str, str]] = ..., min_count: _Optional[int] = ..., timeout_millis: _Optional[int] = ...) -> None: ...
+
+class WaitForSpansResponse(_message.Message):
+    __slots__ = ("satisfied", "traces")
+    SATISFIED_FIELD_NUMBER: _ClassVar[int]
+    TRACES_FIELD_NUMBER: _ClassVar[int]
+    satisfied: bool
+    traces: _containers.RepeatedScalarFieldContainer[bytes]
+    def __init__(self, satisfied: bool = ..., traces: _Optional[_Iterable[bytes]] = ...) -> None: ...
+
+class WaitForMetricsRequest(_message.Message):
+    __slots__ = ("since", "names", "timeout_millis")
+    SINCE_FIELD_NUMBER: _ClassVar[int]
+    NAMES_FIELD_NUMBER: _ClassVar[int]
+    TIMEOUT_MILLIS_FIELD_NUMBER: _ClassVar[int]
+    since: int
+    names: _containers.RepeatedScalarFieldContainer[str]
+    timeout_millis: int
+    def __init__(self, since: _Optional[int] = ..., names: _Optional[_Iterable[str]] = ..., timeout_millis: _Optional[int] = ...) -> None: ...
+
+class WaitForMetricsResponse(_message.Message):
+    __slots__ = ("satisfied", "metrics")
+    SATISFIED_FIELD_NUMBER: _ClassVar[int]
     METRICS_FIELD_NUMBER: _ClassVar[int]
+    satisfied: bool
     metrics: _containers.RepeatedScalarFieldContainer[bytes]
-    def __init__(self, metrics: _Optional[_Iterable[bytes]] = ...) -> None: ...
+    def __init__(self, satisfied: bool = ..., metrics: _Optional[_Iterable[bytes]] = ...) -> None: ...
+
+class QuerySpansRequest(_message.Message):
+    __slots__ = ("trace_id", "span_id", "name", "kind", "attributes", "limit")
+    class AttributesEntry(_message.Message):
+        __slots__ = ("key", "value")
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: str
+        value: str
+        def __init__(self, key: _Optional[str] = ..., value: _Optional[str] = ...) -> None: ...
+    TRACE_ID_FIELD_NUMBER: _ClassVar[int]
+    SPAN_ID_FIELD_NUMBER: _ClassVar[int]
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    KIND_FIELD_NUMBER: _ClassVar[int]
+    ATTRIBUTES_FIELD_NUMBER: _ClassVar[int]
+    LIMIT_FIELD_NUMBER: _ClassVar[int]
+    trace_id: bytes
+    span_id: bytes
+    name: str
+    kind: int
+    attributes: _containers.ScalarMap[str, str]
+    limit: int
+    def __init__(self, trace_id: _Optional[bytes] = ..., span_id: _Optional[bytes] = ..., name: _Optional[str] = ..., kind: _Optional[int] = ..., attributes: _Optional[_Mapping[str, str]] = ..., limit: _Optional[int] = ...) -> None: ...
+
+class QuerySpansResponse(_message.Message):
+    __slots__ = ("traces", "cursor")
+    TRACES_FIELD_NUMBER: _ClassVar[int]
+    CURSOR_FIELD_NUMBER: _ClassVar[int]
+    traces: _containers.RepeatedScalarFieldContainer[bytes]
+    cursor: int
+    def __init__(self, traces: _Optional[_Iterable[bytes]] = ..., cursor: _Optional[int] = ...) -> None: ...
+
+class QueryLogsRequest(_message.Message):
+    __slots__ = ("trace_id", "span_id", "severity_text", "body", "attributes", "limit")
+    class AttributesEntry(_message.Message):
+        __slots__ = ("key", "value")
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: str
+        value: str
+        def __init__(self, key: _Optional[str] = ..., value: _Optional[str] = ...) -> None: ...
+    TRACE_ID_FIELD_NUMBER: _ClassVar[int]
+    SPAN_ID_FIELD_NUMBER: _ClassVar[int]
+    SEVERITY_TEXT_FIELD_NUMBER: _ClassVar[int]
+    BODY_FIELD_NUMBER: _ClassVar[int]
+    ATTRIBUTES_FIELD_NUMBER: _ClassVar[int]
+    LIMIT_FIELD_NUMBER: _ClassVar[int]
+    trace_id: bytes
+    span_id: bytes
+    severity_text: str
+    body: str
+    attributes: _containers.ScalarMap[str, str]
+    limit: int
+    def __init__(self, trace_id: _Optional[bytes] = ..., span_id: _Optional[bytes] = ..., severity_text: _Optional[str] = ..., body: _Optional[str] = ..., attributes: _Optional[_Mapping[str, str]] = ..., limit: _Optional[int] = ...) -> None: ...
+
+class QueryLogsResponse(_message.Message):
+    __slots__ = ("logs", "cursor")
+    LOGS_FIELD_NUMBER: _ClassVar[int]
+    CURSOR_FIELD_NUMBER: _ClassVar[int]
+    logs: _containers.RepeatedScalarFieldContainer[bytes]
+    cursor: int
+    def __init__(self, logs: _Optional[_Iterable[bytes]] = ..., cursor: _Optional[int] = ...) -> None: ...
+
+class GetTraceTreeRequest(_message.Message):
+    __slots__ = ("trace_id",)
+    TRACE_ID_FIELD_NUMBER: _ClassVar[int]
+    trace_id: bytes
+    def __init__(self, trace_id: _Optional[bytes] = ...) -> None: ...
+
+class TraceTreeNode(_message.Message):
+    __slots__ = ("span_id", "parent_span_id", "parent_index", "depth", "service_name", "name", "kind", "start_time_unix_nano", "end_time_unix_nano", "self_time_nanos", "critical_path_nanos")
+    SPAN_ID_FIELD_NUMBER: _ClassVar[int]
+    PARENT_SPAN_ID_FIELD_NUMBER: _ClassVar[int]
+    PARENT_INDEX_FIELD_NUMBER: _ClassVar[int]
+    DEPTH_FIELD_NUMBER: _ClassVar[int]
+    SERVICE_NAME_FIELD_NUMBER: _ClassVar[int]
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    KIND_FIELD_NUMBER: _ClassVar[int]
+    START_TIME_UNIX_NANO_FIELD_NUMBER: _ClassVar[int]
+    END_TIME_UNIX_NANO_FIELD_NUMBER: _ClassVar[int]
+    SELF_TIME_NANOS_FIELD_NUMBER: _ClassVar[int]
+    CRITICAL_PATH_NANOS_FIELD_NUMBER: _ClassVar[int]
+    span_id: bytes
+    parent_span_id: bytes
+    parent_index: int
+    depth: int
+    service_name: str
+    name: str
+    kind: int
+    start_time_unix_nano: int
+    end_time_unix_nano: int
+    self_time_nanos: int
+    critical_path_nanos: int
+    def __init__(self, span_id: _Optional[bytes] = ..., parent_span_id: _Optional[bytes] = ..., parent_index: _Optional[int] = ..., depth: _Optional[int] = ..., service_name: _Optional[str] = ..., name: _Optional[str] = ..., kind: _Optional[int] = ..., start_time_unix_nano: _Optional[int] = ..., end_time_unix_nano: _Optional[int] = ..., self_time_nanos: _Optional[int] = ..., critical_path_nanos: _Optional[int] = ...) -> None: ...
+
+class CriticalPathSegment(_message.Message):
+    __slots__ = ("span_id", "start_time_unix_nano", "end_time_unix_nano")
+    SPAN_ID_FIELD_NUMBER: _ClassVar[int]
+    START_TIME_UNIX_NANO_FIELD_NUMBER: _ClassVar[int]
+    END_TIME_UNIX_NANO_FIELD_NUMBER: _ClassVar[int]
+    span_id: bytes
+    start_time_unix_nano: int
+    end_time_unix_nano: int
+    def __init__(self, span_id: _Optional[bytes] = ..., start_time_unix_nano: _Optional[int] = ..., end_time_unix_nano: _Optional[int] = ...) -> None: ...
+
+class GetTraceTreeResponse(_message.Message):
+    __slots__ = ("nodes", "critical_path")
+    NODES_FIELD_NUMBER: _ClassVar[int]
+    CRITICAL_PATH_FIELD_NUMBER: _ClassVar[int]
+    nodes: _containers.RepeatedCompositeFieldContainer[TraceTreeNode]
+    critical_path: _containers.RepeatedCompositeFieldContainer[CriticalPathSegment]
+    def __init__(self, nodes: _Optional[_Iterable[_Union[TraceTreeNode, _Mapping]]] = ..., critical_path: _Optional[_Iterable[_Union[CriticalPathSegment, _Mapping]]] = ...) -> None: ...
+
+class GetStorageStatsRequest(_message.Message):
+    __slots__ = ()
+    def __init__(self) -> None: ...
+
+class StorageStats(_message.Message):
+    __slots__ = ("stored_exports", "stored_bytes", "evicted_exports", "evicted_bytes", "max_exports", "max_bytes")
+    STORED_EXPORTS_FIELD_NUMBER: _ClassVar[int]
+    STORED_BYTES_FIELD_NUMBER: _ClassVar[int]
+    EVICTED_EXPORTS_FIELD_NUMBER: _ClassVar[int]
+    EVICTED_BYTES_FIELD_NUMBER: _ClassVar[int]
+    MAX_EXPORTS_FIELD_NUMBER: _ClassVar[int]
+    MAX_BYTES_FIELD_NUMBER: _ClassVar[int]
+    stored_exports: int
+    stored_bytes: int
+    evicted_exports: int
+    evicted_bytes: int
+    max_exports: int
+    max_bytes: int
+    def __init__(self, stored_exports: _Optional[int] = ..., stored_bytes: _Optional[int] = ..., evicted_exports: _Optional[int] = ..., evicted_bytes: _Optional[int] = ..., max_exports: _Optional[int] = ..., max_bytes: _Optional[int] = ...) -> None: ...
+
+class GetStorageStatsResponse(_message.Message):
+    __slots__ = ("traces", "metrics", "logs")
+    TRACES_FIELD_NUMBER: _ClassVar[int]
+    METRICS_FIELD_NUMBER: _ClassVar[int]
+    LOGS_FIELD_NUMBER: _ClassVar[int]
+    traces: StorageStats
+    metrics: StorageStats
+    logs: StorageStats
+    def __init__(self, traces: _Optional[_Union[StorageStats, _Mapping]] = ..., metrics: _Optional[_Union[StorageStats, _Mapping]] = ..., logs: _Optional[_Union[StorageStats, _Mapping]] = ...) -> None: ...
+
+class GetSoakStatsRequest(_message.Message):
+    __slots__ = ()
+    def __init__(self) -> None: ...
+
+class SignalCounts(_message.Message):
+    __slots__ = ("exports", "bytes")
+    EXPORTS_FIELD_NUMBER: _ClassVar[int]
+    BYTES_FIELD_NUMBER: _ClassVar[int]
+    exports: int
+    bytes: int
+    def __init__(self, exports: _Optional[int] = ..., bytes: _Optional[int] = ...) -> None: ...
+
+class SpanCount(_message.Message):
+    __slots__ = ("service_name", "name", "kind", "count")
+    SERVICE_NAME_FIELD_NUMBER: _ClassVar[int]
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    KIND_FIELD_NUMBER: _ClassVar[int]
+    COUNT_FIELD_NUMBER: _ClassVar[int]
+    service_name: str
+    name: str
+    kind: int
+    count: int
+    def __init__(self, service_name: _Optional[str] = ..., name: _Optional[str] = ..., kind: _Optional[int] = ..., count: _Optional[int] = ...) -> None: ...
+
+class MetricPointCount(_message.Message):
+    __slots__ = ("name", "count")
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    COUNT_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    count: int
+    def __init__(self, name: _Optional[str] = ..., count: _Optional[int] = ...) -> None: ...
+
+class LogRecordCount(_message.Message):
+    __slots__ = ("service_name", "count", "correlated_count")
+    SERVICE_NAME_FIELD_NUMBER: _ClassVar[int]
+    COUNT_FIELD_NUMBER: _ClassVar[int]
+    CORRELATED_COUNT_FIELD_NUMBER: _ClassVar[int]
+    service_name: str
+    count: int
+    correlated_count: int
+    def __init__(self, service_name: _Optional[str] = ..., count: _Optional[int] = ..., correlated_count: _Optional[int] = ...) -> None: ...
+
+class GetSoakStatsResponse(_message.Message):
+    __slots__ = ("traces", "metrics", "span_counts", "metric_point_counts", "elapsed_seconds", "exports_per_second", "logs", "log_record_counts")
+    TRACES_FIELD_NUMBER: _ClassVar[int]
+    METRICS_FIELD_NUMBER: _ClassVar[int]
+    SPAN_COUNTS_FIELD_NUMBER: _ClassVar[int]
+    METRIC_POINT_COUNTS_FIELD_NUMBER: _ClassVar[int]
+    ELAPSED_SECONDS_FIELD_NUMBER: _ClassVar[int]
+    EXPORTS_PER_SECOND_FIELD_NUMBER: _ClassVar[int]
+    LOGS_FIELD_NUMBER: _ClassVar[int]
+    LOG_RECORD_COUNTS_FIELD_NUMBER: _ClassVar[int]
+    traces: SignalCounts
+    metrics: SignalCounts
+    span_counts: _containers.RepeatedCompositeFieldContainer[SpanCount]
+    metric_point_counts: _containers.RepeatedCompositeFieldContainer[MetricPointCount]
+    elapsed_seconds: float
+    exports_per_second: float
+    logs: SignalCounts
+    log_record_counts: _containers.RepeatedCompositeFieldContainer[LogRecordCount]
+    def __init__(self, traces: _Optional[_Union[SignalCounts, _Mapping]] = ..., metrics: _Optional[_Union[SignalCounts, _Mapping]] = ..., span_counts: _Optional[_Iterable[_Union[SpanCount, _Mapping]]] = ..., metric_point_counts: _Optional[_Iterable[_Union[MetricPointCount, _Mapping]]] = ..., elapsed_seconds: _Optional[float] = ..., exports_per_second: _Optional[float] = ..., logs: _Optional[_Union[SignalCounts, _Mapping]] = ..., log_record_counts: _Optional[_Iterable[_Union[LogRecordCount, _Mapping]]] = ...) -> None: ...
+
+class LatencyFault(_message.Message):
+    __slots__ = ("distribution", "min_millis", "max_millis", "mean_millis")
+    class Distribution(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+        __slots__ = ()
+        CONSTANT: _ClassVar[LatencyFault.Distribution]
+        UNIFORM: _ClassVar[LatencyFault.Distribution]
+        EXPONENTIAL: _ClassVar[LatencyFault.Distribution]
+    CONSTANT: LatencyFault.Distribution
+    UNIFORM: LatencyFault.Distribution
+    EXPONENTIAL: LatencyFault.Distribution
+    DISTRIBUTION_FIELD_NUMBER: _ClassVar[int]
+    MIN_MILLIS_FIELD_NUMBER: _ClassVar[int]
+    MAX_MILLIS_FIELD_NUMBER: _ClassVar[int]
+    MEAN_MILLIS_FIELD_NUMBER: _ClassVar[int]
+    distribution: LatencyFault.Distribution
+    min_millis: float
+    max_millis: float
+    mean_millis: float
+    def __init__(self, distribution: _Optional[_Union[LatencyFault.Distribution, str]] = ..., min_millis: _Optional[float] = ..., max_millis: _Optional[float] = ..., mean_millis: _Optional[float] = ...) -> None: ...
+
+class FaultConfig(_message.Message):
+    __slots__ = ("latency", "unavailable_fraction", "resource_exhausted_fraction", "hang_fraction", "partial_success_fraction", "rejected_item_fraction", "partial_success_message")
+    LATENCY_FIELD_NUMBER: _ClassVar[int]
+    UNAVAILABLE_FRACTION_FIELD_NUMBER: _ClassVar[int]
+    RESOURCE_EXHAUSTED_FRACTION_FIELD_NUMBER: _ClassVar[int]
+    HANG_FRACTION_FIELD_NUMBER: _ClassVar[int]
+    PARTIAL_SUCCESS_FRACTION_FIELD_NUMBER: _ClassVar[int]
+    REJECTED_ITEM_FRACTION_FIELD_NUMBER: _ClassVar[int]
+    PARTIAL_SUCCESS_MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    latency: LatencyFault
+    unavailable_fraction: float
+    resource_exhausted_fraction: float
+    hang_fraction: float
+    partial_success_fraction: float
+    rejected_item_fraction: float
+    partial_success_message: str
+    def __init__(self, latency: _Optional[_Union[LatencyFault, _Mapping]] = ..., unavailable_fraction: _Optional[float] = ..., resource_exhausted_fraction: _Optional[float] = ..., hang_fraction: _Optional[float] = ..., partial_success_fraction: _Optional[float] = ..., rejected_item_fraction: _Optional[float] = ..., partial_success_message: _Optional[str] = ...) -> None: ...
+
+class ConfigureFaultsRequest(_message.Message):
+    __slots__ = ("traces", "metrics", "logs", "seed")
+    TRACES_FIELD_NUMBER: _ClassVar[int]
+    METRICS_FIELD_NUMBER: _ClassVar[int]
+    LOGS_FIELD_NUMBER: _ClassVar[int]
+    SEED_FIELD_NUMBER: _ClassVar[int]
+    traces: FaultConfig
+    metrics: FaultConfig
+    logs: FaultConfig
+    seed: int
+    def __init__(self, traces: _Optional[_Union[FaultConfig, _Mapping]] = ..., metrics: _Optional[_Union[FaultConfig, _Mapping]] = ..., logs: _Optional[_Union[FaultConfig, _Mapping]] = ..., seed: _Optional[int] = ...) -> None: ...
+
+class ConfigureFaultsResponse(_message.Message):
+    __slots__ = ()
+    def __init__(self) -> None: ...
+
+class GetFaultStatsRequest(_message.Message):
+    __slots__ = ()
+    def __init__(self) -> None: ...
+
+class FaultStats(_message.Message):
+    __slots__ = ("exports", "delayed_exports", "total_delay_millis", "unavailable", "resource_exhausted", "hangs", "partial_successes", "rejected_items")
+    EXPORTS_FIELD_NUMBER: _ClassVar[int]
+    DELAYED_EXPORTS_FIELD_NUMBER: _ClassVar[int]
+    TOTAL_DELAY_MILLIS_FIELD_NUMBER: _ClassVar[int]
+    UNAVAILABLE_FIELD_NUMBER: _ClassVar[int]
+    RESOURCE_EXHAUSTED_FIELD_NUMBER: _ClassVar[int]
+    HANGS_FIELD_NUMBER: _ClassVar[int]
+    PARTIAL_SUCCESSES_FIELD_NUMBER: _ClassVar[int]
+    REJECTED_ITEMS_FIELD_NUMBER: _ClassVar[int]
+    exports: int
+    delayed_exports: int
+    total_delay_millis: float
+    unavailable: int
+    resource_exhausted: int
+    hangs: int
+    partial_successes: int
+    rejected_items: int
+    def __init__(self, exports: _Optional[int] = ..., delayed_exports: _Optional[int] = ..., total_delay_millis: _Optional[float] = ..., unavailable: _Optional[int] = ..., resource_exhausted: _Optional[int] = ..., hangs: _Optional[int] = ..., partial_successes: _Optional[int] = ..., rejected_items: _Optional[int] = ...) -> None: ...
+
+class GetFaultStatsResponse(_message.Message):
+    __slots__ = ("traces", "metrics", "logs")
+    TRACES_FIELD_NUMBER: _ClassVar[int]
+    METRICS_FIELD_NUMBER: _ClassVar[int]
+    LOGS_FIELD_NUMBER: _ClassVar[int]
+    traces: FaultStats
+    metrics: FaultStats
+    logs: FaultStats
+    def __init__(self, traces: _Optional[_Union[FaultStats, _Mapping]] = ..., metrics: _Optional[_Union[FaultStats, _Mapping]] = ..., logs: _Optional[_Union[FaultStats, _Mapping]] = ...) -> None: ...
+
+class GetWireStatsRequest(_message.Message):
+    __slots__ = ()
+    def __init__(self) -> None: ...
+
+class ExportSize(_message.Message):
+    __slots__ = ("signal", "received_time_unix_nano", "protocol", "content_encoding", "uncompressed_bytes", "compressed_bytes", "estimated_compressed_bytes", "service_names")
+    SIGNAL_FIELD_NUMBER: _ClassVar[int]
+    RECEIVED_TIME_UNIX_NANO_FIELD_NUMBER: _ClassVar[int]
+    PROTOCOL_FIELD_NUMBER: _ClassVar[int]
+    CONTENT_ENCODING_FIELD_NUMBER: _ClassVar[int]
+    UNCOMPRESSED_BYTES_FIELD_NUMBER: _ClassVar[int]
+    COMPRESSED_BYTES_FIELD_NUMBER: _ClassVar[int]
+    ESTIMATED_COMPRESSED_BYTES_FIELD_NUMBER: _ClassVar[int]
+    SERVICE_NAMES_FIELD_NUMBER: _ClassVar[int]
+    signal: str
+    received_time_unix_nano: int
+    protocol: str
+    content_encoding: str
+    uncompressed_bytes: int
+    compressed_bytes: int
+    estimated_compressed_bytes: int
+    service_names: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, signal: _Optional[str] = ..., received_time_unix_nano: _Optional[int] = ..., protocol: _Optional[str] = ..., content_encoding: _Optional[str] = ..., uncompressed_bytes: _Optional[int] = ..., compressed_bytes: _Optional[int] = ..., estimated_compressed_bytes: _Optional[int] = ..., service_names: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class ServiceSize(_message.Message):
+    __slots__ = ("signal", "service_name", "exports", "uncompressed_bytes", "compressed_bytes", "estimated_compressed_bytes")
+    SIGNAL_FIELD_NUMBER: _ClassVar[int]
+    SERVICE_NAME_FIELD_NUMBER: _ClassVar[int]
+    EXPORTS_FIELD_NUMBER: _ClassVar[int]
+    UNCOMPRESSED_BYTES_FIELD_NUMBER: _ClassVar[int]
+    COMPRESSED_BYTES_FIELD_NUMBER: _ClassVar[int]
+    ESTIMATED_COMPRESSED_BYTES_FIELD_NUMBER: _ClassVar[int]
+    signal: str
+    service_name: str
+    exports: int
+    uncompressed_bytes: int
+    compressed_bytes: int
+    estimated_compressed_bytes: int
+    def __init__(self, signal: _Optional[str] = ..., service_name: _Optional[str] = ..., exports: _Optional[int] = ..., uncompressed_bytes: _Optional[int] = ..., compressed_bytes: _Optional[int] = ..., estimated_compressed_bytes: _Optional[int] = ...) -> None: ...
+
+class AttributeSize(_message.Message):
+    __slots__ = ("signal", "key", "count", "uncompressed_bytes")
+    SIGNAL_FIELD_NUMBER: _ClassVar[int]
+    KEY_FIELD_NUMBER: _ClassVar[int]
+    COUNT_FIELD_NUMBER: _ClassVar[int]
+    UNCOMPRESSED_BYTES_FIELD_NUMBER: _ClassVar[int]
+    signal: str
+    key: str
+    count: int
+    uncompressed_bytes: int
+    def __init__(self, signal: _Optional[str] = ..., key: _Optional[str] = ..., count: _Optional[int] = ..., uncompressed_bytes: _Optional[int] = ...) -> None: ...
+
+class GetWireStatsResponse(_message.Message):
+    __slots__ = ("exports", "services", "attributes")
+    EXPORTS_FIELD_NUMBER: _ClassVar[int]
+    SERVICES_FIELD_NUMBER: _ClassVar[int]
+    ATTRIBUTES_FIELD_NUMBER: _ClassVar[int]
+    exports: _containers.RepeatedCompositeFieldContainer[ExportSize]
+    services: _containers.RepeatedCompositeFieldContainer[ServiceSize]
+    attributes: _containers.RepeatedCompositeFieldContainer[AttributeSize]
+    def __init__(self, exports: _Optional[_Iterable[_Union[ExportSize, _Mapping]]] = ..., services: _Optional[_Iterable[_Union[ServiceSize, _Mapping]]] = ..., attributes: _Optional[_Iterable[_Union[AttributeSize, _Mapping]]] = ...) -> None: ...
+
+class GetDuplicateSpanStatsRequest(_message.Message):
+    __slots__ = ()
+    def __init__(self) -> None: ...
+
+class DuplicateSpanCount(_message.Message):
+    __slots__ = ("service_name", "count")
+    SERVICE_NAME_FIELD_NUMBER: _ClassVar[int]
+    COUNT_FIELD_NUMBER: _ClassVar[int]
+    service_name: str
+    count: int
+    def __init__(self, service_name: _Optional[str] = ..., count: _Optional[int] = ...) -> None: ...
+
+class GetDuplicateSpanStatsResponse(_message.Message):
+    __slots__ = ("duplicate_span_counts",)
+    DUPLICATE_SPAN_COUNTS_FIELD_NUMBER: _ClassVar[int]
+    duplicate_span_counts: _containers.RepeatedCompositeFieldContainer[DuplicateSpanCount]
+    def __init__(self, duplicate_span_counts: _Optional[_Iterable[_Union[DuplicateSpanCount, _Mapping]]] = ...) -> None: ...
@@ -30,6 +30,81 @@ class MockCollectorServiceStub(object):
                 request_serializer=mock__collector__service__pb2.GetMetricsRequest.SerializeToString,
                 response_deserializer=mock__collector__service__pb2.GetMetricsResponse.FromString,
                 )
+        self.get_logs = channel.unary_unary(
+                '/MockCollectorService/get_logs',
+                request_serializer=mock__collector__service__pb2.GetLogsRequest.SerializeToString,
+                response_deserializer=mock__collector__service__pb2.GetLogsResponse.FromString,
+                )
+        self.watch_traces = channel.unary_stream(
+                '/MockCollectorService/watch_traces',
+                request_serializer=mock__collector__service__pb2.GetTracesRequest.SerializeToString,
+                response_deserializer=mock__collector__service__pb2.GetTracesResponse.FromString,
+                )
+        self.watch_metrics = channel.unary_stream(
+                '/MockCollectorService/watch_metrics',
+                request_serializer=mock__collector__service__pb2.GetMetricsRequest.SerializeToString,
+                response_deserializer=mock__collector__service__pb2.GetMetricsResponse.FromString,
+                )
+        self.watch_logs = channel.unary_stream(
+                '/MockCollectorService/watch_logs',
+                request_serializer=mock__collector__service__pb2.GetLogsRequest.SerializeToString,
+                response_deserializer=mock__collector__service__pb2.GetLogsResponse.FromString,
+                )
+        self.wait_for_spans = channel.unary_unary(
+                '/MockCollectorService/wait_for_spans',
+                request_serializer=mock__collector__service__pb2.WaitForSpansRequest.SerializeToString,
+                response_deserializer=mock__collector__service__pb2.WaitForSpansResponse.FromString,
+                )
+        self.wait_for_metrics = channel.unary_unary(
+                '/MockCollectorService/wait_for_metrics',
+                request_serializer=mock__collector__service__pb2.WaitForMetricsRequest.SerializeToString,
+                response_deserializer=mock__collector__service__pb2.WaitForMetricsResponse.FromString,
+                )
+        self.query_spans = channel.unary_unary(
+                '/MockCollectorService/query_spans',
+                request_serializer=mock__collector__service__pb2.QuerySpansRequest.SerializeToString,
+                response_deserializer=mock__collector__service__pb2.QuerySpansResponse.FromString,
+                )
+        self.query_logs = channel.unary_unary(
+                '/MockCollectorService/query_logs',
+                request_serializer=mock__collector__service__pb2.QueryLogsRequest.SerializeToString,
+                response_deserializer=mock__collector__service__pb2.QueryLogsResponse.FromString,
+                )
+        self.get_trace_tree = channel.unary_unary(
+                '/MockCollectorService/get_trace_tree',
+                request_serializer=mock__collector__service__pb2.GetTraceTreeRequest.SerializeToString,
+                response_deserializer=mock__collector__service__pb2.GetTraceTreeResponse.FromString,
+                )
+        self.get_storage_stats = channel.unary_unary(
+                '/MockCollectorService/get_storage_stats',
+                request_serializer=mock__collector__service__pb2.GetStorageStatsRequest.SerializeToString,
+                response_deserializer=mock__collector__service__pb2.GetStorageStatsResponse.FromString,
+                )
+        self.get_soak_stats = channel.unary_unary(
+                '/MockCollectorService/get_soak_stats',
+                request_serializer=mock__collector__service__pb2.GetSoakStatsRequest.SerializeToString,
+                response_deserializer=mock__collector__service__pb2.GetSoakStatsResponse.FromString,
+                )
+        self.configure_faults = channel.unary_unary(
+                '/MockCollectorService/configure_faults',
+                request_serializer=mock__collector__service__pb2.ConfigureFaultsRequest.SerializeToString,
+                response_deserializer=mock__collector__service__pb2.ConfigureFaultsResponse.FromString,
+                )
+        self.get_fault_stats = channel.unary_unary(
+                '/MockCollectorService/get_fault_stats',
+                request_serializer=mock__collector__service__pb2.GetFaultStatsRequest.SerializeToString,
+                response_deserializer=mock__collector__service__pb2.GetFaultStatsResponse.FromString,
+                )
+        self.get_wire_stats = channel.unary_unary(
+                '/MockCollectorService/get_wire_stats',
+                request_serializer=mock__collector__service__pb2.GetWireStatsRequest.SerializeToString,
+                response_deserializer=mock__collector__service__pb2.GetWireStatsResponse.FromString,
+                )
+        self.get_duplicate_span_stats = channel.unary_unary(
+                '/MockCollectorService/get_duplicate_span_stats',
+                request_serializer=mock__collector__service__pb2.GetDuplicateSpanStatsRequest.SerializeToString,
+                response_deserializer=mock__collector__service__pb2.GetDuplicateSpanStatsResponse.FromString,
+                )
 
 
 class MockCollectorServiceServicer(object):
@@ -37,7 +112,7 @@ class MockCollectorServiceServicer(object):
     """
 
     def clear(self, request, context):
-        """Clears all traces and metrics captured by  mock collector, so it can be used for multiple tests.
+        """Clears all traces, metrics and logs captured by  mock collector, so it can be used for multiple tests.
         """
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details('Method not implemented!')
@@ -57,6 +132,121 @@ class MockCollectorServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def get_logs(self, request, context):
+        """Returns logs exported to mock collector
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def watch_traces(self, request, context):
+        """Streams traces exported to mock collector. The first response replays the traces received after the requested
+        cursor, and every following response carries the traces received since the previous one.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def watch_metrics(self, request, context):
+        """Streams metrics exported to mock collector, in the same way as watch_traces.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def watch_logs(self, request, context):
+        """Streams logs exported to mock collector, in the same way as watch_traces.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def wait_for_spans(self, request, context):
+        """Waits until enough spans matching a predicate are exported to mock collector, or the timeout elapses, and returns
+        the matching spans.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def wait_for_metrics(self, request, context):
+        """Waits until metrics with all the requested names are exported to mock collector, or the timeout elapses, and
+        returns the metrics with those names.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def query_spans(self, request, context):
+        """Returns the spans exported to mock collector matching a query, looked up through the indexes of the collector.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def query_logs(self, request, context):
+        """Returns the log records exported to mock collector matching a query, looked up through the indexes of the
+        collector.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def get_trace_tree(self, request, context):
+        """Returns the stored spans of a trace assembled into a tree, with the self time and critical path time of each span,
+        without the spans themselves. Returns no nodes for a trace without stored spans.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def get_storage_stats(self, request, context):
+        """Returns how much telemetry mock collector currently stores, and how much it evicted to stay within its budget.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def get_soak_stats(self, request, context):
+        """Returns the counters of mock collector in soak mode, where exports are only counted and then dropped. Fails with
+        FAILED_PRECONDITION if mock collector is not in soak mode.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def configure_faults(self, request, context):
+        """Configures the faults mock collector injects into the Export rpcs of each signal, replacing the previous
+        configuration and resetting the fault stats. Signals left unset are served without faults.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def get_fault_stats(self, request, context):
+        """Returns the faults mock collector injected since they were last configured.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def get_wire_stats(self, request, context):
+        """Returns the uncompressed sizes of the exports received since the mock collector was last cleared, along with their
+        compressed sizes, measured or estimated, per export, per service and per attribute key. Fails with
+        FAILED_PRECONDITION unless wire stats are enabled.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def get_duplicate_span_stats(self, request, context):
+        """Returns the spans mock collector received more than once since it was last cleared, per service, which it only
+        stored once. Fails with FAILED_PRECONDITION unless duplicate spans are filtered.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_MockCollectorServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -75,6 +265,81 @@ def add_MockCollectorServiceServicer_to_server(servicer, server):
                     request_deserializer=mock__collector__service__pb2.GetMetricsRequest.FromString,
                     response_serializer=mock__collector__service__pb2.GetMetricsResponse.SerializeToString,
             ),
+            'get_logs': grpc.unary_unary_rpc_method_handler(
+                    servicer.get_logs,
+                    request_deserializer=mock__collector__service__pb2.GetLogsRequest.FromString,
+                    response_serializer=mock__collector__service__pb2.GetLogsResponse.SerializeToString,
+            ),
+            'watch_traces': grpc.unary_stream_rpc_method_handler(
+                    servicer.watch_traces,
+                    request_deserializer=mock__collector__service__pb2.GetTracesRequest.FromString,
+                    response_serializer=mock__collector__service__pb2.GetTracesResponse.SerializeToString,
+            ),
+            'watch_metrics': grpc.unary_stream_rpc_method_handler(
+                    servicer.watch_metrics,
+                    request_deserializer=mock__collector__service__pb2.GetMetricsRequest.FromString,
+                    response_serializer=mock__collector__service__pb2.GetMetricsResponse.SerializeToString,
+            ),
+            'watch_logs': grpc.unary_stream_rpc_method_handler(
+                    servicer.watch_logs,
+                    request_deserializer=mock__collector__service__pb2.GetLogsRequest.FromString,
+                    response_serializer=mock__collector__service__pb2.GetLogsResponse.SerializeToString,
+            ),
+            'wait_for_spans': grpc.unary_unary_rpc_method_handler(
+                    servicer.wait_for_spans,
+                    request_deserializer=mock__collector__service__pb2.WaitForSpansRequest.FromString,
+                    response_serializer=mock__collector__service__pb2.WaitForSpansResponse.SerializeToString,
+            ),
+            'wait_for_metrics': grpc.unary_unary_rpc_method_handler(
+                    servicer.wait_for_metrics,
+                    request_deserializer=mock__collector__service__pb2.WaitForMetricsRequest.FromString,
+                    response_serializer=mock__collector__service__pb2.WaitForMetricsResponse.SerializeToString,
+            ),
+            'query_spans': grpc.unary_unary_rpc_method_handler(
+                    servicer.query_spans,
+                    request_deserializer=mock__collector__service__pb2.QuerySpansRequest.FromString,
+                    response_serializer=mock__collector__service__pb2.QuerySpansResponse.SerializeToString,
+            ),
+            'query_logs': grpc.unary_unary_rpc_method_handler(
+                    servicer.query_logs,
+                    request_deserializer=mock__collector__service__pb2.QueryLogsRequest.FromString,
+                    response_serializer=mock__collector__service__pb2.QueryLogsResponse.SerializeToString,
+            ),
+            'get_trace_tree': grpc.unary_unary_rpc_method_handler(
+                    servicer.get_trace_tree,
+                    request_deserializer=mock__collector__service__pb2.GetTraceTreeRequest.FromString,
+                    response_serializer=mock__collector__service__pb2.GetTraceTreeResponse.SerializeToString,
+            ),
+            'get_storage_stats': grpc.unary_unary_rpc_method_handler(
+                    servicer.get_storage_stats,
+                    request_deserializer=mock__collector__service__pb2.GetStorageStatsRequest.FromString,
+                    response_serializer=mock__collector__service__pb2.GetStorageStatsResponse.SerializeToString,
+            ),
+            'get_soak_stats': grpc.unary_unary_rpc_method_handler(
+                    servicer.get_soak_stats,
+                    request_deserializer=mock__collector__service__pb2.GetSoakStatsRequest.FromString,
+                    response_serializer=mock__collector__service__pb2.GetSoakStatsResponse.SerializeToString,
+            ),
+            'configure_faults': grpc.unary_unary_rpc_method_handler(
+                    servicer.configure_faults,
+                    request_deserializer=mock__collector__service__pb2.ConfigureFaultsRequest.FromString,
+                    response_serializer=mock__collector__service__pb2.ConfigureFaultsResponse.SerializeToString,
+            ),
+            'get_fault_stats': grpc.unary_unary_rpc_method_handler(
+                    servicer.get_fault_stats,
+                    request_deserializer=mock__collector__service__pb2.GetFaultStatsRequest.FromString,
+                    response_serializer=mock__collector__service__pb2.GetFaultStatsResponse.SerializeToString,
+            ),
+            'get_wire_stats': grpc.unary_unary_rpc_method_handler(
+                    servicer.get_wire_stats,
+                    request_deserializer=mock__collector__service__pb2.GetWireStatsRequest.FromString,
+                    response_serializer=mock__collector__service__pb2.GetWireStatsResponse.SerializeToString,
+            ),
+            'get_duplicate_span_stats': grpc.unary_unary_rpc_method_handler(
+                    servicer.get_duplicate_span_stats,
+                    request_deserializer=mock__collector__service__pb2.GetDuplicateSpanStatsRequest.FromString,
+                    response_serializer=mock__collector__service__pb2.GetDuplicateSpanStatsResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'MockCollectorService', rpc_method_handlers)
@@ -136,3 +401,258 @@ class MockCollectorService(object):
             mock__collector__service__pb2.GetMetricsResponse.FromString,
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def get_logs(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/MockCollectorService/get_logs',
+            mock__collector__service__pb2.GetLogsRequest.SerializeToString,
+            mock__collector__service__pb2.GetLogsResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def watch_traces(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(request, target, '/MockCollectorService/watch_traces',
+            mock__collector__service__pb2.GetTracesRequest.SerializeToString,
+            mock__collector__service__pb2.GetTracesResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def watch_metrics(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(request, target, '/MockCollectorService/watch_metrics',
+            mock__collector__service__pb2.GetMetricsRequest.SerializeToString,
+            mock__collector__service__pb2.GetMetricsResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def watch_logs(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(request, target, '/MockCollectorService/watch_logs',
+            mock__collector__service__pb2.GetLogsRequest.SerializeToString,
+            mock__collector__service__pb2.GetLogsResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def wait_for_spans(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/MockCollectorService/wait_for_spans',
+            mock__collector__service__pb2.WaitForSpansRequest.SerializeToString,
+            mock__collector__service__pb2.WaitForSpansResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def wait_for_metrics(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/MockCollectorService/wait_for_metrics',
+            mock__collector__service__pb2.WaitForMetricsRequest.SerializeToString,
+            mock__collector__service__pb2.WaitForMetricsResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def query_spans(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/MockCollectorService/query_spans',
+            mock__collector__service__pb2.QuerySpansRequest.SerializeToString,
+            mock__collector__service__pb2.QuerySpansResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def query_logs(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/MockCollectorService/query_logs',
+            mock__collector__service__pb2.QueryLogsRequest.SerializeToString,
+            mock__collector__service__pb2.QueryLogsResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def get_trace_tree(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/MockCollectorService/get_trace_tree',
+            mock__collector__service__pb2.GetTraceTreeRequest.SerializeToString,
+            mock__collector__service__pb2.GetTraceTreeResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def get_storage_stats(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/MockCollectorService/get_storage_stats',
+            mock__collector__service__pb2.GetStorageStatsRequest.SerializeToString,
+            mock__collector__service__pb2.GetStorageStatsResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def get_soak_stats(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/MockCollectorService/get_soak_stats',
+            mock__collector__service__pb2.GetSoakStatsRequest.SerializeToString,
+            mock__collector__service__pb2.GetSoakStatsResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def configure_faults(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/MockCollectorService/configure_faults',
+            mock__collector__service__pb2.ConfigureFaultsRequest.SerializeToString,
+            mock__collector__service__pb2.ConfigureFaultsResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def get_fault_stats(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/MockCollectorService/get_fault_stats',
+            mock__collector__service__pb2.GetFaultStatsRequest.SerializeToString,
+            mock__collector__service__pb2.GetFaultStatsResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def get_wire_stats(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/MockCollectorService/get_wire_stats',
+            mock__collector__service__pb2.GetWireStatsRequest.SerializeToString,
+            mock__collector__service__pb2.GetWireStatsResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def get_duplicate_span_stats(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/MockCollectorService/get_duplicate_span_stats',
+            mock__collector__service__pb2.GetDuplicateSpanStatsRequest.SerializeToString,
+            mock__collector__service__pb2.GetDuplicateSpanStatsResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
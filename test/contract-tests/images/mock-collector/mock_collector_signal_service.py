@@ -0,0 +1,130 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Generic, Iterator, Optional, Type, TypeVar, Union
+
+from google.protobuf.message import Message
+from grpc import Server, ServicerContext, aio
+from mock_collector_capture import CaptureWriter, Signal
+from mock_collector_export_store import ChangeListener, ExportSlice, ExportStore, SharedSequence, StorageStats
+from mock_collector_faults import FaultInjector, PartialSuccess
+from mock_collector_raw_export import add_raw_export_handler_to_server
+from mock_collector_self_telemetry import SelfTelemetry
+from mock_collector_soak_stats import SoakStats
+from mock_collector_wire_stats import GRPC_WIRE_FORMAT, WireFormat, WireStats
+
+# Export request and response messages of a signal.
+Req = TypeVar("Req", bound=Message)
+Res = TypeVar("Res", bound=Message)
+
+
+class MockCollectorSignalService(ABC, Generic[Req, Res]):
+    """Receives the exports of one signal, over OTLP/gRPC or OTLP/HTTP, and stores them in an `ExportStore`.
+
+    Every export goes through the same steps, in this order: faults are injected, then the export is captured, stored,
+    or only counted in soak mode, timed for the self-telemetry, measured for the wire stats, and answered, possibly
+    with a partial success. Subclasses provide the messages of their signal, and can filter exports before they are
+    stored.
+    """
+
+    def __init__(
+        self,
+        signal: Signal,
+        request_type: Type[Req],
+        response_type: Type[Res],
+        service_name: str,
+        max_exports: int = 0,
+        max_bytes: int = 0,
+        soak_stats: Optional[SoakStats] = None,
+        capture: Optional[CaptureWriter] = None,
+        telemetry: Optional[SelfTelemetry] = None,
+        faults: Optional[FaultInjector] = None,
+        wire_stats: Optional[WireStats] = None,
+        sequence: Optional[SharedSequence] = None,
+    ):
+        super().__init__()
+        self._signal: Signal = signal
+        self._response_type: Type[Res] = response_type
+        self._service_name: str = service_name
+        self._soak_stats: Optional[SoakStats] = soak_stats
+        self._capture: Optional[CaptureWriter] = capture
+        self._telemetry: Optional[SelfTelemetry] = telemetry
+        self._faults: Optional[FaultInjector] = faults
+        self._wire_stats: Optional[WireStats] = wire_stats
+        self._export_store: ExportStore[Req] = ExportStore(request_type, max_exports, max_bytes, sequence)
+
+    def get_requests(self, since: int = 0) -> ExportSlice:
+        return self._export_store.get_exports(since)
+
+    def wait_for_requests(self, since: int, start_cursor: int, timeout: float) -> ExportSlice:
+        return self._export_store.wait_for_exports(since, start_cursor, timeout)
+
+    @contextmanager
+    def change_listener(self, listener: ChangeListener) -> Iterator[None]:
+        """Call `listener` whenever exports of the signal are added or cleared, until the end of the `with` block."""
+        self._export_store.add_change_listener(listener)
+        try:
+            yield
+        finally:
+            self._export_store.remove_change_listener(listener)
+
+    def clear_requests(self, through: int = 0) -> int:
+        return self._export_store.clear(through)
+
+    def get_storage_stats(self) -> StorageStats:
+        return self._export_store.get_stats()
+
+    def add_to_server(self, server: Union[Server, aio.Server]) -> None:
+        add_raw_export_handler_to_server(
+            self._service_name, self.Export, self.export_async, self._response_type, server
+        )
+
+    # pylint: disable=invalid-name
+    def Export(self, request: bytes, context: ServicerContext) -> Res:
+        partial_success: Optional[PartialSuccess] = None
+        if self._faults is not None:
+            partial_success = self._faults.inject(self._signal, request, context)
+        return self._export(request, partial_success, GRPC_WIRE_FORMAT)
+
+    async def export_async(self, request: bytes, context: aio.ServicerContext) -> Res:
+        partial_success: Optional[PartialSuccess] = None
+        if self._faults is not None:
+            partial_success = await self._faults.inject_async(self._signal, request, context)
+        return self._export(request, partial_success, GRPC_WIRE_FORMAT)
+
+    def export_http(self, request: bytes, wire_format: WireFormat) -> Res:
+        """Export `request`, decoded from an OTLP/HTTP body received in `wire_format`."""
+        partial_success: Optional[PartialSuccess] = None
+        if self._faults is not None:
+            partial_success = self._faults.inject(self._signal, request, None)
+        return self._export(request, partial_success, wire_format)
+
+    def _export(self, request: bytes, partial_success: Optional[PartialSuccess], wire_format: WireFormat) -> Res:
+        start: float = perf_counter()
+        if self._capture is not None:
+            self._capture.write(self._signal, request)
+        self._store(request)
+        if self._telemetry is not None:
+            self._telemetry.record_export(self._signal, len(request), perf_counter() - start)
+        if self._wire_stats is not None:
+            self._wire_stats.record(self._signal, request, wire_format)
+        if partial_success is not None:
+            return self._create_partial_success_response(partial_success)
+        return self._response_type()
+
+    def _store(self, request: bytes) -> None:
+        """Store export `request`, or count it in soak mode."""
+        if self._soak_stats is not None:
+            self._record_soak_stats(self._soak_stats, request)
+        else:
+            self._export_store.add(request)
+
+    @abstractmethod
+    def _record_soak_stats(self, soak_stats: SoakStats, request: bytes) -> None:
+        pass
+
+    @abstractmethod
+    def _create_partial_success_response(self, partial_success: PartialSuccess) -> Res:
+        """Return the response reporting `partial_success`, in the partial success message of the signal."""
@@ -0,0 +1,155 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+from collections import Counter, deque
+from threading import Lock
+from time import monotonic
+from typing import Counter as CounterType
+from typing import Deque, List, NamedTuple, Optional, Tuple
+
+from mock_collector_resource import get_service_name
+
+from opentelemetry.proto.collector.logs.v1.logs_service_pb2 import ExportLogsServiceRequest
+from opentelemetry.proto.collector.metrics.v1.metrics_service_pb2 import ExportMetricsServiceRequest
+from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import ExportTraceServiceRequest
+
+# Number of past seconds the recent export rate is averaged over.
+_RATE_WINDOW_SEC: int = 10
+
+# Spans are counted by service name, span name and span kind.
+SpanKey = Tuple[str, str, int]
+
+
+class SignalCounts(NamedTuple):
+    exports: int
+    bytes: int
+
+
+class SoakStatsSnapshot(NamedTuple):
+    """Counters of a `SoakStats`, as of the time they were read."""
+
+    traces: SignalCounts
+    metrics: SignalCounts
+    span_counts: CounterType[SpanKey]
+    metric_point_counts: CounterType[str]
+    logs: SignalCounts
+    # Log records by service name, and how many of those carry the trace id of the span they were emitted in.
+    log_record_counts: CounterType[str]
+    correlated_log_record_counts: CounterType[str]
+    elapsed_seconds: float
+    exports_per_second: float
+
+
+class SoakStats:
+    """Thread-safe counters of the telemetry received by the mock collector in soak mode.
+
+    In soak mode, exports are only counted and then dropped, so that the mock collector keeps up with high ingest rates
+    without its memory growing. Besides the totals per signal, the export rate over the last few seconds is tracked
+    from the number of exports received during each second.
+    """
+
+    def __init__(self):
+        self._lock: Lock = Lock()
+        self._reset()
+
+    def record_traces(self, data: bytes) -> None:
+        request: ExportTraceServiceRequest = ExportTraceServiceRequest.FromString(data)
+        span_counts: CounterType[SpanKey] = Counter()
+        for resource_spans in request.resource_spans:
+            service_name: str = get_service_name(resource_spans.resource.attributes)
+            for scope_spans in resource_spans.scope_spans:
+                for span in scope_spans.spans:
+                    span_counts[(service_name, span.name, span.kind)] += 1
+        with self._lock:
+            self._trace_exports += 1
+            self._trace_bytes += len(data)
+            self._span_counts.update(span_counts)
+            self._count_export()
+
+    def record_metrics(self, data: bytes) -> None:
+        request: ExportMetricsServiceRequest = ExportMetricsServiceRequest.FromString(data)
+        point_counts: CounterType[str] = Counter()
+        for resource_metrics in request.resource_metrics:
+            for scope_metrics in resource_metrics.scope_metrics:
+                for metric in scope_metrics.metrics:
+                    data_field: Optional[str] = metric.WhichOneof("data")
+                    if data_field is not None:
+                        point_counts[metric.name] += len(getattr(metric, data_field).data_points)
+        with self._lock:
+            self._metric_exports += 1
+            self._metric_bytes += len(data)
+            self._metric_point_counts.update(point_counts)
+            self._count_export()
+
+    def record_logs(self, data: bytes) -> None:
+        request: ExportLogsServiceRequest = ExportLogsServiceRequest.FromString(data)
+        record_counts: CounterType[str] = Counter()
+        correlated_counts: CounterType[str] = Counter()
+        for resource_logs in request.resource_logs:
+            service_name: str = get_service_name(resource_logs.resource.attributes)
+            for scope_logs in resource_logs.scope_logs:
+                for log_record in scope_logs.log_records:
+                    record_counts[service_name] += 1
+                    if log_record.trace_id:
+                        correlated_counts[service_name] += 1
+        with self._lock:
+            self._log_exports += 1
+            self._log_bytes += len(data)
+            self._log_record_counts.update(record_counts)
+            self._correlated_log_record_counts.update(correlated_counts)
+            self._count_export()
+
+    def get_snapshot(self) -> SoakStatsSnapshot:
+        with self._lock:
+            now: float = monotonic()
+            elapsed_seconds: float = now - self._start_time
+            total_exports: int = self._trace_exports + self._metric_exports + self._log_exports
+            # Average over the last complete seconds, or over the lifetime of the counters if it is shorter than that.
+            current_second: int = int(now)
+            window: int = min(_RATE_WINDOW_SEC, current_second - int(self._start_time))
+            exports_per_second: float = total_exports / elapsed_seconds if elapsed_seconds > 0 else 0.0
+            if window > 0:
+                recent_exports: int = sum(
+                    count
+                    for second, count in self._exports_per_second
+                    if current_second - window <= second < current_second
+                )
+                exports_per_second = recent_exports / window
+            return SoakStatsSnapshot(
+                traces=SignalCounts(self._trace_exports, self._trace_bytes),
+                metrics=SignalCounts(self._metric_exports, self._metric_bytes),
+                span_counts=Counter(self._span_counts),
+                metric_point_counts=Counter(self._metric_point_counts),
+                logs=SignalCounts(self._log_exports, self._log_bytes),
+                log_record_counts=Counter(self._log_record_counts),
+                correlated_log_record_counts=Counter(self._correlated_log_record_counts),
+                elapsed_seconds=elapsed_seconds,
+                exports_per_second=exports_per_second,
+            )
+
+    def reset(self) -> None:
+        with self._lock:
+            self._reset()
+
+    def _reset(self) -> None:
+        self._start_time: float = monotonic()
+        self._trace_exports: int = 0
+        self._trace_bytes: int = 0
+        self._metric_exports: int = 0
+        self._metric_bytes: int = 0
+        self._span_counts: CounterType[SpanKey] = Counter()
+        self._metric_point_counts: CounterType[str] = Counter()
+        self._log_exports: int = 0
+        self._log_bytes: int = 0
+        self._log_record_counts: CounterType[str] = Counter()
+        self._correlated_log_record_counts: CounterType[str] = Counter()
+        # Number of exports received during each of the last seconds, oldest first.
+        self._exports_per_second: Deque[List[int]] = deque()
+
+    def _count_export(self) -> None:
+        current_second: int = int(monotonic())
+        if self._exports_per_second and self._exports_per_second[-1][0] == current_second:
+            self._exports_per_second[-1][1] += 1
+        else:
+            self._exports_per_second.append([current_second, 1])
+            while self._exports_per_second[0][0] < current_second - _RATE_WINDOW_SEC:
+                self._exports_per_second.popleft()
@@ -0,0 +1,71 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+from typing import Hashable, Iterable, Iterator, Tuple
+
+from mock_collector_export_index import ExportIndex
+from mock_collector_export_store import ExportStore
+from mock_collector_interning import ResourceScopeInterner, create_span_interner
+from mock_collector_predicates import SpanMatch, SpanPredicate
+from mock_collector_raw_export import RawExport
+from typing_extensions import override
+
+from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import ExportTraceServiceRequest
+from opentelemetry.proto.trace.v1.trace_pb2 import Span
+
+DEFAULT_INDEXED_ATTRIBUTES: Tuple[str, ...] = (
+    "aws.local.service",
+    "aws.local.operation",
+    "aws.remote.service",
+    "aws.remote.operation",
+)
+
+
+class SpanIndex(ExportIndex[SpanMatch, SpanPredicate]):
+    """Index of the spans held by an `ExportStore`, by trace id, span id, name, kind and selected string attributes."""
+
+    def __init__(
+        self,
+        export_store: ExportStore[ExportTraceServiceRequest],
+        attribute_keys: Iterable[str] = DEFAULT_INDEXED_ATTRIBUTES,
+    ):
+        super().__init__(export_store)
+        self._attribute_keys: Tuple[str, ...] = tuple(attribute_keys)
+
+    @override
+    def _create_interner(self) -> ResourceScopeInterner:
+        return create_span_interner()
+
+    @override
+    def _get_items(self, export: RawExport[ExportTraceServiceRequest]) -> Iterator[SpanMatch]:
+        for interned in self._interner.intern(export.parse()):
+            yield SpanMatch(*interned)
+
+    @override
+    def _get_index_keys(self, item: SpanMatch) -> Iterator[Hashable]:
+        span: Span = item.span
+        yield "trace_id", span.trace_id
+        yield "span_id", span.span_id
+        yield "name", span.name
+        yield "kind", span.kind
+        if self._attribute_keys:
+            for attribute in span.attributes:
+                if attribute.key in self._attribute_keys:
+                    yield "attribute", attribute.key, attribute.value.string_value
+
+    @override
+    def _get_query_keys(self, predicate: SpanPredicate) -> Iterator[Hashable]:
+        if predicate.trace_id:
+            yield "trace_id", predicate.trace_id
+        if predicate.span_id:
+            yield "span_id", predicate.span_id
+        if predicate.name:
+            yield "name", predicate.name
+        if predicate.kind != Span.SPAN_KIND_UNSPECIFIED:
+            yield "kind", predicate.kind
+        for key, value in predicate.attributes.items():
+            if key in self._attribute_keys:
+                yield "attribute", key, value
+
+    @override
+    def _matches(self, predicate: SpanPredicate, item: SpanMatch) -> bool:
+        return predicate.matches(item.span)
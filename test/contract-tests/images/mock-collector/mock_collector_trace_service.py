@@ -1,31 +1,109 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 # SPDX-License-Identifier: Apache-2.0
-from queue import Queue
-from typing import List
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, Tuple
 
-from grpc import ServicerContext
+from mock_collector_capture import CaptureWriter, Signal
+from mock_collector_duplicate_spans import DuplicateSpanFilter
+from mock_collector_export_store import SharedSequence
+from mock_collector_faults import FaultInjector, PartialSuccess
+from mock_collector_predicates import SpanMatch, SpanPredicate, SpanWaiter
+from mock_collector_self_telemetry import SelfTelemetry
+from mock_collector_signal_service import MockCollectorSignalService
+from mock_collector_soak_stats import SoakStats
+from mock_collector_span_index import SpanIndex
+from mock_collector_trace_tree import TraceTree, build_trace_tree
+from mock_collector_wire_stats import WireStats
 from typing_extensions import override
 
+from opentelemetry.proto.collector.trace.v1 import trace_service_pb2
 from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import (
+    ExportTracePartialSuccess,
     ExportTraceServiceRequest,
     ExportTraceServiceResponse,
 )
 from opentelemetry.proto.collector.trace.v1.trace_service_pb2_grpc import TraceServiceServicer
 
 
-class MockCollectorTraceService(TraceServiceServicer):
-    _export_requests: Queue = Queue(maxsize=-1)
+class MockCollectorTraceService(
+    MockCollectorSignalService[ExportTraceServiceRequest, ExportTraceServiceResponse], TraceServiceServicer
+):
+    def __init__(
+        self,
+        max_exports: int = 0,
+        max_bytes: int = 0,
+        soak_stats: Optional[SoakStats] = None,
+        capture: Optional[CaptureWriter] = None,
+        telemetry: Optional[SelfTelemetry] = None,
+        faults: Optional[FaultInjector] = None,
+        wire_stats: Optional[WireStats] = None,
+        sequence: Optional[SharedSequence] = None,
+        duplicate_spans: Optional[DuplicateSpanFilter] = None,
+    ):
+        super().__init__(
+            Signal.TRACES,
+            ExportTraceServiceRequest,
+            ExportTraceServiceResponse,
+            trace_service_pb2.DESCRIPTOR.services_by_name["TraceService"].full_name,
+            max_exports,
+            max_bytes,
+            soak_stats,
+            capture,
+            telemetry,
+            faults,
+            wire_stats,
+            sequence,
+        )
+        self._duplicate_spans: Optional[DuplicateSpanFilter] = duplicate_spans
+        self._span_index: SpanIndex = SpanIndex(self._export_store)
 
-    def get_requests(self) -> List[ExportTraceServiceRequest]:
-        with self._export_requests.mutex:
-            return list(self._export_requests.queue)
+    def wait_for_spans(
+        self, since: int, predicate: SpanPredicate, min_count: int, timeout: float
+    ) -> Tuple[bool, List[SpanMatch]]:
+        """Wait until `min_count` spans matching `predicate` are received after `since`, or `timeout` elapses.
 
-    def clear_requests(self) -> None:
-        with self._export_requests.mutex:
-            self._export_requests.queue.clear()
+        Returns whether they were, and the matching spans received by then.
+        """
+        with self.span_waiter(since, predicate, min_count) as waiter:
+            satisfied: bool = waiter.satisfied.wait(timeout)
+        return satisfied, waiter.get_matches()
+
+    @contextmanager
+    def span_waiter(self, since: int, predicate: SpanPredicate, min_count: int) -> Iterator[SpanWaiter]:
+        """Feed a `SpanWaiter` the exports received after `since`, until the end of the `with` block."""
+        waiter: SpanWaiter = SpanWaiter(predicate, min_count)
+        self._export_store.add_listener(waiter.on_export, since)
+        try:
+            yield waiter
+        finally:
+            self._export_store.remove_listener(waiter.on_export)
+
+    def query_spans(self, predicate: SpanPredicate, limit: int = 0) -> Tuple[List[SpanMatch], int]:
+        """Returns the stored spans matching `predicate`, and the cursor of the last export the query covered."""
+        return self._span_index.query(predicate, limit)
+
+    def get_trace_tree(self, trace_id: bytes) -> TraceTree:
+        """Returns the stored spans of trace `trace_id` assembled into a tree, looked up through the span index."""
+        matches, _ = self._span_index.query(SpanPredicate(trace_id=trace_id))
+        return build_trace_tree(matches)
+
+    @override
+    def _store(self, request: bytes) -> None:
+        # Spans received before, such as from an export retried after it timed out, are only stored or counted once.
+        spans: Optional[bytes] = request
+        if self._duplicate_spans is not None:
+            spans = self._duplicate_spans.filter(request)
+        if spans is not None:
+            super()._store(spans)
+
+    @override
+    def _record_soak_stats(self, soak_stats: SoakStats, request: bytes) -> None:
+        soak_stats.record_traces(request)
 
     @override
-    # pylint: disable=invalid-name
-    def Export(self, request: ExportTraceServiceRequest, context: ServicerContext) -> ExportTraceServiceResponse:
-        self._export_requests.put(request)
-        return ExportTraceServiceResponse()
+    def _create_partial_success_response(self, partial_success: PartialSuccess) -> ExportTraceServiceResponse:
+        return ExportTraceServiceResponse(
+            partial_success=ExportTracePartialSuccess(
+                rejected_spans=partial_success.rejected_items, error_message=partial_success.error_message
+            )
+        )
@@ -0,0 +1,183 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""Assembly of the spans of a trace into a tree, by their parent span ids, for latency breakdowns of a trace without
+shipping every span to the client.
+
+Every span of the tree gets its self time, the part of its duration during which none of its children ran, and the
+time it spent on the critical path of the trace, the chain of spans that determined when the root span ended.
+"""
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from mock_collector_predicates import SpanMatch
+from mock_collector_resource import get_service_name
+from mock_collector_service_pb2 import CriticalPathSegment as CriticalPathSegmentMessage
+from mock_collector_service_pb2 import GetTraceTreeResponse, TraceTreeNode as TraceTreeNodeMessage
+
+from opentelemetry.proto.trace.v1.trace_pb2 import Span
+
+
+class TraceTreeNode(NamedTuple):
+    match: SpanMatch
+    depth: int
+    # Index of the parent of the span in the nodes of the tree, or -1 for a root span.
+    parent_index: int
+    self_time_nanos: int
+    critical_path_nanos: int
+
+
+class CriticalPathSegment(NamedTuple):
+    """Part of the critical path of a trace, during which `span_id` was running and none of its children were."""
+
+    span_id: bytes
+    start_time_unix_nano: int
+    end_time_unix_nano: int
+
+
+class TraceTree(NamedTuple):
+    # Spans in tree order: every span is followed by its children, in the order they started. Spans whose parent is
+    # missing from the trace, such as when it was not received yet, are roots after the root span.
+    nodes: List[TraceTreeNode]
+    # Chronological segments of the critical path of the root span, or of the earliest root if the root span is
+    # missing.
+    critical_path: List[CriticalPathSegment]
+
+
+class _Node:
+    def __init__(self, match: SpanMatch):
+        self.match: SpanMatch = match
+        self.span: Span = match.span
+        self.start: int = match.span.start_time_unix_nano
+        # Spans ending before they start are taken as instantaneous.
+        self.end: int = max(match.span.end_time_unix_nano, self.start)
+        self.children: List[_Node] = []
+
+
+def build_trace_tree(matches: Iterable[SpanMatch]) -> TraceTree:
+    """Assemble the spans of a trace, in the order they were received, into a `TraceTree`.
+
+    A span received more than once is only included once.
+    """
+    nodes: Dict[bytes, _Node] = {}
+    for match in matches:
+        nodes.setdefault(match.span.span_id, _Node(match))
+    roots: List[_Node] = []
+    for node in nodes.values():
+        parent: Optional[_Node] = nodes.get(node.span.parent_span_id) if node.span.parent_span_id else None
+        if parent is None or parent is node:
+            roots.append(node)
+        else:
+            parent.children.append(node)
+    # A true root span comes first, and the spans whose parent is missing after it.
+    roots.sort(key=lambda root: (bool(root.span.parent_span_id), root.start))
+
+    critical_path: List[CriticalPathSegment] = []
+    if roots:
+        _add_critical_path(roots[0], roots[0].end, critical_path)
+        critical_path.reverse()
+    critical_path_nanos: Dict[bytes, int] = {}
+    for segment in critical_path:
+        critical_path_nanos[segment.span_id] = (
+            critical_path_nanos.get(segment.span_id, 0) + segment.end_time_unix_nano - segment.start_time_unix_nano
+        )
+
+    tree_nodes: List[TraceTreeNode] = []
+    visited: Dict[bytes, None] = {}
+    # Spans whose parent links form a cycle are not reachable from any root, and are added as roots afterwards.
+    for root in roots + list(nodes.values()):
+        if root.span.span_id in visited:
+            continue
+        # Depth-first, with an explicit stack rather than recursion, since a trace can be arbitrarily deep.
+        stack: List[Tuple[_Node, int, int]] = [(root, 0, -1)]
+        while stack:
+            node, depth, parent_index = stack.pop()
+            if node.span.span_id in visited:
+                continue
+            visited[node.span.span_id] = None
+            node.children.sort(key=lambda child: child.start)
+            tree_nodes.append(
+                TraceTreeNode(
+                    node.match,
+                    depth,
+                    parent_index,
+                    _get_self_time(node),
+                    critical_path_nanos.get(node.span.span_id, 0),
+                )
+            )
+            index: int = len(tree_nodes) - 1
+            stack.extend((child, depth + 1, index) for child in reversed(node.children))
+    return TraceTree(tree_nodes, critical_path)
+
+
+def to_trace_tree_response(tree: TraceTree) -> GetTraceTreeResponse:
+    return GetTraceTreeResponse(
+        nodes=[
+            TraceTreeNodeMessage(
+                span_id=node.match.span.span_id,
+                parent_span_id=node.match.span.parent_span_id,
+                parent_index=node.parent_index,
+                depth=node.depth,
+                service_name=get_service_name(node.match.resource_spans.resource.attributes),
+                name=node.match.span.name,
+                kind=node.match.span.kind,
+                start_time_unix_nano=node.match.span.start_time_unix_nano,
+                end_time_unix_nano=node.match.span.end_time_unix_nano,
+                self_time_nanos=node.self_time_nanos,
+                critical_path_nanos=node.critical_path_nanos,
+            )
+            for node in tree.nodes
+        ],
+        critical_path=[
+            CriticalPathSegmentMessage(
+                span_id=segment.span_id,
+                start_time_unix_nano=segment.start_time_unix_nano,
+                end_time_unix_nano=segment.end_time_unix_nano,
+            )
+            for segment in tree.critical_path
+        ],
+    )
+
+
+def _get_self_time(node: _Node) -> int:
+    # Children running concurrently, or beyond the end of their parent, only count once and within their parent.
+    self_time: int = node.end - node.start
+    covered_until: int = node.start
+    for child in sorted(node.children, key=lambda child: child.start):
+        start: int = max(child.start, covered_until)
+        end: int = min(child.end, node.end)
+        if end > start:
+            self_time -= end - start
+            covered_until = end
+    return self_time
+
+
+def _add_critical_path(node: _Node, end: int, critical_path: List[CriticalPathSegment]) -> None:
+    """Add the critical path of `node` up to `end` to `critical_path`, latest segment first.
+
+    Walking back from the end of the span, the critical path goes through the child that ended last before that point,
+    up to the start of that child, then through the child that ended last before it, and so on. The time in between,
+    when no child was running, is spent in the span itself.
+    """
+    # Worklist of the spans to walk back through, in place of recursion, with the point to walk back from, and their
+    # children by descending end time along with the index of the next one to consider.
+    pending: List[Tuple[_Node, int, List[_Node], int]] = [(node, end, _by_descending_end(node), 0)]
+    while pending:
+        node, cursor, children, child_index = pending.pop()
+        while child_index < len(children) and cursor > node.start:
+            child: _Node = children[child_index]
+            child_index += 1
+            if child.start >= cursor:
+                continue
+            child_end: int = min(child.end, cursor)
+            if child_end < cursor:
+                critical_path.append(CriticalPathSegment(node.span.span_id, child_end, cursor))
+            # Come back to this span, from the start of the child, once the critical path of the child is added.
+            pending.append((node, max(child.start, node.start), children, child_index))
+            pending.append((child, child_end, _by_descending_end(child), 0))
+            break
+        else:
+            if cursor > node.start:
+                critical_path.append(CriticalPathSegment(node.span.span_id, node.start, cursor))
+
+
+def _by_descending_end(node: _Node) -> List[_Node]:
+    return sorted(node.children, key=lambda child: child.end, reverse=True)
@@ -0,0 +1,179 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""Accounting of the size of the exports received by the mock collector, compressed and uncompressed, per export, per
+service and per attribute key, to quantify what compressing exports saves and what large attributes cost.
+
+OTLP/HTTP exports are measured as they were received, compressed or not. gRPC decompresses messages before handing
+them to the servicer, without telling it whether or how they were compressed, so the compressed size of gRPC exports,
+and of OTLP/HTTP exports received uncompressed, is only an estimate, obtained by compressing them with gzip at the
+default level, like exporters do. Measured and estimated compressed sizes are kept apart.
+"""
+import gzip
+from collections import Counter, deque
+from threading import Lock
+from time import time_ns
+from typing import Counter as CounterType
+from typing import Deque, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from google.protobuf.message import Message
+from mock_collector_capture import REQUEST_TYPES, Signal
+from mock_collector_resource import get_service_name
+
+from opentelemetry.proto.common.v1.common_pb2 import KeyValue
+
+# Most recent exports whose sizes are kept, oldest first.
+_MAX_EXPORT_SIZES: int = 10000
+_GZIP_LEVEL: int = 6
+
+# Sizes are accumulated by signal and service name, and by signal and attribute key.
+ServiceKey = Tuple[Signal, str]
+AttributeKey = Tuple[Signal, str]
+
+
+class WireFormat(NamedTuple):
+    """How an export was received: its OTLP protocol, its content encoding, and its size as received."""
+
+    protocol: str
+    content_encoding: str
+    wire_bytes: int
+
+
+# gRPC exports, whose compression is not known.
+GRPC_WIRE_FORMAT: WireFormat = WireFormat("grpc", "", 0)
+
+
+class ExportSize(NamedTuple):
+    signal: Signal
+    received_time_unix_nano: int
+    protocol: str
+    content_encoding: str
+    uncompressed_bytes: int
+    # Size as received of an export received compressed, or 0.
+    compressed_bytes: int
+    # Estimated compressed size of an export received over gRPC or uncompressed, or 0.
+    estimated_compressed_bytes: int
+    service_names: Tuple[str, ...]
+
+
+class SizeTotals(NamedTuple):
+    count: int
+    uncompressed_bytes: int
+    compressed_bytes: int
+    estimated_compressed_bytes: int
+
+
+class WireStatsSnapshot(NamedTuple):
+    """Sizes recorded by a `WireStats`, as of the time they were read."""
+
+    exports: List[ExportSize]
+    # Exports, and their bytes split between the services of each export in proportion to their uncompressed size.
+    services: Dict[ServiceKey, SizeTotals]
+    # Attributes of spans, data points and log records, and their encoded size, which compression is not apportioned
+    # to.
+    attributes: Dict[AttributeKey, SizeTotals]
+
+
+class WireStats:
+    """Thread-safe sizes of the exports received by the mock collector, until it is cleared.
+
+    Every export is parsed and compressed to be accounted for, so wire stats are only recorded when enabled.
+    """
+
+    def __init__(self):
+        self._lock: Lock = Lock()
+        self._reset()
+
+    def record(self, signal: Signal, data: bytes, wire_format: WireFormat) -> None:
+        received_time: int = time_ns()
+        compressed_bytes: int = 0
+        estimated_compressed_bytes: int = 0
+        if wire_format.content_encoding:
+            compressed_bytes = wire_format.wire_bytes
+        else:
+            estimated_compressed_bytes = len(gzip.compress(data, compresslevel=_GZIP_LEVEL, mtime=0))
+        request: Message = REQUEST_TYPES[signal].FromString(data)
+        service_sizes: CounterType[str] = Counter()
+        attribute_counts: CounterType[str] = Counter()
+        attribute_bytes: CounterType[str] = Counter()
+        for resource, size, attributes in _get_resources(signal, request):
+            service_sizes[get_service_name(resource.attributes)] += size
+            for attribute in attributes:
+                attribute_counts[attribute.key] += 1
+                attribute_bytes[attribute.key] += attribute.ByteSize()
+        resources_size: int = sum(service_sizes.values())
+
+        with self._lock:
+            self._exports.append(
+                ExportSize(
+                    signal,
+                    received_time,
+                    wire_format.protocol,
+                    wire_format.content_encoding,
+                    len(data),
+                    compressed_bytes,
+                    estimated_compressed_bytes,
+                    tuple(service_sizes),
+                )
+            )
+            for service_name, size in service_sizes.items():
+                share: float = size / resources_size if resources_size else 1 / len(service_sizes)
+                totals: SizeTotals = self._services.get((signal, service_name), SizeTotals(0, 0, 0, 0))
+                self._services[(signal, service_name)] = SizeTotals(
+                    totals.count + 1,
+                    totals.uncompressed_bytes + round(len(data) * share),
+                    totals.compressed_bytes + round(compressed_bytes * share),
+                    totals.estimated_compressed_bytes + round(estimated_compressed_bytes * share),
+                )
+            for key, count in attribute_counts.items():
+                totals = self._attributes.get((signal, key), SizeTotals(0, 0, 0, 0))
+                self._attributes[(signal, key)] = SizeTotals(
+                    totals.count + count, totals.uncompressed_bytes + attribute_bytes[key], 0, 0
+                )
+
+    def get_snapshot(self) -> WireStatsSnapshot:
+        with self._lock:
+            return WireStatsSnapshot(list(self._exports), dict(self._services), dict(self._attributes))
+
+    def reset(self) -> None:
+        with self._lock:
+            self._reset()
+
+    def _reset(self) -> None:
+        self._exports: Deque[ExportSize] = deque(maxlen=_MAX_EXPORT_SIZES)
+        self._services: Dict[ServiceKey, SizeTotals] = {}
+        self._attributes: Dict[AttributeKey, SizeTotals] = {}
+
+
+def _get_resources(signal: Signal, request: Message) -> Iterator[Tuple[Message, int, Iterable[KeyValue]]]:
+    """Yield the resource of each resource spans, metrics or logs of `request`, with its encoded size and the
+    attributes of its spans, data points or log records."""
+    if signal == Signal.TRACES:
+        for resource_spans in request.resource_spans:
+            yield resource_spans.resource, resource_spans.ByteSize(), (
+                attribute
+                for scope_spans in resource_spans.scope_spans
+                for span in scope_spans.spans
+                for attribute in span.attributes
+            )
+    elif signal == Signal.LOGS:
+        for resource_logs in request.resource_logs:
+            yield resource_logs.resource, resource_logs.ByteSize(), (
+                attribute
+                for scope_logs in resource_logs.scope_logs
+                for log_record in scope_logs.log_records
+                for attribute in log_record.attributes
+            )
+    else:
+        for resource_metrics in request.resource_metrics:
+            yield resource_metrics.resource, resource_metrics.ByteSize(), (
+                attribute
+                for scope_metrics in resource_metrics.scope_metrics
+                for metric in scope_metrics.metrics
+                for data_point in _get_data_points(metric)
+                for attribute in data_point.attributes
+            )
+
+
+def _get_data_points(metric: Message) -> Iterable[Message]:
+    data_field: Optional[str] = metric.WhichOneof("data")
+    return getattr(metric, data_field).data_points if data_field is not None else ()
@@ -0,0 +1,736 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""Multi-process mock collector, for ingest throughput to scale with cores instead of being bound by the GIL.
+
+Worker processes all serve the OTLP and mock collector services on the same port, with SO_REUSEPORT, so that the
+kernel spreads connections between them, and each worker stores the exports it receives. Sequence numbers are drawn
+from a `SharedSequence` per signal, so the exports of all workers are numbered as if they had been received by a single
+process. Each worker also serves its own mock collector service on a Unix socket, and the mock collector service on the
+shared port, a `FanOutMockCollectorService`, answers every rpc by calling all the workers on their sockets and merging
+their responses.
+
+Waiting for exports polls the shared sequence numbers, which are read from shared memory, and only calls the workers
+once they change.
+"""
+import asyncio
+import multiprocessing
+import multiprocessing.connection
+import os
+import shutil
+import signal
+import sys
+import tempfile
+from multiprocessing.context import BaseContext
+from multiprocessing.process import BaseProcess
+from multiprocessing.synchronize import Semaphore
+from threading import Event, Thread
+from time import monotonic, sleep, time_ns
+from types import FrameType
+from typing import (
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+
+from google.protobuf.message import Message
+from grpc import (
+    Future,
+    RpcError,
+    Server,
+    ServicerContext,
+    aio,
+    insecure_channel,
+    method_handlers_generic_handler,
+    unary_stream_rpc_method_handler,
+    unary_unary_rpc_method_handler,
+)
+from mock_collector_capture import Signal
+from mock_collector_export_store import SharedSequence
+from mock_collector_predicates import LogRecordMatch, SpanMatch, log_records_to_export, spans_to_export
+from mock_collector_raw_export import serialize_with_bytes_field
+from mock_collector_service_pb2 import (
+    DESCRIPTOR,
+    AttributeSize,
+    ClearRequest,
+    ClearResponse,
+    ConfigureFaultsRequest,
+    ConfigureFaultsResponse,
+    DuplicateSpanCount,
+    FaultStats,
+    GetDuplicateSpanStatsRequest,
+    GetDuplicateSpanStatsResponse,
+    GetFaultStatsRequest,
+    GetFaultStatsResponse,
+    GetLogsRequest,
+    GetLogsResponse,
+    GetMetricsRequest,
+    GetMetricsResponse,
+    GetSoakStatsRequest,
+    GetSoakStatsResponse,
+    GetStorageStatsRequest,
+    GetStorageStatsResponse,
+    GetTracesRequest,
+    GetTracesResponse,
+    GetTraceTreeRequest,
+    GetTraceTreeResponse,
+    GetWireStatsRequest,
+    GetWireStatsResponse,
+    LogRecordCount,
+    MetricPointCount,
+    QueryLogsRequest,
+    QueryLogsResponse,
+    QuerySpansRequest,
+    QuerySpansResponse,
+    ServiceSize,
+    SignalCounts,
+    SpanCount,
+    StorageStats,
+    WaitForMetricsRequest,
+    WaitForMetricsResponse,
+    WaitForSpansRequest,
+    WaitForSpansResponse,
+)
+from mock_collector_service_pb2_grpc import (
+    MockCollectorServiceServicer,
+    MockCollectorServiceStub,
+    add_MockCollectorServiceServicer_to_server,
+)
+from mock_collector_trace_tree import build_trace_tree, to_trace_tree_response
+from typing_extensions import override
+
+from opentelemetry.proto.collector.logs.v1.logs_service_pb2 import ExportLogsServiceRequest
+from opentelemetry.proto.collector.metrics.v1.metrics_service_pb2 import ExportMetricsServiceRequest
+from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import ExportTraceServiceRequest
+
+T = TypeVar("T")
+
+# How often pending watch and wait_for rpcs check whether any worker received exports.
+_POLL_INTERVAL_SEC: float = 0.01
+# How often workers check whether their parent process is still running.
+_PARENT_CHECK_INTERVAL_SEC: float = 1.0
+# How long the workers have to start, and to stop before they are killed.
+_START_TIMEOUT_SEC: float = 60.0
+_STOP_TIMEOUT_SEC: float = 5.0
+# Time left to send the response of a wait_for rpc before the deadline of the call.
+_DEADLINE_MARGIN_SEC: float = 0.1
+# Most recent export sizes returned by get_wire_stats, like a single process keeps.
+_MAX_EXPORT_SIZES: int = 10000
+
+
+class Worker:
+    """What a worker process needs to know about the others: its index, the sockets every worker serves its own mock
+    collector service on, and the sequence numbers they share.
+    """
+
+    def __init__(self, index: int, addresses: List[str], sequences: Dict[Signal, SharedSequence], ready: Semaphore):
+        self.index: int = index
+        self.addresses: List[str] = addresses
+        self.sequences: Dict[Signal, SharedSequence] = sequences
+        self._ready: Semaphore = ready
+
+    @property
+    def address(self) -> str:
+        return self.addresses[self.index]
+
+    def ready(self) -> None:
+        """Tell the parent process this worker is serving."""
+        self._ready.release()
+
+
+def run_workers(count: int, run: Callable[[Worker], None]) -> None:
+    """Fork `count` worker processes running `run`, print "Ready" once all of them are serving, and stop them all when
+    the parent is terminated or any of them exits.
+
+    The parent process must not have created any gRPC channel or server, which do not survive a fork.
+    """
+    context: BaseContext = multiprocessing.get_context("fork")
+    socket_dir: str = tempfile.mkdtemp(prefix="mock-collector-")
+    sequences: Dict[Signal, SharedSequence] = {signal_: SharedSequence(context) for signal_ in Signal}
+    addresses: List[str] = [f"unix:{os.path.join(socket_dir, f'worker-{index}.sock')}" for index in range(count)]
+    ready: Semaphore = context.Semaphore(0)
+    processes: List[BaseProcess] = [
+        context.Process(
+            target=_run_worker,
+            args=(run, Worker(index, addresses, sequences, ready), os.getpid()),
+            name=f"mock-collector-worker-{index}",
+        )
+        for index in range(count)
+    ]
+
+    def terminate(signal_number: int, frame: Optional[FrameType]) -> None:
+        raise SystemExit(128 + signal_number)
+
+    try:
+        for process in processes:
+            process.start()
+        # Installed after forking, for the workers to keep the default handler.
+        signal.signal(signal.SIGTERM, terminate)
+        for _ in processes:
+            if not ready.acquire(timeout=_START_TIMEOUT_SEC):
+                raise RuntimeError("Mock collector workers failed to start")
+        print("Ready", flush=True)
+        # Any worker exiting stops the mock collector, rather than leaving it serving some of its connections.
+        multiprocessing.connection.wait([process.sentinel for process in processes])
+        sys.exit(1)
+    finally:
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+        for process in processes:
+            process.join(_STOP_TIMEOUT_SEC)
+            if process.is_alive():
+                process.kill()
+        shutil.rmtree(socket_dir, ignore_errors=True)
+
+
+def _run_worker(run: Callable[[Worker], None], worker: Worker, parent_pid: int) -> None:
+    # Workers exit along with their parent, even if it is killed without terminating them, rather than keep serving on
+    # the shared ports.
+    def exit_with_parent() -> None:
+        while os.getppid() == parent_pid:
+            sleep(_PARENT_CHECK_INTERVAL_SEC)
+        os._exit(1)
+
+    Thread(target=exit_with_parent, name="mock-collector-parent-check", daemon=True).start()
+    run(worker)
+
+
+class _MergedExports(NamedTuple):
+    exports: List[bytes]
+    sequence_numbers: List[int]
+    received_times_unix_nano: List[int]
+    start_cursor: int
+    next_cursor: int
+
+
+class FanOutMockCollectorService(MockCollectorServiceServicer):
+    """Answers the mock collector service rpcs for all the workers of a multi-process mock collector, by calling each
+    of them and merging their responses.
+
+    Exports are returned up to the shared sequence number read before calling the workers, so that responses hold
+    consecutive exports, as clients expect, even while other workers are still storing the exports after it.
+    """
+
+    def __init__(self, worker: Worker):
+        super().__init__()
+        self._sequences: Dict[Signal, SharedSequence] = worker.sequences
+        self._stubs: List[MockCollectorServiceStub] = [
+            MockCollectorServiceStub(insecure_channel(address)) for address in worker.addresses
+        ]
+
+    def add_to_server(self, server: Union[Server, aio.Server]) -> None:
+        # The get and watch methods return responses that are already serialized, like `MockCollectorService`.
+        raw_response_handlers = {
+            "get_traces": unary_unary_rpc_method_handler(
+                self.get_traces, request_deserializer=GetTracesRequest.FromString, response_serializer=None
+            ),
+            "get_metrics": unary_unary_rpc_method_handler(
+                self.get_metrics, request_deserializer=GetMetricsRequest.FromString, response_serializer=None
+            ),
+            "get_logs": unary_unary_rpc_method_handler(
+                self.get_logs, request_deserializer=GetLogsRequest.FromString, response_serializer=None
+            ),
+            "watch_traces": unary_stream_rpc_method_handler(
+                self.watch_traces, request_deserializer=GetTracesRequest.FromString, response_serializer=None
+            ),
+            "watch_metrics": unary_stream_rpc_method_handler(
+                self.watch_metrics, request_deserializer=GetMetricsRequest.FromString, response_serializer=None
+            ),
+            "watch_logs": unary_stream_rpc_method_handler(
+                self.watch_logs, request_deserializer=GetLogsRequest.FromString, response_serializer=None
+            ),
+        }
+        service_name: str = DESCRIPTOR.services_by_name["MockCollectorService"].full_name
+        server.add_generic_rpc_handlers((method_handlers_generic_handler(service_name, raw_response_handlers),))
+        add_MockCollectorServiceServicer_to_server(self, server)
+
+    @override
+    def clear(self, request: ClearRequest, context: ServicerContext) -> ClearResponse:
+        # Every worker is cleared at the same cursors, keeping the exports numbered after them.
+        cursors: ClearRequest = ClearRequest(
+            traces_cursor=self._sequences[Signal.TRACES].current(),
+            metrics_cursor=self._sequences[Signal.METRICS].current(),
+            logs_cursor=self._sequences[Signal.LOGS].current(),
+        )
+        for signal_, cursor in zip(Signal, (cursors.traces_cursor, cursors.metrics_cursor, cursors.logs_cursor)):
+            self._sequences[signal_].set_cleared(cursor)
+        self._call_all("clear", cursors, context)
+        return ClearResponse(
+            traces_cursor=cursors.traces_cursor, metrics_cursor=cursors.metrics_cursor, logs_cursor=cursors.logs_cursor
+        )
+
+    @override
+    def get_traces(self, request: GetTracesRequest, context: ServicerContext) -> bytes:
+        return _serialize(Signal.TRACES, self._get_exports(Signal.TRACES, request.since, context))
+
+    @override
+    def get_metrics(self, request: GetMetricsRequest, context: ServicerContext) -> bytes:
+        return _serialize(Signal.METRICS, self._get_exports(Signal.METRICS, request.since, context))
+
+    @override
+    def get_logs(self, request: GetLogsRequest, context: ServicerContext) -> bytes:
+        return _serialize(Signal.LOGS, self._get_exports(Signal.LOGS, request.since, context))
+
+    @override
+    def watch_traces(self, request: GetTracesRequest, context: ServicerContext) -> Iterator[bytes]:
+        return self._watch_exports(Signal.TRACES, request.since, context)
+
+    @override
+    def watch_metrics(self, request: GetMetricsRequest, context: ServicerContext) -> Iterator[bytes]:
+        return self._watch_exports(Signal.METRICS, request.since, context)
+
+    @override
+    def watch_logs(self, request: GetLogsRequest, context: ServicerContext) -> Iterator[bytes]:
+        return self._watch_exports(Signal.LOGS, request.since, context)
+
+    @override
+    def wait_for_spans(self, request: WaitForSpansRequest, context: ServicerContext) -> WaitForSpansResponse:
+        satisfied, traces = self._wait_until(
+            Signal.TRACES, self._check_spans(request, context), request.timeout_millis, context
+        )
+        return WaitForSpansResponse(satisfied=satisfied, traces=traces)
+
+    @override
+    def wait_for_metrics(self, request: WaitForMetricsRequest, context: ServicerContext) -> WaitForMetricsResponse:
+        satisfied, metrics = self._wait_until(
+            Signal.METRICS, self._check_metrics(request, context), request.timeout_millis, context
+        )
+        return WaitForMetricsResponse(satisfied=satisfied, metrics=metrics)
+
+    @override
+    def query_spans(self, request: QuerySpansRequest, context: ServicerContext) -> QuerySpansResponse:
+        cursor: int = self._sequences[Signal.TRACES].current()
+        traces: List[bytes] = [
+            trace for response in self._call_all("query_spans", request, context) for trace in response.traces
+        ]
+        if request.limit and traces:
+            matches: List[SpanMatch] = _get_span_matches(traces)
+            if len(matches) > request.limit:
+                traces = [spans_to_export(matches[: request.limit]).SerializeToString()]
+        return QuerySpansResponse(traces=traces, cursor=cursor)
+
+    @override
+    def query_logs(self, request: QueryLogsRequest, context: ServicerContext) -> QueryLogsResponse:
+        cursor: int = self._sequences[Signal.LOGS].current()
+        logs: List[bytes] = [
+            log for response in self._call_all("query_logs", request, context) for log in response.logs
+        ]
+        if request.limit and logs:
+            matches: List[LogRecordMatch] = _get_log_record_matches(logs)
+            if len(matches) > request.limit:
+                logs = [log_records_to_export(matches[: request.limit]).SerializeToString()]
+        return QueryLogsResponse(logs=logs, cursor=cursor)
+
+    @override
+    def get_trace_tree(self, request: GetTraceTreeRequest, context: ServicerContext) -> GetTraceTreeResponse:
+        # The spans of a trace can be split between workers, so the tree is assembled from all of them.
+        traces: List[bytes] = [
+            trace
+            for response in self._call_all("query_spans", QuerySpansRequest(trace_id=request.trace_id), context)
+            for trace in response.traces
+        ]
+        return to_trace_tree_response(build_trace_tree(_get_span_matches(traces)))
+
+    @override
+    def get_storage_stats(self, request: GetStorageStatsRequest, context: ServicerContext) -> GetStorageStatsResponse:
+        # Budgets apply to each worker, so the budget of the mock collector is their sum.
+        responses: List[GetStorageStatsResponse] = self._call_all("get_storage_stats", request, context)
+        return GetStorageStatsResponse(
+            traces=_sum_fields(StorageStats, [response.traces for response in responses]),
+            metrics=_sum_fields(StorageStats, [response.metrics for response in responses]),
+            logs=_sum_fields(StorageStats, [response.logs for response in responses]),
+        )
+
+    @override
+    def get_soak_stats(self, request: GetSoakStatsRequest, context: ServicerContext) -> GetSoakStatsResponse:
+        responses: List[GetSoakStatsResponse] = self._call_all("get_soak_stats", request, context)
+        span_counts: Dict[Tuple[str, str, int], int] = {}
+        point_counts: Dict[str, int] = {}
+        log_record_counts: Dict[str, Tuple[int, int]] = {}
+        for response in responses:
+            for span_count in response.span_counts:
+                key: Tuple[str, str, int] = (span_count.service_name, span_count.name, span_count.kind)
+                span_counts[key] = span_counts.get(key, 0) + span_count.count
+            for point_count in response.metric_point_counts:
+                point_counts[point_count.name] = point_counts.get(point_count.name, 0) + point_count.count
+            for log_count in response.log_record_counts:
+                count, correlated = log_record_counts.get(log_count.service_name, (0, 0))
+                log_record_counts[log_count.service_name] = (
+                    count + log_count.count,
+                    correlated + log_count.correlated_count,
+                )
+        return GetSoakStatsResponse(
+            traces=_sum_fields(SignalCounts, [response.traces for response in responses]),
+            metrics=_sum_fields(SignalCounts, [response.metrics for response in responses]),
+            span_counts=[
+                SpanCount(service_name=service_name, name=name, kind=kind, count=count)
+                for (service_name, name, kind), count in span_counts.items()
+            ],
+            metric_point_counts=[MetricPointCount(name=name, count=count) for name, count in point_counts.items()],
+            elapsed_seconds=max(response.elapsed_seconds for response in responses),
+            exports_per_second=sum(response.exports_per_second for response in responses),
+            logs=_sum_fields(SignalCounts, [response.logs for response in responses]),
+            log_record_counts=[
+                LogRecordCount(service_name=service_name, count=count, correlated_count=correlated)
+                for service_name, (count, correlated) in log_record_counts.items()
+            ],
+        )
+
+    @override
+    def configure_faults(self, request: ConfigureFaultsRequest, context: ServicerContext) -> ConfigureFaultsResponse:
+        # Workers draw from different seeds, or they would inject the same faults into their n-th exports.
+        requests: List[ConfigureFaultsRequest] = []
+        for index in range(len(self._stubs)):
+            worker_request: ConfigureFaultsRequest = ConfigureFaultsRequest()
+            worker_request.CopyFrom(request)
+            if request.seed:
+                worker_request.seed = request.seed + index
+            requests.append(worker_request)
+        self._call_each("configure_faults", requests, context)
+        return ConfigureFaultsResponse()
+
+    @override
+    def get_fault_stats(self, request: GetFaultStatsRequest, context: ServicerContext) -> GetFaultStatsResponse:
+        responses: List[GetFaultStatsResponse] = self._call_all("get_fault_stats", request, context)
+        return GetFaultStatsResponse(
+            traces=_sum_fields(FaultStats, [response.traces for response in responses]),
+            metrics=_sum_fields(FaultStats, [response.metrics for response in responses]),
+            logs=_sum_fields(FaultStats, [response.logs for response in responses]),
+        )
+
+    @override
+    def get_wire_stats(self, request: GetWireStatsRequest, context: ServicerContext) -> GetWireStatsResponse:
+        responses: List[GetWireStatsResponse] = self._call_all("get_wire_stats", request, context)
+        services: Dict[Tuple[str, str], ServiceSize] = {}
+        attributes: Dict[Tuple[str, str], AttributeSize] = {}
+        for response in responses:
+            for service in response.services:
+                merged_service: ServiceSize = services.setdefault(
+                    (service.signal, service.service_name),
+                    ServiceSize(signal=service.signal, service_name=service.service_name),
+                )
+                merged_service.exports += service.exports
+                merged_service.uncompressed_bytes += service.uncompressed_bytes
+                merged_service.compressed_bytes += service.compressed_bytes
+                merged_service.estimated_compressed_bytes += service.estimated_compressed_bytes
+            for attribute in response.attributes:
+                merged_attribute: AttributeSize = attributes.setdefault(
+                    (attribute.signal, attribute.key), AttributeSize(signal=attribute.signal, key=attribute.key)
+                )
+                merged_attribute.count += attribute.count
+                merged_attribute.uncompressed_bytes += attribute.uncompressed_bytes
+        exports = sorted(
+            (export for response in responses for export in response.exports),
+            key=lambda export: export.received_time_unix_nano,
+        )
+        return GetWireStatsResponse(
+            exports=exports[-_MAX_EXPORT_SIZES:], services=services.values(), attributes=attributes.values()
+        )
+
+    @override
+    def get_duplicate_span_stats(
+        self, request: GetDuplicateSpanStatsRequest, context: ServicerContext
+    ) -> GetDuplicateSpanStatsResponse:
+        # Each worker only filters the spans it received, which includes retries sent on the same connection.
+        counts: Dict[str, int] = {}
+        for response in self._call_all("get_duplicate_span_stats", request, context):
+            for duplicate_count in response.duplicate_span_counts:
+                service_name: str = duplicate_count.service_name
+                counts[service_name] = counts.get(service_name, 0) + duplicate_count.count
+        return GetDuplicateSpanStatsResponse(
+            duplicate_span_counts=[
+                DuplicateSpanCount(service_name=service_name, count=count) for service_name, count in counts.items()
+            ]
+        )
+
+    def _call_all(self, method: str, request: Message, context: Optional[ServicerContext]) -> List[Message]:
+        return self._call_each(method, [request] * len(self._stubs), context)
+
+    def _call_each(
+        self, method: str, requests: List[Message], context: Optional[ServicerContext]
+    ) -> List[Message]:
+        """Call `method` of every worker concurrently, with the request at its index in `requests`.
+
+        The first worker to fail aborts the rpc with the same status, or raises its `RpcError` if `context` is None.
+        """
+        futures: List[Future] = [getattr(stub, method).future(request) for stub, request in zip(self._stubs, requests)]
+        try:
+            return [future.result() for future in futures]
+        except RpcError as error:
+            if context is not None:
+                context.abort(error.code(), error.details())
+            raise
+
+    def _check_spans(
+        self, request: WaitForSpansRequest, context: Optional[ServicerContext]
+    ) -> Callable[[], Tuple[bool, List[bytes]]]:
+        # Workers are asked for the spans they hold without waiting, again every time any of them receives traces.
+        poll: WaitForSpansRequest = WaitForSpansRequest()
+        poll.CopyFrom(request)
+        poll.timeout_millis = 0
+        min_count: int = max(1, request.min_count)
+
+        def check() -> Tuple[bool, List[bytes]]:
+            traces: List[bytes] = [
+                trace for response in self._call_all("wait_for_spans", poll, context) for trace in response.traces
+            ]
+            return len(_get_span_matches(traces)) >= min_count, traces
+
+        return check
+
+    def _check_metrics(
+        self, request: WaitForMetricsRequest, context: Optional[ServicerContext]
+    ) -> Callable[[], Tuple[bool, List[bytes]]]:
+        poll: WaitForMetricsRequest = WaitForMetricsRequest()
+        poll.CopyFrom(request)
+        poll.timeout_millis = 0
+        names: Set[str] = {name.lower() for name in request.names}
+
+        def check() -> Tuple[bool, List[bytes]]:
+            metrics: List[bytes] = [
+                metric for response in self._call_all("wait_for_metrics", poll, context) for metric in response.metrics
+            ]
+            return names <= _get_metric_names(metrics), metrics
+
+        return check
+
+    def _get_exports(self, signal_: Signal, since: int, context: Optional[ServicerContext]) -> _MergedExports:
+        sequence: SharedSequence = self._sequences[signal_]
+        cursor: int = sequence.current()
+        cleared: int = sequence.cleared
+        rpcs: _SignalRpcs = _SIGNAL_RPCS[signal_]
+        responses: List[Message] = self._call_all(rpcs.get_method, rpcs.request_type(since=since), context)
+        # A worker may have been cleared or have evicted exports after the others answered, so only the exports after
+        # the latest start cursor are returned, which every worker still holds.
+        start_cursor: int = max([cleared] + [response.start_cursor for response in responses])
+        exports: List[Tuple[int, int, bytes]] = sorted(
+            (sequence_number, received_time, data)
+            for response in responses
+            for sequence_number, received_time, data in zip(
+                response.sequence_numbers, response.received_times_unix_nano, getattr(response, rpcs.exports_field)
+            )
+            if max(since, start_cursor) < sequence_number <= cursor
+        )
+        return _MergedExports(
+            [data for _, _, data in exports],
+            [sequence_number for sequence_number, _, _ in exports],
+            [received_time for _, received_time, _ in exports],
+            start_cursor,
+            max(cursor, start_cursor),
+        )
+
+    def _watch_exports(self, signal_: Signal, since: int, context: ServicerContext) -> Iterator[bytes]:
+        sequence: SharedSequence = self._sequences[signal_]
+        ended: Event = _get_ended_event(context)
+        exports: _MergedExports = self._get_exports(signal_, since, context)
+        while True:
+            yield _serialize(signal_, exports)
+            since = max(since, exports.next_cursor)
+            start_cursor: int = exports.start_cursor
+            while True:
+                if ended.wait(_POLL_INTERVAL_SEC):
+                    return
+                if sequence.current() > since or sequence.cleared > start_cursor:
+                    exports = self._get_exports(signal_, since, context)
+                    if exports.exports or exports.start_cursor > start_cursor:
+                        break
+
+    def _wait_until(
+        self,
+        signal_: Signal,
+        check: Callable[[], Tuple[bool, List[bytes]]],
+        timeout_millis: int,
+        context: ServicerContext,
+    ) -> Tuple[bool, List[bytes]]:
+        # Re-run `check` every time the exports of `signal_` change, until it is satisfied or the timeout elapses.
+        sequence: SharedSequence = self._sequences[signal_]
+        deadline: float = _get_deadline(timeout_millis, context)
+        ended: Event = _get_ended_event(context)
+        version: Tuple[int, int] = (sequence.current(), sequence.cleared)
+        satisfied, exports = check()
+        while not satisfied and monotonic() < deadline:
+            if ended.wait(_POLL_INTERVAL_SEC):
+                break
+            current_version: Tuple[int, int] = (sequence.current(), sequence.cleared)
+            if current_version != version:
+                version = current_version
+                satisfied, exports = check()
+        return satisfied, exports
+
+
+class AsyncFanOutMockCollectorService(FanOutMockCollectorService):
+    """Variant of `FanOutMockCollectorService` for `grpc.aio` servers.
+
+    The watch and wait_for rpcs are coroutines polling the shared sequence numbers, which only call the workers from
+    the thread pool of the event loop once they change, so that they are cancelled when their client goes away and any
+    number of them can be pending without holding a thread each.
+    """
+
+    @override
+    async def watch_traces(self, request: GetTracesRequest, context: aio.ServicerContext) -> AsyncIterator[bytes]:
+        async for response in self._watch_exports_async(Signal.TRACES, request.since, context):
+            yield response
+
+    @override
+    async def watch_metrics(self, request: GetMetricsRequest, context: aio.ServicerContext) -> AsyncIterator[bytes]:
+        async for response in self._watch_exports_async(Signal.METRICS, request.since, context):
+            yield response
+
+    @override
+    async def watch_logs(self, request: GetLogsRequest, context: aio.ServicerContext) -> AsyncIterator[bytes]:
+        async for response in self._watch_exports_async(Signal.LOGS, request.since, context):
+            yield response
+
+    @override
+    async def wait_for_spans(self, request: WaitForSpansRequest, context: aio.ServicerContext) -> WaitForSpansResponse:
+        satisfied, traces = await self._wait_until_async(
+            Signal.TRACES, self._check_spans(request, None), request.timeout_millis, context
+        )
+        return WaitForSpansResponse(satisfied=satisfied, traces=traces)
+
+    @override
+    async def wait_for_metrics(
+        self, request: WaitForMetricsRequest, context: aio.ServicerContext
+    ) -> WaitForMetricsResponse:
+        satisfied, metrics = await self._wait_until_async(
+            Signal.METRICS, self._check_metrics(request, None), request.timeout_millis, context
+        )
+        return WaitForMetricsResponse(satisfied=satisfied, metrics=metrics)
+
+    async def _watch_exports_async(
+        self, signal_: Signal, since: int, context: aio.ServicerContext
+    ) -> AsyncIterator[bytes]:
+        sequence: SharedSequence = self._sequences[signal_]
+        exports: _MergedExports = await _run_in_executor(lambda: self._get_exports(signal_, since, None), context)
+        while True:
+            yield _serialize(signal_, exports)
+            since = max(since, exports.next_cursor)
+            start_cursor: int = exports.start_cursor
+            while True:
+                await asyncio.sleep(_POLL_INTERVAL_SEC)
+                if sequence.current() > since or sequence.cleared > start_cursor:
+                    exports = await _run_in_executor(lambda: self._get_exports(signal_, since, None), context)
+                    if exports.exports or exports.start_cursor > start_cursor:
+                        break
+
+    async def _wait_until_async(
+        self,
+        signal_: Signal,
+        check: Callable[[], Tuple[bool, List[bytes]]],
+        timeout_millis: int,
+        context: aio.ServicerContext,
+    ) -> Tuple[bool, List[bytes]]:
+        sequence: SharedSequence = self._sequences[signal_]
+        deadline: float = _get_deadline(timeout_millis, context)
+        version: Tuple[int, int] = (sequence.current(), sequence.cleared)
+        satisfied, exports = await _run_in_executor(check, context)
+        while not satisfied and monotonic() < deadline:
+            await asyncio.sleep(_POLL_INTERVAL_SEC)
+            current_version: Tuple[int, int] = (sequence.current(), sequence.cleared)
+            if current_version != version:
+                version = current_version
+                satisfied, exports = await _run_in_executor(check, context)
+        return satisfied, exports
+
+
+class _SignalRpcs(NamedTuple):
+    get_method: str
+    request_type: Type[Message]
+    response_type: Type[Message]
+    exports_field: str
+
+
+_SIGNAL_RPCS: Dict[Signal, _SignalRpcs] = {
+    Signal.TRACES: _SignalRpcs("get_traces", GetTracesRequest, GetTracesResponse, "traces"),
+    Signal.METRICS: _SignalRpcs("get_metrics", GetMetricsRequest, GetMetricsResponse, "metrics"),
+    Signal.LOGS: _SignalRpcs("get_logs", GetLogsRequest, GetLogsResponse, "logs"),
+}
+
+
+async def _run_in_executor(call: Callable[[], T], context: aio.ServicerContext) -> T:
+    # Workers are called from the thread pool of the event loop, and their failures abort the rpc with their status.
+    try:
+        return await asyncio.get_running_loop().run_in_executor(None, call)
+    except RpcError as error:
+        await context.abort(error.code(), error.details())
+        raise
+
+
+def _get_deadline(timeout_millis: int, context: Union[ServicerContext, aio.ServicerContext]) -> float:
+    # Return before the deadline of the call, if it has one, so that the caller gets the matches received so far.
+    deadline: float = monotonic() + timeout_millis / 1000
+    time_remaining: Optional[float] = context.time_remaining()
+    if time_remaining is not None:
+        deadline = min(deadline, monotonic() + time_remaining - _DEADLINE_MARGIN_SEC)
+    return deadline
+
+
+def _get_ended_event(context: ServicerContext) -> Event:
+    # Set when the rpc ends, such as when the client cancels it. Unlike `is_active`, callbacks are also supported by the
+    # context of the synchronous handlers of an `aio` server.
+    ended: Event = Event()
+    context.add_callback(ended.set)
+    return ended
+
+
+def _serialize(signal: Signal, exports: _MergedExports) -> bytes:
+    rpcs: _SignalRpcs = _SIGNAL_RPCS[signal]
+    return serialize_with_bytes_field(
+        rpcs.response_type(
+            next_cursor=exports.next_cursor,
+            start_cursor=exports.start_cursor,
+            sequence_numbers=exports.sequence_numbers,
+            received_times_unix_nano=exports.received_times_unix_nano,
+            server_time_unix_nano=time_ns(),
+        ),
+        rpcs.response_type.DESCRIPTOR.fields_by_name[rpcs.exports_field].number,
+        exports.exports,
+    )
+
+
+def _sum_fields(message_type: Type[Message], messages: Iterable[Message]) -> Message:
+    total: Message = message_type()
+    for message in messages:
+        for field, value in message.ListFields():
+            setattr(total, field.name, getattr(total, field.name) + value)
+    return total
+
+
+def _get_span_matches(traces: Iterable[bytes]) -> List[SpanMatch]:
+    return [
+        SpanMatch(resource_spans, scope_spans, span)
+        for trace in traces
+        for resource_spans in ExportTraceServiceRequest.FromString(trace).resource_spans
+        for scope_spans in resource_spans.scope_spans
+        for span in scope_spans.spans
+    ]
+
+
+def _get_log_record_matches(logs: Iterable[bytes]) -> List[LogRecordMatch]:
+    return [
+        LogRecordMatch(resource_logs, scope_logs, log_record)
+        for log in logs
+        for resource_logs in ExportLogsServiceRequest.FromString(log).resource_logs
+        for scope_logs in resource_logs.scope_logs
+        for log_record in scope_logs.log_records
+    ]
+
+
+def _get_metric_names(metrics: Iterable[bytes]) -> Set[str]:
+    return {
+        metric.name.lower()
+        for export in metrics
+        for resource_metrics in ExportMetricsServiceRequest.FromString(export).resource_metrics
+        for scope_metrics in resource_metrics.scope_metrics
+        for metric in scope_metrics.metrics
+    }
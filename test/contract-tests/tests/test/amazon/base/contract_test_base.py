@@ -1,15 +1,22 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 # SPDX-License-Identifier: Apache-2.0
+import asyncio
+import os
 import time
 import re
 from logging import INFO, Logger, getLogger
-from typing import Dict, List
+from typing import Dict, List, Tuple
 from unittest import TestCase
 
 from docker import DockerClient
 from docker.models.networks import Network, NetworkCollection
 from docker.types import EndpointConfig
-from mock_collector_client import MockCollectorClient, ResourceScopeMetric, ResourceScopeSpan
+from mock_collector_client import (
+    AsyncMockCollectorClient,
+    MockCollectorClient,
+    ResourceScopeMetric,
+    ResourceScopeSpan,
+)
 from requests import Response, request
 from testcontainers.core.container import DockerContainer
 from testcontainers.core.waiting_utils import wait_for_logs
@@ -25,6 +32,12 @@ _logger.setLevel(INFO)
 _MOCK_COLLECTOR_ALIAS: str = "collector"
 _MOCK_COLLECTOR_NAME: str = "aws-application-signals-mock-collector"
 _MOCK_COLLECTOR_PORT: int = 4315
+_MOCK_COLLECTOR_HTTP_PORT: int = 4318
+_GRPC_PROTOCOL: str = "grpc"
+# Set to a directory to capture every export received by the mock collector of each test class into a file of that
+# directory, named after the class, which outlives the mock collector container.
+_CAPTURE_DIR_ENV: str = "MOCK_COLLECTOR_CAPTURE_DIR"
+_CONTAINER_CAPTURE_DIR: str = "/capture"
 
 
 # pylint: disable=broad-exception-caught
@@ -55,8 +68,16 @@ class ContractTestBase(TestCase):
             DockerContainer(_MOCK_COLLECTOR_NAME)
             .with_exposed_ports(_MOCK_COLLECTOR_PORT)
             .with_name(_MOCK_COLLECTOR_NAME)
+            .with_env("MOCK_COLLECTOR_WIRE_STATS", cls.is_wire_stats_enabled())
+            .with_env("MOCK_COLLECTOR_DEDUPLICATE_SPANS", cls.is_span_deduplication_enabled())
             .with_kwargs(network=NETWORK_NAME, networking_config=mock_collector_networking_config)
         )
+        capture_dir: str = os.environ.get(_CAPTURE_DIR_ENV, "")
+        if capture_dir:
+            cls.mock_collector.with_volume_mapping(os.path.abspath(capture_dir), _CONTAINER_CAPTURE_DIR, "rw")
+            cls.mock_collector.with_env(
+                "MOCK_COLLECTOR_CAPTURE_FILE", f"{_CONTAINER_CAPTURE_DIR}/{cls.__name__}.capture"
+            )
         cls.mock_collector.start()
         wait_for_logs(cls.mock_collector, "Ready", timeout=20)
         cls.set_up_dependency_container()
@@ -81,6 +102,8 @@ class ContractTestBase(TestCase):
 
     @override
     def setUp(self) -> None:
+        # Cleanups run in reverse order, so the mock collector client is closed after `tear_down` has used it.
+        self.addCleanup(self.close_mock_collector_client)
         self.addCleanup(self.tear_down)
         application_networking_config: Dict[str, EndpointConfig] = {
             NETWORK_NAME: EndpointConfig(version="1.22", aliases=self.get_application_network_aliases())
@@ -92,12 +115,7 @@ class ContractTestBase(TestCase):
             .with_env("OTEL_AWS_APPLICATION_SIGNALS_ENABLED", "true")
             .with_env("OTEL_AWS_APPLICATION_SIGNALS_RUNTIME_ENABLED", self.is_runtime_enabled())
             .with_env("OTEL_METRICS_EXPORTER", "none")
-            .with_env("OTEL_EXPORTER_OTLP_PROTOCOL", "grpc")
             .with_env("OTEL_BSP_SCHEDULE_DELAY", "1")
-            .with_env("OTEL_AWS_APPLICATION_SIGNALS_EXPORTER_ENDPOINT", f"http://collector:{_MOCK_COLLECTOR_PORT}")
-            .with_env("OTEL_EXPORTER_OTLP_ENDPOINT", f"http://collector:{_MOCK_COLLECTOR_PORT}")
-            .with_env("OTEL_EXPORTER_OTLP_TRACES_ENDPOINT", f"http://collector:{_MOCK_COLLECTOR_PORT}")
-            .with_env("OTEL_EXPORTER_OTLP_METRICS_ENDPOINT", f"http://collector:{_MOCK_COLLECTOR_PORT}")
             .with_env("OTEL_RESOURCE_ATTRIBUTES", self.get_application_otel_resource_attributes())
             .with_env("OTEL_TRACES_SAMPLER", "always_on")
             .with_env("OTEL_DOTNET_AUTO_PLUGINS", "AWS.Distro.OpenTelemetry.AutoInstrumentation.Plugin, AWS.Distro.OpenTelemetry.AutoInstrumentation")
@@ -108,6 +126,11 @@ class ContractTestBase(TestCase):
             .with_name(self.get_application_image_name())
         )
 
+        otlp_env: Dict[str, str] = _get_otlp_exporter_environment_variables(
+            self.get_otlp_protocol(), self.get_otlp_compression()
+        )
+        for key in otlp_env:
+            self.application.with_env(key, otlp_env.get(key))
         extra_env: Dict[str, str] = self.get_application_extra_environment_variables()
         for key in extra_env:
             self.application.with_env(key, extra_env.get(key))
@@ -133,22 +156,38 @@ class ContractTestBase(TestCase):
 
         self.mock_collector_client.clear_signals()
 
+    def close_mock_collector_client(self) -> None:
+        try:
+            self.mock_collector_client.close()
+        except Exception:
+            _logger.exception("Failed to close mock collector client")
+
     def do_test_requests(
         self, path: str, method: str, status_code: int, expected_error: int, expected_fault: int, **kwargs
     ) -> None:
         self.do_send_request(path, method, status_code)
 
-        resource_scope_spans: List[ResourceScopeSpan] = self.mock_collector_client.get_traces()
+        resource_scope_spans, metrics = asyncio.run(self._get_traces_and_metrics())
         self._assert_aws_span_attributes(resource_scope_spans, path, **kwargs)
         self._assert_semantic_conventions_span_attributes(resource_scope_spans, method, path, status_code, **kwargs)
 
-        metrics: List[ResourceScopeMetric] = self.mock_collector_client.get_metrics(
-            {LATENCY_METRIC, ERROR_METRIC, FAULT_METRIC}
-        )
         self._assert_metric_attributes(metrics, LATENCY_METRIC, 12000, **kwargs)
         self._assert_metric_attributes(metrics, ERROR_METRIC, expected_error, **kwargs)
         self._assert_metric_attributes(metrics, FAULT_METRIC, expected_fault, **kwargs)
 
+    async def _get_traces_and_metrics(self) -> Tuple[List[ResourceScopeSpan], List[ResourceScopeMetric]]:
+        # Traces and metrics are waited for concurrently, rather than one after the other, each settling on its own.
+        client: AsyncMockCollectorClient = AsyncMockCollectorClient(
+            self.mock_collector.get_container_host_ip(), self.mock_collector.get_exposed_port(_MOCK_COLLECTOR_PORT)
+        )
+        try:
+            resource_scope_spans, metrics = await asyncio.gather(
+                client.get_traces(), client.get_metrics({LATENCY_METRIC, ERROR_METRIC, FAULT_METRIC})
+            )
+        finally:
+            await client.close()
+        return resource_scope_spans, metrics
+
     def do_send_request(
             self, path: str, method: str, status_code: int
     ) -> None:
@@ -220,6 +259,20 @@ class ContractTestBase(TestCase):
     def tear_down_dependency_container(cls):
         return
 
+    @classmethod
+    def is_wire_stats_enabled(cls) -> str:
+        """Whether the mock collector records the size of every export, for `MockCollectorClient.get_wire_stats`, as
+        "true" or "false". Off by default, since it compresses every export again.
+        """
+        return "false"
+
+    @classmethod
+    def is_span_deduplication_enabled(cls) -> str:
+        """Whether the mock collector stores spans received more than once, like retried exports, only once, as "true"
+        or "false". Off by default, so that tests see the duplicates the application exports.
+        """
+        return "false"
+
     def get_application_port(self) -> int:
         return 8080
 
@@ -244,6 +297,18 @@ class ContractTestBase(TestCase):
     def is_runtime_enabled(self) -> str:
         return "false"
 
+    def get_otlp_protocol(self) -> str:
+        """OTLP protocol the application exports with, as a value of OTEL_EXPORTER_OTLP_PROTOCOL: "grpc",
+        "http/protobuf" or "http/json". The mock collector receives all of them into the same storage.
+        """
+        return _GRPC_PROTOCOL
+
+    def get_otlp_compression(self) -> str:
+        """Compression the application exports with, as a value of OTEL_EXPORTER_OTLP_COMPRESSION: "gzip", or "" for
+        none. `MockCollectorClient.get_wire_stats` returns the resulting export sizes when `is_wire_stats_enabled`.
+        """
+        return ""
+
     def _assert_aws_span_attributes(self, resource_scope_spans: List[ResourceScopeSpan], path: str, **kwargs):
         self.fail("Tests must implement this function")
 
@@ -256,3 +321,27 @@ class ContractTestBase(TestCase):
         self, resource_scope_metrics: List[ResourceScopeMetric], metric_name: str, expected_sum: int, **kwargs
     ):
         self.fail("Tests must implement this function")
+
+
+def _get_otlp_exporter_environment_variables(protocol: str, compression: str) -> Dict[str, str]:
+    endpoint: str = f"http://collector:{_MOCK_COLLECTOR_PORT}"
+    traces_endpoint: str = endpoint
+    metrics_endpoint: str = endpoint
+    logs_endpoint: str = endpoint
+    if protocol != _GRPC_PROTOCOL:
+        # OTLP/HTTP signal-specific endpoints are full URLs, unlike OTEL_EXPORTER_OTLP_ENDPOINT.
+        endpoint = f"http://collector:{_MOCK_COLLECTOR_HTTP_PORT}"
+        traces_endpoint = f"{endpoint}/v1/traces"
+        metrics_endpoint = f"{endpoint}/v1/metrics"
+        logs_endpoint = f"{endpoint}/v1/logs"
+    otlp_env: Dict[str, str] = {
+        "OTEL_EXPORTER_OTLP_PROTOCOL": protocol,
+        "OTEL_AWS_APPLICATION_SIGNALS_EXPORTER_ENDPOINT": metrics_endpoint,
+        "OTEL_EXPORTER_OTLP_ENDPOINT": endpoint,
+        "OTEL_EXPORTER_OTLP_TRACES_ENDPOINT": traces_endpoint,
+        "OTEL_EXPORTER_OTLP_METRICS_ENDPOINT": metrics_endpoint,
+        "OTEL_EXPORTER_OTLP_LOGS_ENDPOINT": logs_endpoint,
+    }
+    if compression:
+        otlp_env["OTEL_EXPORTER_OTLP_COMPRESSION"] = compression
+    return otlp_env
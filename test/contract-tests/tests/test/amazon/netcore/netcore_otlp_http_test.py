@@ -0,0 +1,16 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+from typing_extensions import override
+
+# The module is imported rather than the class, so that pytest does not collect NetCoreTest a second time here.
+from amazon.netcore import netcore_test
+
+
+class NetCoreOtlpHttpTest(netcore_test.NetCoreTest):
+    """Runs the NetCore tests with the application exporting over OTLP/HTTP, whose exporter sends chunked request
+    bodies, so that the spans and metrics of chunked exports are checked to be stored by the mock collector.
+    """
+
+    @override
+    def get_otlp_protocol(self) -> str:
+        return "http/protobuf"